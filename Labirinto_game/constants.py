@@ -12,6 +12,10 @@ FPS = 60
 ESCALA_CINZA = False  # Valor padrão, será substituído pelas configurações do usuário quando disponíveis
 SOM_LIGADO = True
 PORTA_SELECIONADA = None
+PROTOCOLO_SERIAL = "auto"  # "auto" (binário se o firmware suportar) ou "texto"
+PERFILADOR_ATIVO = False  # Painel de tempos por fase no jogo (F3 alterna) e relatório em data/perfil ao sair
+GRAVAR_SESSOES = False  # Grava as entradas de cada tentativa em data/sessoes (reproduza com reproduzir.py)
+LIMITE_MEMORIA_VOZES_MB = 24  # Falas dubladas decodificadas mantidas em memória (as menos recentes saem)
 
 # Cores e estilo
 COR_TITULO = (250, 250, 100)
@@ -41,14 +45,15 @@ QUICK_TIME_EVENTS = True
 DIALOGO_VELOCIDADE = 30  # ms/caractere, ou 0 para "instante"
 
 from utils.drawing import resize
+from utils.asset_cache import asset_cache
 
-# Fontes
+# Fontes (carregadas no primeiro uso)
 pygame.font.init()
-FONTE_TITULO = pygame.font.Font("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(100, eh_X=True))
-FONTE_BOTAO = pygame.font.Font("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(50, eh_X=True))
-FONTE_BOTAO_REDUZIDA = pygame.font.Font("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(45, eh_X=True))
-FONTE_BARRA = pygame.font.Font("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(30, eh_X=True))
-FONTE_TEXTO = pygame.font.Font("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(40, eh_X=True))
+FONTE_TITULO = asset_cache.fonte_preguicosa("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(100, eh_X=True))
+FONTE_BOTAO = asset_cache.fonte_preguicosa("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(50, eh_X=True))
+FONTE_BOTAO_REDUZIDA = asset_cache.fonte_preguicosa("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(45, eh_X=True))
+FONTE_BARRA = asset_cache.fonte_preguicosa("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(30, eh_X=True))
+FONTE_TEXTO = asset_cache.fonte_preguicosa("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(40, eh_X=True))
 
 # Cores padrão
 BRANCO = (255, 255, 255)
@@ -67,25 +72,25 @@ DIALOGO_PATH = IMAGES_PATH + "backgrounds/fundo_dialogo.png"
 DIALOGO_DENTRO_PATH = IMAGES_PATH + "backgrounds/fundo_dialogo_labirinto_dark.png"
 SOUND_PATH = "Labirinto_game/assets/sounds"
 USUARIOS_JSON = "Labirinto_game/data/usuarios.json"
-
-# Carregamento de imagens
-if os.path.exists(BACKGROUND_PATH):
-    background_img = pygame.image.load(BACKGROUND_PATH)
-    background_img = pygame.transform.scale(background_img, (LARGURA_TELA, ALTURA_TELA))
-else:
-    background_img = None
-
-if os.path.exists(DIALOGO_PATH):
-    dialogo_img = pygame.image.load(DIALOGO_PATH)
-    dialogo_img = pygame.transform.scale(dialogo_img, (LARGURA_TELA, ALTURA_TELA))
-else:
-    dialogo_img = None
-    
-if os.path.exists(DIALOGO_DENTRO_PATH):
-    dialogo_dentro_img = pygame.image.load(DIALOGO_DENTRO_PATH)
-    dialogo_dentro_img = pygame.transform.scale(dialogo_dentro_img, (LARGURA_TELA, ALTURA_TELA))
-else:
-    dialogo_dentro_img = None
+USUARIOS_DB = "Labirinto_game/data/usuarios.db"
+SESSOES_PATH = "Labirinto_game/data/sessoes"
+CACHE_IMAGENS_PATH = "Labirinto_game/data/cache_imagens"  # Imagens já redimensionadas para a resolução da tela
+
+asset_cache.configurar_disco(CACHE_IMAGENS_PATH)
+
+# Imagens de tela cheia (caminho -> superfície ou None): carregadas no primeiro desenho, já com a janela criada
+_imagens_tela_cheia = {}
+
+def imagem_tela_cheia(caminho):
+    """Imagem do tamanho da tela, carregada na primeira chamada (feita na hora de desenhar); None se faltar o arquivo."""
+    if caminho not in _imagens_tela_cheia:
+        try:
+            imagem = asset_cache.carregar_imagem(caminho, (LARGURA_TELA, ALTURA_TELA), modo=None)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Erro ao carregar imagem de fundo {caminho}: {e}")
+            imagem = None
+        _imagens_tela_cheia[caminho] = imagem
+    return _imagens_tela_cheia[caminho]
 
 # --- QTE Settings ---
 QTE_CHANCE = 0.25  
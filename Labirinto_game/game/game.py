@@ -1,37 +1,118 @@
 import pygame
 import sys
 import os
-import time
-import random
 import math
 from datetime import datetime
 from constants import (
-    BUTTON_PATH, FONTE_BOTAO, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img,
-    FONTE_TEXTO, COR_TEXTO, PORTA_SELECIONADA, SOUND_PATH, dialogo_dentro_img,
+    BUTTON_PATH, FONTE_BOTAO, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, imagem_tela_cheia,
+    FONTE_TEXTO, COR_TEXTO, PORTA_SELECIONADA, SOUND_PATH, DIALOGO_DENTRO_PATH,
     NUM_VIDAS, MODO_PRATICA, SERVO_VELOCIDADE, DEBOUNCE_COLISAO_MS, FEEDBACK_CANAL,
     FEEDBACK_INTENSIDADE, REDUZIR_FLASHES, QUICK_TIME_EVENTS, ESCALA_CINZA, SOM_LIGADO, DIALOGO_VELOCIDADE,
-    QTE_CHANCE, QTE_TIMEOUT, QTE_SEQ_MIN, QTE_SEQ_MAX, QTE_INTERVALO_MIN
+    QTE_CHANCE, QTE_TIMEOUT, QTE_SEQ_MIN, QTE_SEQ_MAX, QTE_INTERVALO_MIN, SESSOES_PATH
 )
 from utils.drawing import aplicar_filtro_cinza_superficie, desenhar_texto, desenhar_botao, resize, TransitionEffect
+from utils.asset_cache import asset_cache
+from utils.renderizador import RenderizadorCamadas
+from utils.perfilador import perfilador
+from utils.serial_io import obter_leitor, obter_escritor, instante_para_relogio
+from utils.simulador_serial import obter_simulador
 from utils.colors import cor_com_escala_cinza
 from utils.user_data import carregar_usuarios, salvar_usuarios, get_acessibilidade
+from utils.estatisticas import obter_estatisticas
 from screens.game_over import tela_falhou
 from screens.level_complete import tela_conclusao_nivel
 from screens.game_complete import tela_conclusao
-from utils.dialog_manager import GerenciadorDialogos
+from utils.dialog_manager import GerenciadorDialogos, precarregar_dialogos
 from utils.achievements import SistemaConquistas
 from utils.qte_manager import QTEManager
 from utils.servo_animation import AnimacaoServos
+from utils.sessao import SessaoJogo
+
+# Estados de JogoLabirinto.loop_principal
+ESTADO_DIALOGO = "dialogo"                      # Diálogo de abertura da fase
+ESTADO_AGUARDANDO_INICIO = "aguardando_inicio"  # Esperando o anel no sensor de início
+ESTADO_JOGANDO = "jogando"                      # Cronômetro correndo
+ESTADO_NIVEL_FALHOU = "nivel_falhou"            # Vidas esgotadas: salva e mostra a tela de falha
+ESTADO_NIVEL_CONCLUIDO = "nivel_concluido"      # Sensor de fim: salva e mostra a tela de conclusão
+ESTADO_ENCERRADO = "encerrado"                  # Volta ao menu
+
+# Nomes dos arquivos de imagem de fundo para cada nível
+ARQUIVOS_FUNDO_NIVEIS = {
+    1: "initial_labyrinth.png",
+    2: "winding_corridors.png",
+    3: "path_of_shadows.png",
+    4: "minotaurs_garden.png",
+    5: "secret_passage.png",
+    6: "echo_cavern.png",
+    7: "hall_of_heroes.png",
+    8: "final_confrontation.png"
+}
+
+# Elementos temáticos de cada nível (o primeiro à esquerda, o segundo à direita)
+ELEMENTOS_TEMATICOS_NIVEIS = {
+    1: ["column_greek.png", "greek_vase.png"],
+    2: ["statue_small.png", "torch.png"],
+    3: ["spider_web.png", "skull.png"],
+    4: ["plant_vine.png", "fountain.png"],
+    5: ["old_key.png", "ancient_rune.png"],
+    6: ["stalactite.png", "crystal_blue.png"],
+    7: ["shield_gold.png", "sword_bronze.png"],
+    8: ["minotaur_shadow.png", "broken_chain.png"]
+}
+
+# Ícones carregados em carregar_icones_powerup e carregar_icones_audio
+ICONES_POWERUP = ("powerup_vida.png", "powerup_freeze.png", "powerup_time.png")
+ICONES_AUDIO = ("sound_on.png", "sound_off.png")
+ARQUIVO_DIALOGOS_FASES = "Labirinto_game/data/dialogos_fases.json"
+
+
+def carregar_elemento_tematico(caminho):
+    """Carrega um elemento temático redimensionado para 100 px de largura, mantendo a proporção."""
+    largura_original, altura_original = asset_cache.dimensoes_imagem(caminho)
+    largura = resize(100, eh_X=True)
+    altura = int(largura * altura_original / largura_original)
+    return asset_cache.carregar_imagem(caminho, (largura, altura))
+
+
+def precarregar_assets_jogo(precarregador):
+    """
+    Agenda no pré-carregador as imagens que JogoLabirinto carrega ao ser criado (fundos, elementos
+    temáticos, ícones) e as dos diálogos das fases, com os mesmos tamanhos usados pelo jogo.
+    """
+    for arquivo in ARQUIVOS_FUNDO_NIVEIS.values():
+        precarregador.agendar_imagem(f"Labirinto_game/assets/images/backgrounds/{arquivo}", (LARGURA_TELA, ALTURA_TELA), modo="opaco")
+    for elementos in ELEMENTOS_TEMATICOS_NIVEIS.values():
+        for elem in elementos:
+            caminho = f"Labirinto_game/assets/images/theme_elements/{elem}"
+            if os.path.exists(caminho):
+                precarregador.agendar(carregar_elemento_tematico, caminho)
+    for icone in ICONES_POWERUP:
+        precarregador.agendar_imagem(f"Labirinto_game/assets/images/icons/{icone}", (resize(64), resize(64)))
+    for icone in ICONES_AUDIO:
+        precarregador.agendar_imagem(f"{SOUND_PATH}/icons/{icone}", (resize(40), resize(40)))
+    precarregar_dialogos(precarregador, ARQUIVO_DIALOGOS_FASES)
 
 class JogoLabirinto:
     """Classe principal do jogo que gerencia o estado e a lógica do jogo."""
     
-    def __init__(self, tela, usuario, nivel_inicial=None, sistema_conquistas=None, conexao_serial=None):
+    def __init__(self, tela, usuario, nivel_inicial=None, sistema_conquistas=None, conexao_serial=None, sessao=None):
         self.tela = tela
         self.usuario = usuario
         self.clock = pygame.time.Clock()
+        # Tempo, sorteios e entradas vêm da sessão, que pode gravar a partida ou reproduzir uma gravação
+        import constants
+        if sessao is None:
+            sessao = SessaoJogo(SESSOES_PATH if constants.GRAVAR_SESSOES else None)
+        self.sessao = sessao
+        self.relogio = sessao.agora
+        self.aleatorio = sessao.aleatorio
+        from utils.audio_manager import audio_manager
+        audio_manager.aleatorio = sessao.aleatorio_audio
         self.fonte = FONTE_TEXTO
-        self.conexao_serial = conexao_serial
+        # Sem Arduino, o jogo conversa com o simulador do firmware em vez de fingir o progresso
+        self.conexao_serial = conexao_serial if conexao_serial is not None else obter_simulador()
+        # Comandos para o Arduino são enfileirados e enviados em lote, uma vez por quadro, por uma thread dedicada
+        self.escritor_serial = obter_escritor(self.conexao_serial)
         
         # Carregar opções de acessibilidade do usuário
         self.usuarios_data = carregar_usuarios()
@@ -63,10 +144,16 @@ class JogoLabirinto:
         self.sistema_conquistas.carregar_conquistas_usuario(usuario)
         self.colisoes = 0 
 
-        # Configurações para comunicação serial
-        self.buffer_serial = ""
-        self.ultima_verificacao = time.time()
-        self.intervalo_verificacao = 0.05  # 50ms entre leituras
+        # Configurações para comunicação serial: a leitura acontece em uma thread dedicada
+        self.leitor_serial = obter_leitor(self.conexao_serial)
+        self.instante_conclusao = None  # Instante em que o hardware sinalizou o fim do nível
+        # Instante do millis() do Arduino no início do nível e tempo do nível medido pelo hardware
+        self.inicio_mcu = None
+        self.duracao_hardware = None
+        self.tempo_bonus = 0.0  # Segundos descontados por power-ups
+        # PINGs periódicos mantêm o estimador de relógio do Arduino alimentado durante o nível
+        self.proximo_ping = 0
+        self.intervalo_ping = 1.0
         
         if nivel_inicial is not None:
             self.nivel_atual = nivel_inicial
@@ -74,7 +161,8 @@ class JogoLabirinto:
             self.nivel_atual = self.usuarios_data[usuario]["nivel"]
             
         # Inicializa o animador de servos com a preferência do usuário
-        self.animacao_servos = AnimacaoServos(self.nivel_atual, servo_velocidade=self.opcoes.get("SERVO_VELOCIDADE", SERVO_VELOCIDADE))
+        self.animacao_servos = AnimacaoServos(self.nivel_atual, servo_velocidade=self.opcoes.get("SERVO_VELOCIDADE", SERVO_VELOCIDADE),
+                                              relogio=self.relogio)
 
         # Obter melhor tempo do jogador para este nível
         self.melhor_tempo = self.obter_melhor_tempo()
@@ -92,16 +180,7 @@ class JogoLabirinto:
         }
         
         # Nomes dos arquivos de imagem de fundo para cada nível
-        self.background_files = {
-            1: "initial_labyrinth.png",
-            2: "winding_corridors.png",
-            3: "path_of_shadows.png",
-            4: "minotaurs_garden.png",
-            5: "secret_passage.png",
-            6: "echo_cavern.png",
-            7: "hall_of_heroes.png",
-            8: "final_confrontation.png"
-        }
+        self.background_files = ARQUIVOS_FUNDO_NIVEIS
         
         # Dicionário para armazenar as imagens de fundo carregadas
         self.background_images = {}
@@ -115,7 +194,7 @@ class JogoLabirinto:
         # Criação do gerenciador de diálogos - agora com acesso às imagens de fundo
         self.gerenciador_dialogos = GerenciadorDialogos(
             tela, 
-            "Labirinto_game/data/dialogos_fases.json",
+            ARQUIVO_DIALOGOS_FASES,
             background_images=self.background_images  # Passamos as imagens de fundo carregadas
         )
 
@@ -136,9 +215,8 @@ class JogoLabirinto:
 
         #self.inicio_tempo = time.time()
         self.inicio_tempo = 0 
-        self.jogo_ativo = True
 
-        self.esperando_inicio = True if self.conexao_serial else False # Flag para aguardar o sinal do sensor de início
+        self.estado = ESTADO_AGUARDANDO_INICIO # Estado da máquina de estados de loop_principal
         self.nivel_concluido_hardware = False # Flag para sinal de conclusão do Arduino
         
         # Para transições mais suaves
@@ -151,20 +229,21 @@ class JogoLabirinto:
         
         # Para indicadores de conquistas próximas
         self.conquistas_proximas = self.verificar_conquistas_proximas()
+        self._painel_conquistas = None  # (conquistas_proximas, camadas pré-renderizadas), ver _criar_painel_conquistas
         
-        # Enviar nível atual para o Arduino se necessário
-        if self.conexao_serial:
-            self.enviar_nivel_arduino()
+        # Enviar nível atual para o Arduino (ou para o simulador)
+        self.enviar_nivel_arduino()
             
         # Para sistema de QTE
-        self.qte_manager = QTEManager(QTE_TIMEOUT, QTE_SEQ_MIN, QTE_SEQ_MAX, conexao_serial=self.conexao_serial)
+        self.qte_manager = QTEManager(QTE_TIMEOUT, QTE_SEQ_MIN, QTE_SEQ_MAX, escritor_serial=self.escritor_serial,
+                                      relogio=self.relogio, aleatorio=self.aleatorio)
         # Inicializa o último QTE para evitar que apareça imediatamente no início do jogo
-        self.ultimo_qte = time.time()  # Alterado: Não subtrai o intervalo mínimo
+        self.ultimo_qte = self.relogio()  # Alterado: Não subtrai o intervalo mínimo
         self.qte_ativado = False
         self.qte_stats = {"qte_sucesso": 0, "qte_falhas": 0}
         self.servo_congelado = False
         self.tempo_servo_congelado = 0
-        self.proximo_check_qte = time.time() + QTE_INTERVALO_MIN  # Tempo para o próximo sorteio de QTE
+        self.proximo_check_qte = self.relogio() + QTE_INTERVALO_MIN  # Tempo para o próximo sorteio de QTE
         
         self.qte_input_queue = [] # Fila para os inputs do QTE vindos do Arduino
         # Popup de Power-up QTE
@@ -176,6 +255,14 @@ class JogoLabirinto:
         self.popup_powerup_duracao = 3.0  # Segundos
         self.popup_powerup_fade_duracao = 0.5 # Segundos para fade in/out
         self.carregar_icones_powerup()
+
+        # Renderizador com camada estática por nível e atualização apenas das áreas alteradas
+        self.renderizador = RenderizadorCamadas(tela)
+
+        # Instrumentação por fase do quadro (F3 liga/desliga durante o jogo)
+        import constants
+        if constants.PERFILADOR_ATIVO and not perfilador.ativo:
+            perfilador.alternar()
         
     def aplicar_opcoes_acessibilidade(self):
         # Número de vidas
@@ -217,57 +304,56 @@ class JogoLabirinto:
         self.flash_duracao = 0 if self.reduzir_flashes else 0.3
 
         # Enviar velocidade do servo para Arduino se necessário
-        if self.conexao_serial:
-            try:
-                # Envia todas as configurações de uma vez
-                self.conexao_serial.write(f"SERVO:{self.servo_velocidade}\n".encode())
-                self.conexao_serial.write(f"DEBOUNCE:{self.debounce_colisao_ms}\n".encode())
-                self.conexao_serial.write(f"FEEDBACK:{self.feedback_canal}\n".encode())
-            except Exception as e:
-                print(f"Erro ao enviar configurações para o Arduino: {e}")
+        # Envia todas as configurações de uma vez (valores repetidos são descartados pelo escritor)
+        self.enviar_comandos(f"SERVO:{self.servo_velocidade}",
+                             f"DEBOUNCE:{self.debounce_colisao_ms}",
+                             f"FEEDBACK:{self.feedback_canal}")
+        self.despachar_comandos()
+
+    def enviar_comandos(self, *comandos):
+        """Enfileira comandos para o Arduino; são enviados juntos no próximo despacho."""
+        for comando in comandos:
+            self.escritor_serial.enviar(comando)
+
+    def despachar_comandos(self):
+        """Entrega os comandos pendentes para a thread de escrita serial."""
+        self.escritor_serial.despachar()
 
     def carregar_icones_powerup(self):
         """Carrega os ícones para os power-ups."""
         icon_size = resize(64)
         try:
-            self.icone_powerup_vida = pygame.image.load("Labirinto_game/assets/images/icons/powerup_vida.png").convert_alpha()
-            self.icone_powerup_vida = pygame.transform.scale(self.icone_powerup_vida, (icon_size, icon_size))
+            self.icone_powerup_vida = asset_cache.carregar_imagem("Labirinto_game/assets/images/icons/powerup_vida.png", (icon_size, icon_size))
         except Exception as e:
             print(f"Erro ao carregar icone_powerup_vida: {e}")
             self.icone_powerup_vida = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
             pygame.draw.circle(self.icone_powerup_vida, (255,0,0), (icon_size//2, icon_size//2), icon_size//2 - 2)
-            desenhar_texto("+", pygame.font.SysFont("Arial", resize(40), bold=True), (255,255,255), self.icone_powerup_vida, icon_size//2, icon_size//2, center=True)
+            desenhar_texto("+", asset_cache.carregar_sysfont("Arial", resize(40), negrito=True), (255,255,255), self.icone_powerup_vida, icon_size//2, icon_size//2, center=True)
 
 
         try:
-            self.icone_powerup_congelar = pygame.image.load("Labirinto_game/assets/images/icons/powerup_freeze.png").convert_alpha()
-            self.icone_powerup_congelar = pygame.transform.scale(self.icone_powerup_congelar, (icon_size, icon_size))
+            self.icone_powerup_congelar = asset_cache.carregar_imagem("Labirinto_game/assets/images/icons/powerup_freeze.png", (icon_size, icon_size))
         except Exception as e:
             print(f"Erro ao carregar icone_powerup_congelar: {e}")
             self.icone_powerup_congelar = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
             pygame.draw.rect(self.icone_powerup_congelar, (0,200,255), (0,0,icon_size,icon_size), border_radius=5)
-            desenhar_texto("❄", pygame.font.SysFont("Arial", resize(40), bold=True), (255,255,255), self.icone_powerup_congelar, icon_size//2, icon_size//2, center=True)
+            desenhar_texto("❄", asset_cache.carregar_sysfont("Arial", resize(40), negrito=True), (255,255,255), self.icone_powerup_congelar, icon_size//2, icon_size//2, center=True)
 
         try:
-            self.icone_powerup_tempo = pygame.image.load("Labirinto_game/assets/images/icons/powerup_time.png").convert_alpha()
-            self.icone_powerup_tempo = pygame.transform.scale(self.icone_powerup_tempo, (icon_size, icon_size))
+            self.icone_powerup_tempo = asset_cache.carregar_imagem("Labirinto_game/assets/images/icons/powerup_time.png", (icon_size, icon_size))
         except Exception as e:
             print(f"Erro ao carregar icone_powerup_tempo: {e}")
             self.icone_powerup_tempo = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
             pygame.draw.circle(self.icone_powerup_tempo, (255,215,0), (icon_size//2, icon_size//2), icon_size//2 - 2)
-            desenhar_texto("⏱", pygame.font.SysFont("Arial", resize(35), bold=True), (0,0,0), self.icone_powerup_tempo, icon_size//2, icon_size//2, center=True)
+            desenhar_texto("⏱", asset_cache.carregar_sysfont("Arial", resize(35), negrito=True), (0,0,0), self.icone_powerup_tempo, icon_size//2, icon_size//2, center=True)
 
 
     def carregar_icones_audio(self):
         """Carrega os ícones de controle de áudio"""
         try:
-            self.icone_som_ligado = pygame.image.load(f"{SOUND_PATH}/icons/sound_on.png").convert_alpha()
-            self.icone_som_desligado = pygame.image.load(f"{SOUND_PATH}/icons/sound_off.png").convert_alpha()
-            
-            # Redimensionar ícones
             tamanho = resize(40)
-            self.icone_som_ligado = pygame.transform.scale(self.icone_som_ligado, (tamanho, tamanho))
-            self.icone_som_desligado = pygame.transform.scale(self.icone_som_desligado, (tamanho, tamanho))
+            self.icone_som_ligado = asset_cache.carregar_imagem(f"{SOUND_PATH}/icons/sound_on.png", (tamanho, tamanho))
+            self.icone_som_desligado = asset_cache.carregar_imagem(f"{SOUND_PATH}/icons/sound_off.png", (tamanho, tamanho))
         except Exception as e:
             print(f"Erro ao carregar ícones de áudio: {e}")
             # Criar ícones de fallback
@@ -302,31 +388,15 @@ class JogoLabirinto:
         self.elementos_tematicos = {}
         
         try:
-            # Define os caminhos para os elementos de cada nível
-            elementos_niveis = {
-                1: ["column_greek.png", "greek_vase.png"],
-                2: ["statue_small.png", "torch.png"],
-                3: ["spider_web.png", "skull.png"],
-                4: ["plant_vine.png", "fountain.png"],
-                5: ["old_key.png", "ancient_rune.png"],
-                6: ["stalactite.png", "crystal_blue.png"],
-                7: ["shield_gold.png", "sword_bronze.png"],
-                8: ["minotaur_shadow.png", "broken_chain.png"]
-            }
-            
             # Para cada nível, carrega os elementos e define suas posições
-            for nivel, elementos in elementos_niveis.items():
+            for nivel, elementos in ELEMENTOS_TEMATICOS_NIVEIS.items():
                 self.elementos_tematicos[nivel] = []
                 
                 for i, elem in enumerate(elementos):
                     try:
                         caminho = f"Labirinto_game/assets/images/theme_elements/{elem}"
-                        imagem = pygame.image.load(caminho).convert_alpha()
-                        
-                        # Redimensiona a imagem
-                        largura = resize(100, eh_X=True)
-                        altura = int(largura * imagem.get_height() / imagem.get_width())
-                        imagem = pygame.transform.scale(imagem, (largura, altura))
+                        imagem = carregar_elemento_tematico(caminho)
+                        largura, altura = imagem.get_size()
                         
                         # Define uma posição para o elemento (personalizar conforme necessário)
                         if i == 0:
@@ -347,10 +417,8 @@ class JogoLabirinto:
             for nivel, arquivo in self.background_files.items():
                 caminho = f"Labirinto_game/assets/images/backgrounds/{arquivo}"
                 try:
-                    imagem = pygame.image.load(caminho).convert()
-                    
                     # Redimensiona para caber na tela
-                    imagem = pygame.transform.scale(imagem, (LARGURA_TELA, ALTURA_TELA))
+                    imagem = asset_cache.carregar_imagem(caminho, (LARGURA_TELA, ALTURA_TELA), modo="opaco")
                     
                     self.background_images[nivel] = imagem
                     print(f"Imagem de fundo carregada para nível {nivel}: {arquivo}")
@@ -362,167 +430,46 @@ class JogoLabirinto:
 
     def obter_melhor_tempo(self):
         """Obtém o melhor tempo do jogador para o nível atual"""
+        # Melhor tempo entre as tentativas bem-sucedidas do nível atual (None se não houver)
+        return self.obter_estatisticas().melhor_tempo_nivel.get(self.nivel_atual)
+
+    def obter_estatisticas(self):
+        """Estatísticas agregadas das tentativas do jogador (atualizadas só com as tentativas novas)."""
         tentativas = self.usuarios_data.get(self.usuario, {}).get("tentativas", [])
-        # Filtra tentativas bem-sucedidas do nível atual
-        tentativas_nivel = [t for t in tentativas if t.get("nivel") == self.nivel_atual and t.get("vidas", 0) > 0]
-        
-        if tentativas_nivel:
-            # Retorna o melhor tempo
-            return min(t.get("tempo", float('inf')) for t in tentativas_nivel)
-        return None
+        return obter_estatisticas(self.usuario, tentativas)
 
     def verificar_conquistas_proximas(self):
         """Verifica quais conquistas estão próximas de serem desbloqueadas"""
-        conquistas_proximas = []
-        
-        # Lista de tentativas do usuário
-        tentativas = self.usuarios_data.get(self.usuario, {}).get("tentativas", [])
-        
-        # Verificar progresso para "Mestre dos Botões"
-        if not self.sistema_conquistas.conquistas['mestre_dos_botoes']['desbloqueada']:
-            qtes_acertados = self.usuarios_data.get(self.usuario, {}).get("qtes_acertados", 0)
-            meta_qte = 10  # Meta para desbloquear a conquista
-            
-            if qtes_acertados > 0:  # Se já tem pelo menos 1 QTE acertado
-                conquistas_proximas.append({
-                    'chave': 'mestre_dos_botoes',
-                    'nome': self.sistema_conquistas.conquistas.get('mestre_dos_botoes', {}).get('nome', 'Mestre dos Botões'),
-                    'progresso': min(1.0, qtes_acertados / meta_qte),
-                    'meta': meta_qte,
-                    'atual': qtes_acertados
-                })
-
-        if not self.sistema_conquistas.conquistas['pegadas_de_bronze']['desbloqueada']:
-            total_jogos = len(tentativas)
-            if total_jogos >= 25:  # Reduzido para 25 (50% de 50)
-                conquistas_proximas.append({
-                    'chave': 'pegadas_de_bronze',
-                    'nome': self.sistema_conquistas.conquistas['pegadas_de_bronze']['nome'],
-                    'progresso': min(1.0, total_jogos / 50),
-                    'meta': 50,
-                    'atual': total_jogos
-                })
-        
-
-        if not self.sistema_conquistas.conquistas['domador_do_labirinto']['desbloqueada']:
-            niveis_completados = set(t.get('nivel') for t in tentativas if t.get('vidas', 0) > 0)
-            if len(niveis_completados) >= 3:
-                conquistas_proximas.append({
-                    'chave': 'domador_do_labirinto',
-                    'nome': self.sistema_conquistas.conquistas['domador_do_labirinto']['nome'],
-                    'progresso': min(1.0, len(niveis_completados) / 5),
-                    'meta': 5,
-                    'atual': len(niveis_completados)
-                })
-                
-
-        if not self.sistema_conquistas.conquistas['renascido']['desbloqueada']:
-            nivel_atual = self.nivel_atual
-            tentativas_nivel = [t for t in tentativas if t.get('nivel') == nivel_atual]
-            if len(tentativas_nivel) >= 3:  # Reduzido para 3 (43% de 7)
-                conquistas_proximas.append({
-                    'chave': 'renascido',
-                    'nome': self.sistema_conquistas.conquistas['renascido']['nome'],
-                    'progresso': min(1.0, len(tentativas_nivel) / 7),
-                    'meta': 7,
-                    'atual': len(tentativas_nivel)
-                })
-        
-
-        if not self.sistema_conquistas.conquistas['heroi_de_atenas']['desbloqueada']:
-            niveis_completados = set(t.get('nivel') for t in tentativas if t.get('vidas', 0) > 0)
-            total_niveis = 8  
-            if len(niveis_completados) >= 7:  
-                conquistas_proximas.append({
-                    'chave': 'heroi_de_atenas',
-                    'nome': self.sistema_conquistas.conquistas['heroi_de_atenas']['nome'],
-                    'progresso': min(1.0, len(niveis_completados) / total_niveis),
-                    'meta': total_niveis,
-                    'atual': len(niveis_completados)
-                })
-        
-
-        if not self.sistema_conquistas.conquistas['velocista_olimpico']['desbloqueada']:
-
-            tentativas_sucesso = [t for t in tentativas if t.get('vidas', 0) > 0]
-            if tentativas_sucesso:
-                # Encontrar o melhor tempo
-                melhor_tempo = min(t.get('tempo', float('inf')) for t in tentativas_sucesso)
-                # Se o melhor tempo está abaixo de 15s, está próximo (mas acima de 10s)
-                if 10 < melhor_tempo < 15:
-                    # O progresso é inversamente proporcional ao tempo
-                    # 15s = 0% progresso, 10s = 100% progresso
-                    progresso = (15 - melhor_tempo) / 5
-                    conquistas_proximas.append({
-                        'chave': 'velocista_olimpico',
-                        'nome': self.sistema_conquistas.conquistas['velocista_olimpico']['nome'],
-                        'progresso': progresso,
-                        'meta': "10s",
-                        'atual': f"{melhor_tempo:.1f}s"
-                    })
-        
-
-        if not self.sistema_conquistas.conquistas['coragem_de_teseu']['desbloqueada']:
-            # Procurar tentativas onde o jogador completou perdendo apenas 1 vida
-            tentativas_quase_perfeitas = [
-                t for t in tentativas 
-                if t.get('vidas', 0) == 2  
-            ]
-            if tentativas_quase_perfeitas:
-                # Se tem pelo menos uma tentativa quase perfeita
-                conquistas_proximas.append({
-                    'chave': 'coragem_de_teseu',
-                    'nome': self.sistema_conquistas.conquistas['coragem_de_teseu']['nome'],
-                    'progresso': 0.7,
-                    'meta': "3 vidas",
-                    'atual': "2 vidas"
-                })
-        
-        if not self.sistema_conquistas.conquistas['despertar_da_furia']['desbloqueada']:
-            # Ver quantas vezes o jogador completou níveis perdendo 1 vida
-            tentativas_perdendo_uma = [
-                t for t in tentativas 
-                if t.get('vidas', 0) == 2  # Completou com 2 vidas (perdeu 1)
-            ]
-            if tentativas_perdendo_uma:
-                conquistas_proximas.append({
-                    'chave': 'despertar_da_furia',
-                    'nome': self.sistema_conquistas.conquistas['despertar_da_furia']['nome'],
-                    'progresso': 0.5,
-                    'meta': "Perder 2 vidas",
-                    'atual': "Perdeu 1 vida"
-                })
-        
-        # Ordenar conquistas pelo progresso (maiores progressos primeiro)
-        conquistas_proximas.sort(key=lambda c: c['progresso'], reverse=True)
-        
-        return conquistas_proximas[:3]  # Retorna as 3 mais próximas para dar mais variedade
+        # Usa as mesmas regras do desbloqueio (SistemaConquistas.avaliar_regras)
+        dados = {
+            'nivel_atual': self.nivel_atual,
+            'qtes_acertados': self.usuarios_data.get(self.usuario, {}).get("qtes_acertados", 0),
+        }
+        # Retorna as 3 mais próximas para dar mais variedade
+        return self.sistema_conquistas.conquistas_proximas(self.usuario, self.obter_estatisticas(), dados, limite=3)
 
     def enviar_nivel_arduino(self):
         """Envia o nível atual para o Arduino."""
-        try:
-            # Formato da mensagem: "NIVEL:X\n" onde X é o número do nível
-            mensagem = f"NIVEL:{self.nivel_atual}\n".encode()
-            self.conexao_serial.write(mensagem)
-            self.conexao_serial.flush()
-            print(f"Enviado nível {self.nivel_atual} para o Arduino")
-        except Exception as e:
-            print(f"Erro ao enviar nível para Arduino: {e}")
+        # Formato da mensagem: "NIVEL:X\n" onde X é o número do nível
+        self.enviar_comandos(f"NIVEL:{self.nivel_atual}")
+        self.despachar_comandos()
+        print(f"Enviado nível {self.nivel_atual} para o Arduino")
+
+    @property
+    def esperando_inicio(self):
+        """Indica se o jogo aguarda o sinal do sensor de início."""
+        return self.estado == ESTADO_AGUARDANDO_INICIO
 
     def atualizar_labirinto(self):
         """Atualiza o estado do labirinto."""
         # Verificar e atualizar estado do servo congelado
-        if self.servo_congelado and time.time() > self.tempo_servo_congelado:
+        if self.servo_congelado and self.relogio() > self.tempo_servo_congelado:
             self.servo_congelado = False
-            if self.conexao_serial:
-                try:
-                    self.conexao_serial.write(b"FREEZE:0\n") # Envia o comando para descongelar
-                    print("Comando para descongelar servos enviado.")
-                except Exception as e:
-                    print(f"Erro ao desativar congelamento: {e}")
+            self.enviar_comandos("FREEZE:0") # Envia o comando para descongelar
         
         # Atualizar QTE
-        self.qte_manager.atualizar(1/FPS)
+        with perfilador.fase("qte"):
+            self.qte_manager.atualizar(1/FPS)
         
         # Se o QTE foi concluído (sucesso ou falha), resetar
         if self.qte_manager.concluido:
@@ -533,7 +480,7 @@ class JogoLabirinto:
 
         
         # Verificar se deve iniciar um novo QTE - apenas uma vez por intervalo
-        tempo_atual = time.time()
+        tempo_atual = self.relogio()
         
         # Realiza o sorteio apenas quando chegar o momento do próximo check
         if (self.quick_time_events and           # Se QTEs estão ativados nas configurações
@@ -542,7 +489,7 @@ class JogoLabirinto:
             not self.esperando_inicio):  # Se chegou o momento do próximo check
             
             # Faz um único sorteio por intervalo
-            chance_atual = random.random() 
+            chance_atual = self.aleatorio.random() 
             print(f"Check de QTE: {chance_atual:.4f} (limite: {QTE_CHANCE})")
             
             if chance_atual < QTE_CHANCE:
@@ -550,83 +497,73 @@ class JogoLabirinto:
                 sequencia_qte = self.qte_manager.iniciar()
                 self.ultimo_qte = tempo_atual
 
-                if self.conexao_serial and sequencia_qte:
-                    try:
-                        self.conexao_serial.write(b"FREEZE:1\n") # Congela os servos para o QTE
-                        # Envia o comando para mostrar apenas a PRIMEIRA luz da sequência
-                        primeiro_passo = sequencia_qte[0]
-                        comando_qte = f"QTE_SHOW:{primeiro_passo}\n"
-                        self.conexao_serial.write(comando_qte.encode('utf-8'))
-                    except Exception as e:
-                        print(f"Erro ao iniciar sequência de QTE: {e}")
+                if sequencia_qte:
+                    # Congela os servos e mostra apenas a PRIMEIRA luz da sequência
+                    self.enviar_comandos("FREEZE:1", f"QTE_SHOW:{sequencia_qte[0]}")
             
             # Independente do resultado, agenda o próximo check para daqui a QTE_INTERVALO_MIN segundos
             self.proximo_check_qte = tempo_atual + QTE_INTERVALO_MIN
         
-        if self.conexao_serial:
+        with perfilador.fase("serial"):
+            self.sincronizar_relogio()
             self.ler_dados_serial()
-        else:
-            # Simulação quando não há comunicação com Arduino
-            self.simular_progresso()
-            
-            # Simular botões para QTE em modo de simulação
-            if self.qte_manager.ativo and not self.qte_manager.concluido and random.random() < 0.05:
-                # 50% de chance de acertar o input correto
-                if random.random() < 0.5:
-                    input_correto = self.qte_manager.sequencia[self.qte_manager.passo_atual]
-                    resultado = self.qte_manager.processar_input(input_correto)
-                    if resultado is True:
-                        self.qte_concluido_sucesso()
-                else:
-                    input_errado = "B" if self.qte_manager.sequencia[self.qte_manager.passo_atual] == "C" else "C"
-                    self.qte_manager.processar_input(input_errado)
-                    self.qte_stats["qte_falhas"] += 1
-
-    def simular_progresso(self):
-        """Simular progresso para modo de demonstração."""
-        incremento = random.uniform(0.001, 0.005)
-        self.progresso = min(1.0, self.progresso + incremento)
-        
-        # Simula colisões ocasionalmente
-        if random.random() < 0.001:
-            self.vidas -= 1
-            self.colisoes += 1
-            self.feedback_colisao()
-            
-        # Simular conclusão se alcançar progresso completo
-        if self.progresso >= 1.0:
-            # Termina o nível após 10 segundos ou quando atingir 100%
-            if (time.time() - self.inicio_tempo) > 10:
-                return True
+
+    def sincronizar_relogio(self):
+        """Envia um PING periódico; o OK de resposta traz o millis() do Arduino para o estimador de relógio."""
+        agora = self.relogio()
+        if agora >= self.proximo_ping:
+            self.enviar_comandos("PING")
+            self.proximo_ping = agora + self.intervalo_ping
 
     def ler_dados_serial(self):
-        """Lê dados da porta serial para atualizar estado do jogo."""
-        agora = time.time()
-        
-        # Verifica a cada intervalo para não sobrecarregar a CPU
-        if (agora - self.ultima_verificacao) >= self.intervalo_verificacao:
-            self.ultima_verificacao = agora
-            
-            try:
-                if self.conexao_serial and self.conexao_serial.in_waiting > 0:
-                    dados = self.conexao_serial.readline().decode('utf-8').strip()
-                    self.processar_dados_serial(dados)
-            except Exception as e:
-                print(f"Erro na leitura serial: {e}")
+        """Processa todos os eventos que a thread de leitura recebeu desde o último quadro."""
+        if self.sessao.reproduzindo:
+            # Os dados gravados já estão no relógio do jogo
+            for dados, tempo_evento, duracao_hardware in self.sessao.linhas_serial():
+                self.aplicar_dados_serial(dados, tempo_evento, duracao_hardware)
+            return
+        for chegada, dados, instante_mcu in self.leitor_serial.obter_linhas():
+            if dados == "OK":
+                continue  # Resposta ao PING, usada apenas para sincronizar os relógios
+            self.processar_dados_serial(dados, chegada, instante_mcu)
+
+    def processar_dados_serial(self, dados, chegada=None, instante_mcu=None):
+        """
+        Processa os dados recebidos do Arduino: converte o instante do evento para o relógio do jogo,
+        registra o dado na sessão (para reprodução) e o aplica ao estado do jogo.
+        - chegada: instante (time.monotonic()) em que a linha chegou à porta serial, se conhecido
+        - instante_mcu: instante do Arduino (segundos do millis()) em que o evento aconteceu, se informado
+        """
+        # Prefere o instante do próprio hardware; sem ele, usa o instante de chegada à porta serial
+        if instante_mcu is not None:
+            tempo_evento = self.leitor_serial.relogio.para_relogio(instante_mcu)
+        elif chegada is not None:
+            tempo_evento = instante_para_relogio(chegada)
+        else:
+            tempo_evento = self.relogio()
+
+        duracao_hardware = None
+        if dados == "PLAYER_AT_START" and self.esperando_inicio:
+            self.inicio_mcu = instante_mcu
+        elif dados == "LEVEL_COMPLETE" and self.inicio_mcu is not None and instante_mcu is not None:
+            # Tempo medido pelo millis() (corrigido pela deriva), sem o atraso da serial nem a variação entre quadros
+            duracao_hardware = self.leitor_serial.relogio.duracao(self.inicio_mcu, instante_mcu)
 
+        self.sessao.registrar_serial(dados, tempo_evento, duracao_hardware)
+        self.aplicar_dados_serial(dados, tempo_evento, duracao_hardware)
 
-    def processar_dados_serial(self, dados):
-        """Processa os dados recebidos do Arduino."""
+    def aplicar_dados_serial(self, dados, tempo_evento, duracao_hardware=None):
+        """Aplica ao estado do jogo um dado do Arduino já convertido para o relógio do jogo."""
         print(f"Dados recebidos do Arduino: {dados}")
         try:
             # Sinal de que o jogador está no sensor de início
             if dados == "PLAYER_AT_START":
                 if self.esperando_inicio:
-                    tempo_atual = time.time()
+                    tempo_atual = tempo_evento
                     self.inicio_tempo = tempo_atual  # Inicia o cronômetro do jogo
                     self.ultimo_qte = tempo_atual  # Inicia o contador de QTE
                     self.proximo_check_qte = tempo_atual + QTE_INTERVALO_MIN  # Agenda primeiro QTE
-                    self.esperando_inicio = False
+                    self.estado = ESTADO_JOGANDO
                     # Pausa a animação dos servos ao iniciar o jogo
                     # (opcional: pode zerar ou travar a animação, aqui não faz nada pois só desenha se esperando_inicio)
                     print("Cronômetro e timer de QTE iniciados pelo hardware!")
@@ -641,6 +578,8 @@ class JogoLabirinto:
             # Sinal de que o jogador chegou ao sensor de fim
             elif dados == "LEVEL_COMPLETE":
                 self.nivel_concluido_hardware = True
+                self.instante_conclusao = tempo_evento
+                self.duracao_hardware = duracao_hardware
 
             elif dados == "BTN_C":
                 self.qte_input_queue.append('C')
@@ -659,13 +598,13 @@ class JogoLabirinto:
         print(f"QTE concluído com sucesso! Total: {self.qte_stats['qte_sucesso']}")
         
         if self.vidas < self.num_vidas:
-            power_up = random.choice(["vida_extra", "congelar_servos", "reduzir_tempo"])
+            power_up = self.aleatorio.choice(["vida_extra", "congelar_servos", "reduzir_tempo"])
         else:
-            power_up = random.choice(["congelar_servos", "reduzir_tempo"])
+            power_up = self.aleatorio.choice(["congelar_servos", "reduzir_tempo"])
         
         self.popup_powerup_titulo = "RECOMPENSA!"
         self.popup_powerup_ativo = True
-        self.popup_powerup_inicio_tempo = time.time()
+        self.popup_powerup_inicio_tempo = self.relogio()
 
         if power_up == "vida_extra" and self.vidas < self.num_vidas:
             self.vidas += 1
@@ -677,19 +616,16 @@ class JogoLabirinto:
                 self.progresso_animacao_coracoes[indice_coracao_recuperado] = 0.0
             audio_manager.play_sound("powerup")
             audio_manager.play_voiced_dialogue("vida_extra")
+            self.prever_falas()
             self.popup_powerup_descricao = "Vida Extra!"
             self.popup_powerup_icone_atual = self.icone_powerup_vida
             
         elif power_up == "congelar_servos":
             # Congelar servos por 5 segundos
             self.servo_congelado = True
-            self.tempo_servo_congelado = time.time() + 5.0  # 5 segundos
+            self.tempo_servo_congelado = self.relogio() + 5.0  # 5 segundos
             print(f"Power-up: Servos congelados por 5 segundos!")
-            if self.conexao_serial:
-                try:
-                    self.conexao_serial.write(b"FREEZE:1\n")
-                except Exception as e:
-                    print(f"Erro ao enviar comando de congelamento: {e}")
+            self.enviar_comandos("FREEZE:1")
             audio_manager.play_sound("powerup")
             audio_manager.play_voiced_dialogue("servos_congelados")
             self.popup_powerup_descricao = "Servos Congelados!"
@@ -698,7 +634,8 @@ class JogoLabirinto:
         elif power_up == "reduzir_tempo":
             # Reduzir 10 segundos do tempo
             self.inicio_tempo += 10.0  # Adicionar 10 segundos ao início (reduz o tempo decorrido)
-            tempo_atual = time.time() - self.inicio_tempo
+            self.tempo_bonus += 10.0
+            tempo_atual = self.relogio() - self.inicio_tempo
             print(f"Power-up: Tempo reduzido em 10 segundos! Novo tempo: {tempo_atual:.1f}s")
             audio_manager.play_sound("powerup")
             audio_manager.play_voiced_dialogue("tempo_reduzido")
@@ -716,9 +653,10 @@ class JogoLabirinto:
             audio_manager.play_voiced_dialogue("colisao_1vida")
         elif self.vidas == 2: # Será 2 após esta colisão se era 3 antes
             audio_manager.play_voiced_dialogue("colisao_2vidas")
+        self.prever_falas()
         
         self.flash_ativo = True
-        self.flash_inicio = time.time()
+        self.flash_inicio = self.relogio()
 
         indice_coracao_perdido = self.vidas 
         if 0 <= indice_coracao_perdido < self.num_vidas and self.estados_coracoes[indice_coracao_perdido]:
@@ -728,12 +666,18 @@ class JogoLabirinto:
         print(f"Colisão! Progresso atual: {self.progresso:.2f}")
 
     def verifica_conclusao_nivel(self):
-        """Verifica se o nível foi concluído, agora baseado no sinal do hardware."""
-        if self.conexao_serial:
-            return self.nivel_concluido_hardware
-        else:
-            return (time.time() - self.inicio_tempo) > 10 if self.inicio_tempo > 0 else False
+        """Verifica se o nível foi concluído, agora baseado no sinal do hardware (ou do simulador)."""
+        return self.nivel_concluido_hardware
     
+    def calcular_tempo_nivel(self):
+        """
+        Tempo gasto no nível concluído. Com os instantes do Arduino, o tempo é medido pelo millis()
+        (corrigido pela deriva), sem o atraso da serial nem a variação entre quadros.
+        """
+        if self.duracao_hardware is not None:
+            return self.duracao_hardware - self.tempo_bonus
+        return (self.instante_conclusao or self.relogio()) - self.inicio_tempo
+
     def salvar_progresso(self, tempo_gasto, falhou=False):
         """Salva o progresso do jogador."""
         usuario_data = self.usuarios_data[self.usuario]
@@ -809,14 +753,18 @@ class JogoLabirinto:
         
         self.conquistas_proximas = self.verificar_conquistas_proximas()
 
-        self.esperando_inicio = True if self.conexao_serial else False # Flag para aguardar o sinal do sensor de início
+        self.estado = ESTADO_AGUARDANDO_INICIO # Aguarda o sinal do sensor de início
         self.nivel_concluido_hardware = False # Flag para sinal de conclusão do Arduino
+        self.instante_conclusao = None
+        self.inicio_mcu = None
+        self.duracao_hardware = None
+        self.tempo_bonus = 0.0
         
         # Reinicia a animação dos servos para o novo nível com a preferência do usuário
-        self.animacao_servos = AnimacaoServos(self.nivel_atual, servo_velocidade=self.opcoes.get("SERVO_VELOCIDADE", SERVO_VELOCIDADE))
+        self.animacao_servos = AnimacaoServos(self.nivel_atual, servo_velocidade=self.opcoes.get("SERVO_VELOCIDADE", SERVO_VELOCIDADE),
+                                              relogio=self.relogio)
         
-        if self.conexao_serial:
-            self.enviar_nivel_arduino()
+        self.enviar_nivel_arduino()
             
         print(f"Estado do jogo resetado.")
 
@@ -860,16 +808,20 @@ class JogoLabirinto:
         minutos = int(tempo_atual) // 60
         segundos = int(tempo_atual) % 60
         tempo_texto = f"{minutos:02d}:{segundos:02d}"
-        fonte_tempo = pygame.font.SysFont("Arial", resize(24, eh_X=True), bold=True)
+        fonte_tempo = asset_cache.carregar_sysfont("Arial", resize(24, eh_X=True), negrito=True)
         texto_surface = fonte_tempo.render(tempo_texto, True, (255, 255, 255))
         texto_rect = texto_surface.get_rect(center=self.timer_centro)
         self.tela.blit(texto_surface, texto_rect)
 
-    def desenhar_nome_nivel(self):
+        # Os marcadores ultrapassam o círculo em meia espessura
+        return rect_timer.inflate(self.timer_espessura * 2, self.timer_espessura * 2)
+
+    def desenhar_nome_nivel(self, superficie=None):
         """Desenha o nome/título do nível atual na parte superior da tela"""
+        superficie = superficie or self.tela
         nome_nivel = self.nomes_niveis.get(self.nivel_atual, f"Nível {self.nivel_atual}")
         
-        titulo_fonte = pygame.font.SysFont("Arial", resize(42, eh_X=True), bold=True)
+        titulo_fonte = asset_cache.carregar_sysfont("Arial", resize(42, eh_X=True), negrito=True)
         texto_surface = titulo_fonte.render(nome_nivel, True, (255, 255, 255))
         texto_rect = texto_surface.get_rect(center=(LARGURA_TELA // 2, resize(50)))
         
@@ -880,164 +832,131 @@ class JogoLabirinto:
         pygame.draw.rect(faixa_surface, (0, 0, 0, 150), 
                          pygame.Rect(0, 0, faixa_rect.width, faixa_rect.height),
                          border_radius=resize(15))
-        self.tela.blit(faixa_surface, faixa_rect)
+        superficie.blit(faixa_surface, faixa_rect)
         
         # Adiciona borda dourada à faixa
-        pygame.draw.rect(self.tela, cor_com_escala_cinza(255, 215, 0), 
+        pygame.draw.rect(superficie, cor_com_escala_cinza(255, 215, 0), 
                          faixa_rect, width=resize(2), border_radius=resize(15))
         
 
-        self.tela.blit(texto_surface, texto_rect)
+        superficie.blit(texto_surface, texto_rect)
         
-    def desenhar_elementos_tematicos(self):
+    def desenhar_elementos_tematicos(self, superficie=None):
         """Desenha elementos decorativos temáticos do nível atual"""
+        superficie = superficie or self.tela
         if self.nivel_atual in self.elementos_tematicos:
             for elemento, posicao in self.elementos_tematicos[self.nivel_atual]:
-                self.tela.blit(elemento, posicao)
+                superficie.blit(elemento, posicao)
+
+    def construir_camada_fundo(self):
+        """Monta a camada estática do nível atual: fundo, elementos temáticos e nome do nível."""
+        camada = pygame.Surface((LARGURA_TELA, ALTURA_TELA)).convert()
+        background_atual = self.background_images.get(self.nivel_atual)
+        
+        if background_atual:
+            # Usa a imagem de fundo específica do nível atual
+            camada.blit(background_atual, (0, 0))
+        elif imagem_tela_cheia(DIALOGO_DENTRO_PATH):
+            # Fallback para a imagem de diálogo genérica se disponível
+            camada.blit(imagem_tela_cheia(DIALOGO_DENTRO_PATH), (0, 0))
+        else:
+            # Último fallback para cor sólida
+            camada.fill(AZUL_CLARO)
+
+        self.desenhar_elementos_tematicos(camada)
+        self.desenhar_nome_nivel(camada)
+        return camada
 
     def desenhar_melhor_tempo(self):
         """Desenha informação de melhor tempo/recorde do jogador"""
         if self.melhor_tempo is not None:
             texto = f"Recorde: {self.melhor_tempo:.2f}s"
-            fonte_recorde = pygame.font.SysFont("Arial", resize(32, eh_X=True), bold=True)
+            fonte_recorde = asset_cache.carregar_sysfont("Arial", resize(32, eh_X=True), negrito=True)
             texto_surface = fonte_recorde.render(texto, True, (255, 215, 0))  # Cor dourada
             
 
             x = self.timer_centro[0] - texto_surface.get_width()//2 - resize(25, eh_X=True)
             y = self.timer_centro[1] + self.timer_raio + resize(20)
             
-            self.tela.blit(texto_surface, (x, y))
+            return self.tela.blit(texto_surface, (x, y))
+        return None
 
-    def desenhar_indicadores_conquistas(self):
-        """Desenha indicadores de conquistas próximas de serem desbloqueadas"""
-        if not self.conquistas_proximas:
-            return
-            
+    def _criar_painel_conquistas(self):
+        """
+        Pré-renderiza o painel de conquistas próximas: fundo, título, ícones, barras e textos.
+        Refeito só quando conquistas_proximas muda (no máximo uma vez por tentativa); os gradientes
+        são desenhados em uma faixa de 1 pixel e esticados, em vez de uma linha por pixel.
+        """
         x = resize(20, eh_X=True)
         y = ALTURA_TELA - resize(600)  
         largura = resize(500, eh_X=True)  
         altura_painel = resize(50)  
         espacamento = resize(15)
         
-        # Cria painel de fundo para os indicadores
+        # Painel de fundo para os indicadores
         altura_total = resize(45) + len(self.conquistas_proximas) * (altura_painel + espacamento)
         painel_rect = pygame.Rect(x - resize(10, eh_X=True), y - resize(40), largura + resize(20, eh_X=True), altura_total)
-        
 
-        painel_surf = pygame.Surface((painel_rect.width, painel_rect.height), pygame.SRCALPHA)
-        
+        # Gradiente de cor escura a cor menos escura
+        faixa = pygame.Surface((1, painel_rect.height), pygame.SRCALPHA)
         for i in range(painel_rect.height):
-            # Gradiente de cor escura a cor menos escura
-            alpha = 180  # Transparência geral do painel
             fator = i / painel_rect.height
-            r = int(30 + 10 * fator)
-            g = int(30 + 10 * fator)
-            b = int(60 + 20 * fator)
-            pygame.draw.line(painel_surf, (r, g, b, alpha), 
-                            (0, i), (painel_rect.width, i))
+            faixa.set_at((0, i), (int(30 + 10 * fator), int(30 + 10 * fator), int(60 + 20 * fator), 180))
+        painel_surf = pygame.transform.scale(faixa, painel_rect.size)
         
         pygame.draw.rect(painel_surf, (0, 0, 0, 0), 
                         pygame.Rect(0, 0, painel_rect.width, painel_rect.height), 
                         border_radius=resize(15))
-        
 
-        self.tela.blit(painel_surf, painel_rect)
-        
-        # Borda dourada para o painel
-        pygame.draw.rect(self.tela, (255, 215, 0, 150), painel_rect, 
-                        width=resize(2), border_radius=resize(15))
-        
-        # Desenha título estilizado
-        fonte_titulo = pygame.font.SysFont("Arial", resize(26, eh_X=True), bold=True)
-        titulo_texto = "Conquistas Próximas"
-        titulo_surface = fonte_titulo.render(titulo_texto, True, (255, 215, 0))
+        # Título estilizado, com um brilho sutil
+        fonte_titulo = asset_cache.carregar_sysfont("Arial", resize(26, eh_X=True), negrito=True)
+        titulo_surface = fonte_titulo.render("Conquistas Próximas", True, (255, 215, 0))
         titulo_rect = titulo_surface.get_rect(centerx=painel_rect.centerx, top=y - resize(35))
-        
-        # Adiciona um brilho sutil ao título
         brilho_surf = pygame.Surface((titulo_surface.get_width() + resize(10, eh_X=True), 
                                       titulo_surface.get_height() + resize(10)), pygame.SRCALPHA)
         brilho_rect = brilho_surf.get_rect(center=titulo_rect.center)
         pygame.draw.rect(brilho_surf, (255, 215, 0, 50), 
                          pygame.Rect(0, 0, brilho_surf.get_width(), brilho_surf.get_height()), 
                          border_radius=resize(10))
-        self.tela.blit(brilho_surf, brilho_rect)
-        self.tela.blit(titulo_surface, titulo_rect)
-        
 
-        for i, conquista in enumerate(self.conquistas_proximas):
+        # Camada do fundo: painel, borda dourada (opaca, como na tela) e título
+        area = painel_rect.union(brilho_rect)
+        fundo = pygame.Surface(area.size, pygame.SRCALPHA)
+        fundo.blit(painel_surf, painel_rect.move(-area.x, -area.y))
+        pygame.draw.rect(fundo, (255, 215, 0), painel_rect.move(-area.x, -area.y), 
+                        width=resize(2), border_radius=resize(15))
+        fundo.blit(brilho_surf, brilho_rect.move(-area.x, -area.y))
+        fundo.blit(titulo_surface, titulo_rect.move(-area.x, -area.y))
+        area_total = area.copy()  # Fundo e indicadores, para o retângulo sujo
+
+        fonte_conquista = asset_cache.carregar_sysfont("Arial", resize(16, eh_X=True), negrito=True)
+        tamanho_icone = resize(32)
+        x_barra = x + tamanho_icone + resize(15, eh_X=True)  # Aumentado o espaçamento
+        largura_barra = largura - tamanho_icone - resize(25, eh_X=True)  # Ajustado para o novo tamanho
 
+        # Uma camada por indicador (ícone, barra e textos); o fundo pulsante fica por baixo, desenhado a cada quadro
+        indicadores = []
+        for i, conquista in enumerate(self.conquistas_proximas):
             y_atual = y + i * (altura_painel + espacamento)
-            
-            # Rect para o indicador completo (inclui ícone e barra)
             indicador_rect = pygame.Rect(x, y_atual, largura, altura_painel)
-            
-            # Efeito pulsante baseado no progresso
-            pulso = math.sin(time.time() * 3) * 0.2 + 0.8
-            intensidade_pulso = int(40 * pulso * conquista['progresso'])
-            
-            # Fundo do indicador com efeito pulsante
-            fundo_cor = (50 + intensidade_pulso, 50 + intensidade_pulso, 70 + intensidade_pulso)
-            pygame.draw.rect(self.tela, fundo_cor, indicador_rect, border_radius=resize(10))
-            
-            # Carrega o ícone da conquista
+            barra_rect = pygame.Rect(x_barra, y_atual + resize(5), largura_barra, altura_painel - resize(10))
+
+            # Ícone da conquista (ou um círculo, se não conseguir carregar o ícone)
             icone = None
-            tamanho_icone = resize(32)
             chave = conquista['chave']
-            
             if chave in self.sistema_conquistas.conquistas:
                 caminho_icone = self.sistema_conquistas.conquistas[chave].get('icone')
                 if caminho_icone and os.path.exists(caminho_icone):
                     try:
-                        # Carrega e redimensiona o ícone
-                        icone_original = pygame.image.load(caminho_icone).convert_alpha()
-                        icone = pygame.transform.scale(icone_original, (tamanho_icone, tamanho_icone))
+                        icone = asset_cache.carregar_imagem(caminho_icone, (tamanho_icone, tamanho_icone))
                     except Exception as e:
                         print(f"Erro ao carregar ícone de conquista: {e}")
-            
-
             if icone:
                 icone_rect = icone.get_rect(midleft=(x + resize(5, eh_X=True), indicador_rect.centery))
-                self.tela.blit(icone, icone_rect)
             else:
-                # Círculo como fallback se não conseguir carregar o ícone
-                pygame.draw.circle(self.tela, (150, 150, 150), 
-                                  (x + resize(16, eh_X=True), indicador_rect.centery), 
-                                  tamanho_icone // 2)
-            
- 
-            x_barra = x + tamanho_icone + resize(15, eh_X=True)  # Aumentado o espaçamento
-            largura_barra = largura - tamanho_icone - resize(25, eh_X=True)  # Ajustado para o novo tamanho
-  
-            
-            pygame.draw.rect(self.tela, (30, 30, 30), 
-                            pygame.Rect(x_barra, y_atual + resize(5), largura_barra, altura_painel - resize(10)), 
-                            border_radius=resize(7))
-            
-            # Barra de progresso preenchida com gradiente
-            largura_preenchida = int(largura_barra * conquista['progresso'])
-            if largura_preenchida > 0:
-                barra_surf = pygame.Surface((largura_preenchida, altura_painel - resize(10)), pygame.SRCALPHA)
-                
-                # Cria um gradiente horizontal
-                for px in range(largura_preenchida):
-                    # Varia de azul para dourado baseado no progresso
-                    fator = px / largura_preenchida
-                    r = int(100 + fator * 155)
-                    g = int(150 + fator * 65)
-                    b = int(255 - fator * 200)
-                    pygame.draw.line(barra_surf, (r, g, b), 
-                                    (px, 0), (px, altura_painel - resize(10)))
-                
-                # Aplica a barra com cantos arredondados
-                self.tela.blit(barra_surf, (x_barra, y_atual + resize(5)))
-            
-            # Borda da barra
-            pygame.draw.rect(self.tela, (200, 200, 200), 
-                            pygame.Rect(x_barra, y_atual + resize(5), largura_barra, altura_painel - resize(10)), 
-                            width=resize(1), border_radius=resize(7))
-            
-            fonte_conquista = pygame.font.SysFont("Arial", resize(16, eh_X=True), bold=True)  
-            
+                icone_rect = pygame.Rect(0, 0, tamanho_icone, tamanho_icone)
+                icone_rect.center = (x + resize(16, eh_X=True), indicador_rect.centery)
+
             # Limitando o comprimento do texto para garantir que caiba
             nome_conquista = conquista['nome']
             if len(nome_conquista) > 15:  # Se o nome for muito longo
@@ -1050,44 +969,86 @@ class JogoLabirinto:
                 cor_texto = (255, 255, 150)  # Amarelo claro
             else:
                 cor_texto = (255, 255, 255)  # Branco
-                
             texto_surface = fonte_conquista.render(texto_conquista, True, cor_texto)
             texto_rect = texto_surface.get_rect(midleft=(x_barra + resize(10, eh_X=True), indicador_rect.centery))
-            self.tela.blit(texto_surface, texto_rect)
             
-            # Desenha a porcentagem no final da barra
-            porcentagem = f"{int(conquista['progresso']*100)}%"
-            fonte_percent = pygame.font.SysFont("Arial", resize(16, eh_X=True), bold=True)
-            percent_surf = fonte_percent.render(porcentagem, True, (255, 255, 255))
+            # Porcentagem no final da barra, sem sobrepor o título da conquista
+            percent_surf = fonte_conquista.render(f"{int(conquista['progresso']*100)}%", True, (255, 255, 255))
             percent_rect = percent_surf.get_rect(midright=(x_barra + largura_barra - resize(10, eh_X=True), 
                                                          indicador_rect.centery))
-            
-            # Garante que a porcentagem não sobreponha o título da conquista
             if percent_rect.left < texto_rect.right + resize(10, eh_X=True):
                 percent_rect.left = texto_rect.right + resize(10, eh_X=True)
-                
-            self.tela.blit(percent_surf, percent_rect)
+
+            camada_rect = indicador_rect.unionall([icone_rect, texto_rect, percent_rect])
+            camada = pygame.Surface(camada_rect.size, pygame.SRCALPHA)
+            desloc = (-camada_rect.x, -camada_rect.y)
+
+            if icone:
+                camada.blit(icone, icone_rect.move(desloc))
+            else:
+                pygame.draw.circle(camada, (150, 150, 150), icone_rect.move(desloc).center, tamanho_icone // 2)
+
+            pygame.draw.rect(camada, (30, 30, 30), barra_rect.move(desloc), border_radius=resize(7))
+            
+            # Barra de progresso preenchida com gradiente horizontal, de azul para dourado
+            largura_preenchida = int(largura_barra * conquista['progresso'])
+            if largura_preenchida > 0:
+                faixa = pygame.Surface((largura_preenchida, 1))
+                for px in range(largura_preenchida):
+                    fator = px / largura_preenchida
+                    faixa.set_at((px, 0), (int(100 + fator * 155), int(150 + fator * 65), int(255 - fator * 200)))
+                camada.blit(pygame.transform.scale(faixa, (largura_preenchida, barra_rect.height)),
+                            barra_rect.move(desloc))
+            
+            # Borda da barra
+            pygame.draw.rect(camada, (200, 200, 200), barra_rect.move(desloc), width=resize(1), border_radius=resize(7))
+            camada.blit(texto_surface, texto_rect.move(desloc))
+            camada.blit(percent_surf, percent_rect.move(desloc))
+
+            indicadores.append((indicador_rect, conquista['progresso'], camada, camada_rect))
+            area_total.union_ip(camada_rect)
+
+        return self.conquistas_proximas, fundo, area, indicadores, area_total
+
+    def desenhar_indicadores_conquistas(self):
+        """Desenha indicadores de conquistas próximas de serem desbloqueadas e retorna a área do painel"""
+        if not self.conquistas_proximas:
+            return None
+
+        if self._painel_conquistas is None or self._painel_conquistas[0] is not self.conquistas_proximas:
+            self._painel_conquistas = self._criar_painel_conquistas()
+        _, fundo, area, indicadores, area_total = self._painel_conquistas
+
+        self.tela.blit(fundo, area)
+
+        tempo = self.relogio()
+        pulso = math.sin(tempo * 3) * 0.2 + 0.8
+        for indicador_rect, progresso, camada, camada_rect in indicadores:
+            # Fundo do indicador com efeito pulsante baseado no progresso
+            intensidade_pulso = int(40 * pulso * progresso)
+            fundo_cor = (50 + intensidade_pulso, 50 + intensidade_pulso, 70 + intensidade_pulso)
+            pygame.draw.rect(self.tela, fundo_cor, indicador_rect, border_radius=resize(10))
+            self.tela.blit(camada, camada_rect)
             
             # Adiciona brilho aos indicadores próximos de completar
-            if conquista['progresso'] >= 0.9:  # Muito próximo de completar
-                tempo = time.time()
-                # Efeito de brilho pulsante
+            if progresso >= 0.9:  # Muito próximo de completar
                 intensidade = (math.sin(tempo * 4) + 1) / 2  # Varia de 0 a 1
                 brilho_cor = (255, 255, 100, int(80 * intensidade))
-                
-                # Borda brilhante
                 pygame.draw.rect(self.tela, brilho_cor, indicador_rect, 
                                 width=resize(2), border_radius=resize(10))
 
+        return area_total
+
     def desenhar_popup_powerup(self):
+        """Desenha o popup de recompensa do QTE e retorna a área ocupada (ou None)."""
         if not self.popup_powerup_ativo:
-            return
+            return None
 
-        tempo_decorrido = time.time() - self.popup_powerup_inicio_tempo
+        tempo_decorrido = self.relogio() - self.popup_powerup_inicio_tempo
         
         if tempo_decorrido > self.popup_powerup_duracao:
             self.popup_powerup_ativo = False
-            return
+            return None
 
         # Cálculo de Alpha para fade-in e fade-out
         alpha = 255
@@ -1098,7 +1059,7 @@ class JogoLabirinto:
         alpha = max(0, min(255, alpha)) # Garante que alpha esteja entre 0 e 255
 
         if alpha == 0: # Se invisível, não desenha
-            return
+            return None
 
         # Dimensões e Posição do Popup
         popup_largura = resize(450, eh_X=True)
@@ -1129,7 +1090,7 @@ class JogoLabirinto:
             texto_x_inicio = resize(20, eh_X=True)
 
         # Título "RECOMPENSA!"
-        fonte_titulo_popup = pygame.font.SysFont("Arial", resize(30, eh_X=True), bold=True)
+        fonte_titulo_popup = asset_cache.carregar_sysfont("Arial", resize(30, eh_X=True), negrito=True)
         texto_titulo_surf = fonte_titulo_popup.render(self.popup_powerup_titulo, True, (*cor_borda, alpha))
         titulo_rect = texto_titulo_surf.get_rect(top=resize(15), centerx=popup_largura/2 + texto_x_inicio/3) # Ajustar centro
         if self.popup_powerup_icone_atual: # Centraliza melhor se houver ícone
@@ -1140,7 +1101,7 @@ class JogoLabirinto:
         popup_surface.blit(texto_titulo_surf, titulo_rect)
 
         # Descrição do Power-up
-        fonte_desc_popup = pygame.font.SysFont("Arial", resize(24, eh_X=True))
+        fonte_desc_popup = asset_cache.carregar_sysfont("Arial", resize(24, eh_X=True))
         texto_desc_surf = fonte_desc_popup.render(self.popup_powerup_descricao, True, (255, 255, 255, alpha))
         desc_rect = texto_desc_surf.get_rect(top=titulo_rect.bottom + resize(10))
         if self.popup_powerup_icone_atual:
@@ -1156,7 +1117,7 @@ class JogoLabirinto:
             pygame.draw.rect(popup_surface, (255, 255, 200, brilho_alpha), (0,0, popup_largura, popup_altura), width=resize(5), border_radius=resize(20))
 
 
-        self.tela.blit(popup_surface, (popup_x, popup_y))
+        return self.tela.blit(popup_surface, (popup_x, popup_y))
 
 
     def desenhar_forma_coracao(self, superficie, area_retangulo, cor):
@@ -1240,7 +1201,7 @@ class JogoLabirinto:
 
 
     def desenhar_coracoes(self):
-        """Desenha os corações representando as vidas."""
+        """Desenha os corações representando as vidas e retorna a área ocupada."""
         # Usar o número de vidas configurado pelo usuário
         numero_coracoes = self.num_vidas
         largura_total_coracoes = numero_coracoes * self.tamanho_coracao + (numero_coracoes - 1) * self.espacamento_coracoes
@@ -1285,17 +1246,19 @@ class JogoLabirinto:
 
             self.tela.blit(superficie_coracao, area_retangulo.topleft)
 
+        return pygame.Rect(x_inicial, y_retangulo, largura_total_coracoes, self.tamanho_coracao)
+
     def desenhar_efeito_colisao(self):
-        """Desenha o efeito de flash quando ocorre uma colisão"""
+        """Desenha o efeito de flash quando ocorre uma colisão e retorna a área afetada (a tela inteira)"""
         if not self.flash_ativo:
-            return
+            return None
             
-        tempo_atual = time.time()
+        tempo_atual = self.relogio()
         tempo_passado = tempo_atual - self.flash_inicio
         
         if tempo_passado > self.flash_duracao:
             self.flash_ativo = False
-            return
+            return None
             
         opacidade = int(255 * (1 - tempo_passado / self.flash_duracao))
         cor_flash = (self.flash_cor[0], self.flash_cor[1], self.flash_cor[2], opacidade)
@@ -1303,7 +1266,7 @@ class JogoLabirinto:
         flash_surface = pygame.Surface((LARGURA_TELA, ALTURA_TELA), pygame.SRCALPHA)
         flash_surface.fill(cor_flash)
         
-        self.tela.blit(flash_surface, (0, 0))
+        return self.tela.blit(flash_surface, (0, 0))
 
     def desenhar_controle_audio(self):
         """Desenha o botão de controle de áudio (mute/unmute)"""
@@ -1342,9 +1305,9 @@ class JogoLabirinto:
 
     def desenhar_qte(self):
 
-        """Desenha a interface do QTE atual"""
+        """Desenha a interface do QTE atual e retorna a área do painel"""
         if not self.qte_manager.ativo:
-            return
+            return None
             
         from utils.drawing import desenhar_barra_qte
         
@@ -1368,7 +1331,7 @@ class JogoLabirinto:
                         width=resize(2), border_radius=resize(10))
         
         # Título do QTE
-        fonte_titulo = pygame.font.SysFont("Arial", resize(32, eh_X=True), bold=True)
+        fonte_titulo = asset_cache.carregar_sysfont("Arial", resize(32, eh_X=True), negrito=True)
         texto_titulo = "Evento de Tempo Rápido!"
         surf_titulo = fonte_titulo.render(texto_titulo, True, (255, 215, 0))
         rect_titulo = surf_titulo.get_rect(center=(centro_x, painel_y + resize(30)))
@@ -1392,7 +1355,7 @@ class JogoLabirinto:
                 cor_btn = (0, 200, 0)  # Verde
             elif i == self.qte_manager.passo_atual:  # Botão atual
                 # Efeito pulsante para o botão atual
-                pulso = (math.sin(time.time() * 5) + 1) / 2  # Varia de 0 a 1
+                pulso = (math.sin(self.relogio() * 5) + 1) / 2  # Varia de 0 a 1
                 if comando == "C":
                     cor_btn = (0, 0 , 255)
                 elif comando == "B":
@@ -1416,7 +1379,7 @@ class JogoLabirinto:
             pygame.draw.rect(self.tela, (255, 255, 255), btn_rect, width=resize(2), border_radius=resize(10))
             
             # Desenha o texto do botão (L ou R)
-            fonte_btn = pygame.font.SysFont("Arial", resize(24, eh_X=True), bold=True)
+            fonte_btn = asset_cache.carregar_sysfont("Arial", resize(24, eh_X=True), negrito=True)
             texto_btn = fonte_btn.render(comando, True, (255, 255, 255))
             rect_texto = texto_btn.get_rect(center=btn_rect.center)
             self.tela.blit(texto_btn, rect_texto)
@@ -1437,96 +1400,179 @@ class JogoLabirinto:
             cor_barra = (200, 0, 0)  # Vermelho
             
         desenhar_barra_qte(self.tela, barra_x, barra_y, barra_largura, barra_altura, tempo_pct, cor_barra)
-        
+
+        return pygame.Rect(painel_x, painel_y, painel_largura, painel_altura)
+        
+    # Atributos que definem a lógica da partida (o que é só visual fica de fora)
+    ESTADO_JOGO = ("estado", "nivel_atual", "vidas", "colisoes", "inicio_tempo",
+                   "nivel_concluido_hardware", "instante_conclusao", "duracao_hardware", "tempo_bonus",
+                   "proximo_ping", "ultimo_qte", "proximo_check_qte", "qte_stats", "qte_input_queue",
+                   "servo_congelado", "tempo_servo_congelado", "popup_powerup_ativo", "popup_powerup_descricao",
+                   "popup_powerup_inicio_tempo", "flash_ativo", "flash_inicio", "estados_coracoes",
+                   "progresso_animacao_coracoes")
+    ESTADO_QTE = ("sequencia", "passo_atual", "tempo_inicio", "ativo", "sucesso", "erro", "timeout_ocorrido",
+                  "concluido")
+    ESTADO_SERVOS = ("indice_atual", "angulo_servo1", "angulo_servo2", "angulo_alvo1", "angulo_alvo2",
+                     "tempo_inicio_interpolacao", "_hold_ate", "_em_hold")
+
+    def estado_deterministico(self):
+        """Estado da partida em tipos simples, usado na gravação e na conferência da reprodução."""
+        def copiar(objeto, atributos):
+            estado = {}
+            for nome in atributos:
+                valor = getattr(objeto, nome, None)
+                estado[nome] = list(valor) if isinstance(valor, (list, tuple)) else dict(valor) if isinstance(valor, dict) else valor
+            return estado
+        return {
+            "jogo": copiar(self, self.ESTADO_JOGO),
+            "qte": copiar(self.qte_manager, self.ESTADO_QTE),
+            "servos": copiar(self.animacao_servos, self.ESTADO_SERVOS),
+        }
+
+    def restaurar_estado(self, estado):
+        """Restaura um estado salvo por estado_deterministico() (início de uma reprodução)."""
+        for objeto, chave in ((self, "jogo"), (self.qte_manager, "qte"), (self.animacao_servos, "servos")):
+            for nome, valor in estado[chave].items():
+                setattr(objeto, nome, list(valor) if isinstance(valor, list) else dict(valor) if isinstance(valor, dict) else valor)
+
     def loop_principal(self, pular_dialogo=False):
-        """Loop principal do jogo."""
+        """
+        Loop principal do jogo: uma máquina de estados em um único laço, com uma única superfície de tela.
+        DIALOGO -> AGUARDANDO_INICIO -> JOGANDO -> NIVEL_FALHOU ou NIVEL_CONCLUIDO -> DIALOGO ou
+        AGUARDANDO_INICIO (nova tentativa ou próximo nível) ... -> ENCERRADO.
+        Repetir ou avançar de nível não empilha chamadas nem recria a janela.
+        """
         tela = pygame.display.set_mode((LARGURA_TELA, ALTURA_TELA), pygame.NOFRAME)
+        self.preparar_tentativa(tela, pular_dialogo)
+
+        while self.estado != ESTADO_ENCERRADO:
+            if self.estado == ESTADO_DIALOGO:
+                nome_cena = f"fase_{self.nivel_atual}"
+                self.gerenciador_dialogos.executar(nome_cena)
+                from utils.user_data import marcar_dialogo_como_visto
+                marcar_dialogo_como_visto(self.usuario, nome_cena)
+                self.iniciar_tentativa(tela)
+            elif self.estado in (ESTADO_AGUARDANDO_INICIO, ESTADO_JOGANDO):
+                self.executar_quadro(tela)
+            elif self.estado == ESTADO_NIVEL_FALHOU:
+                self.finalizar_nivel_falhou(tela)
+            elif self.estado == ESTADO_NIVEL_CONCLUIDO:
+                self.finalizar_nivel_concluido(tela)
+
+    def preparar_tentativa(self, tela, pular_dialogo):
+        """Entra na próxima tentativa: pelo diálogo da fase ou direto na espera pelo sensor de início."""
+        if pular_dialogo:
+            self.iniciar_tentativa(tela)
+        else:
+            self.estado = ESTADO_DIALOGO
+
+    def iniciar_tentativa(self, tela):
+        """Prepara o renderizador e a sessão para uma tentativa do nível e passa a aguardar o sensor de início."""
+        # Com escala de cinza, os widgets desenham em um buffer sem filtro e o filtro é aplicado
+        # só nas áreas apresentadas; a tela é redesenhada por completo após diálogos e transições
+        import constants
+        self.renderizador.configurar(tela, aplicar_filtro_cinza_superficie if constants.ESCALA_CINZA else None)
+        self.tela = self.renderizador.superficie
+        self.estado = ESTADO_AGUARDANDO_INICIO
+
+        # Cada tentativa do nível tem sua semente (e, se ativada, sua gravação)
+        self.sessao.iniciar({"usuario": self.usuario, "nivel": self.nivel_atual, "opcoes": self.opcoes},
+                            self.estado_deterministico)
+        if self.sessao.reproduzindo:
+            self.restaurar_estado(self.sessao.estado_inicial)
+        self.prever_falas()
+
+    def prever_falas(self):
+        """Adianta a decodificação da fala que a próxima colisão vai tocar (feita logo após a semente da tentativa)."""
+        from utils.audio_manager import audio_manager
+        proxima = {2: "colisao_2vidas", 1: "colisao_1vida", 0: "perdeu"}.get(self.vidas - 1)
+        if proxima:
+            audio_manager.prever_voz(proxima)
+
+    def encerrar_tentativa(self, proximo_estado):
+        """Fecha a tentativa na sessão; numa reprodução, o jogo termina aqui (sem salvar nem mostrar telas)."""
+        self.estado = proximo_estado
+        self.sessao.encerrar(self.estado_deterministico)
+        if self.sessao.reproduzindo:
+            self.estado = ESTADO_ENCERRADO
+
+    def executar_quadro(self, tela):
+        """Um quadro dos estados AGUARDANDO_INICIO e JOGANDO: entradas, lógica e desenho."""
+        import constants
+        marcar = self.renderizador.marcar
         info_x = resize(20, eh_X=True)
         info_y = resize(100)
-        
-        nome_cena = f"fase_{self.nivel_atual}"
-        if not pular_dialogo:
-
-            self.gerenciador_dialogos.executar(nome_cena)
-            from utils.user_data import marcar_dialogo_como_visto
-            marcar_dialogo_como_visto(self.usuario, nome_cena)
-        
-     # Reinicia o timer após o diálogo (importante!) e também o timer do QTE
-        # self.inicio_tempo = time.time()
-        # self.ultimo_qte = time.time()  
-        # self.proximo_check_qte = time.time() + QTE_INTERVALO_MIN  # Agenda primeiro check   
-        
-        while self.jogo_ativo:
-            events = pygame.event.get()
-            self.clock.tick(FPS)
-
-            for event in events:
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.jogo_ativo = False
-                        TransitionEffect.fade_out(tela, velocidade=8)
-                        return
-                    # Simular botões QTE com teclado (para testes)
-                    elif event.key == pygame.K_LEFT and self.qte_manager.ativo and not self.qte_manager.concluido:
-                        resultado = self.qte_manager.processar_input("C")
-                    elif event.key == pygame.K_RIGHT and self.qte_manager.ativo and not self.qte_manager.concluido:
-                        resultado = self.qte_manager.processar_input("B")
-
-            if self.conexao_serial and self.qte_manager.ativo and self.qte_input_queue:
+
+        perfilador.novo_quadro()
+        events = pygame.event.get()
+        self.clock.tick(FPS)
+        from utils.audio_manager import audio_manager
+        audio_manager.atualizar()
+        events = self.sessao.iniciar_quadro(events)
+        if events is None:
+            self.estado = ESTADO_ENCERRADO  # Fim da gravação reproduzida
+            return
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    perfilador.alternar()
+                elif event.key == pygame.K_ESCAPE:
+                    self.encerrar_tentativa(ESTADO_ENCERRADO)
+                    TransitionEffect.fade_out(tela, velocidade=8)
+                    return
+                # Simular botões QTE com teclado (para testes)
+                elif event.key == pygame.K_LEFT and self.qte_manager.ativo and not self.qte_manager.concluido:
+                    resultado = self.qte_manager.processar_input("C")
+                elif event.key == pygame.K_RIGHT and self.qte_manager.ativo and not self.qte_manager.concluido:
+                    resultado = self.qte_manager.processar_input("B")
+
+        with perfilador.fase("qte"):
+            if self.qte_manager.ativo and self.qte_input_queue:
                 # Pega o último botão pressionado que veio do Arduino
                 input_do_jogador = self.qte_input_queue.pop(0) 
-                
+            
                 # Valida o input
                 resultado = self.qte_manager.processar_input(input_do_jogador)
 
                 if resultado is None: # Acertou, mas a sequência não terminou
                     # Pisca o LED de acerto e mostra a próxima luz
-                    self.conexao_serial.write(b"QTE_ACK\n")
-                    time.sleep(0.08) # Pequena pausa para a piscada
+                    self.enviar_comandos("QTE_ACK")
+                    # A próxima luz vai depois de uma pequena pausa para a piscada, sem travar o quadro
                     proximo_passo = self.qte_manager.sequencia[self.qte_manager.passo_atual]
-                    self.conexao_serial.write(f"QTE_SHOW:{proximo_passo}\n".encode('utf-8'))
+                    self.escritor_serial.agendar(f"QTE_SHOW:{proximo_passo}", 0.08, grupo="qte")
 
                 elif resultado is True: # Acertou o último passo
-                    self.conexao_serial.write(b"QTE_END\n")
-                    self.conexao_serial.write(b"FREEZE:0\n")
+                    self.escritor_serial.cancelar("qte")
+                    self.enviar_comandos("QTE_END", "FREEZE:0")
                     # Incrementa o contador de QTEs acertados no usuário
                     self.usuarios_data.setdefault(self.usuario, {}).setdefault("qtes_acertados", 0)
                     self.usuarios_data[self.usuario]["qtes_acertados"] += 1
                     salvar_usuarios(self.usuarios_data)
                     print(f"QTE acertado! Total: {self.usuarios_data[self.usuario]['qtes_acertados']}")
                     # A função qte_concluido_sucesso() será chamada pelo qte_manager
-                    
+                
                 elif resultado is False: # Errou
-                    self.conexao_serial.write(b"QTE_END\n")
-                    self.conexao_serial.write(b"FREEZE:0\n")
+                    self.escritor_serial.cancelar("qte")
+                    self.enviar_comandos("QTE_END", "FREEZE:0")
 
-            self.atualizar_labirinto()
-            
-            # Atualiza a animação dos servos enquanto esperando início (nível > 1)
+        self.atualizar_labirinto()
+        
+        # Atualiza a animação dos servos enquanto esperando início (nível > 1)
+        with perfilador.fase("servos"):
             if self.esperando_inicio and self.nivel_atual > 1:
                 self.animacao_servos.atualizar()
 
-            # Renderiza o fundo apropriado para o nível atual
-            background_atual = self.background_images.get(self.nivel_atual)
-            
-            if background_atual:
-                # Usa a imagem de fundo específica do nível atual
-                self.tela.blit(background_atual, (0, 0))
-            elif dialogo_dentro_img:
-                # Fallback para a imagem de diálogo genérica se disponível
-                self.tela.blit(dialogo_dentro_img, (0, 0))
-            else:
-                # Último fallback para cor sólida
-                self.tela.fill(AZUL_CLARO)
-                
-            self.desenhar_elementos_tematicos()
-            
-            self.desenhar_nome_nivel()
+        # Restaura a camada estática do nível (fundo, elementos temáticos e nome) sob as áreas sujas
+        with perfilador.fase("fundo"):
+            self.renderizador.definir_fundo((self.nivel_atual, constants.ESCALA_CINZA), self.construir_camada_fundo)
+            self.renderizador.iniciar_quadro()
 
-            clicou_voltar, _ = desenhar_botao(
+        with perfilador.fase("hud"):
+            clicou_voltar, rect_voltar = desenhar_botao(
                 texto="VOLTAR",
                 x=LARGURA_TELA//2-resize(100, eh_X=True),
                 y=ALTURA_TELA-resize(100),
@@ -1540,98 +1586,113 @@ class JogoLabirinto:
                 imagem_fundo=BUTTON_PATH,
                 border_radius=resize(15)
             )
-            if clicou_voltar:
-                self.jogo_ativo = False
-                from utils.audio_manager import audio_manager
-                audio_manager.stop_voiced_dialogue();
-                self.conexao_serial.write(b"TERMINAR\n")
-                print("Jogo encerrado pelo usuário.")
-                TransitionEffect.fade_out(tela, velocidade=8)
-                return
-
-
-            if self.vidas <= 0:
-                tempo_total = time.time() - self.inicio_tempo
-                self.salvar_progresso(tempo_total, falhou=True)
-                self.conexao_serial.write(b"LEVEL_FAILED\n")
-                self.conexao_serial.write(b"TERMINAR\n")
-                TransitionEffect.fade_out(tela, velocidade=10)
-                self.jogo_ativo, pular_dialogo = tela_falhou(tela, self.sistema_conquistas)
-                
-                if self.jogo_ativo:
-                    self.resetar_nivel()
-
-                    return self.loop_principal(pular_dialogo=pular_dialogo)
-
-            if self.verifica_conclusao_nivel():
-                tempo_total = time.time() - self.inicio_tempo
-                self.conexao_serial.write(b"TERMINAR\n")    
-                if self.nivel_atual >= 8:
-                    TransitionEffect.fade_out(tela, velocidade=10)
-                    from utils.audio_manager import audio_manager
-                    audio_manager.stop_voiced_dialogue()
-                    self.gerenciador_dialogos.executar("vitoria")
-                    self.salvar_progresso(tempo_total)
-                    self.sistema_conquistas.salvar_conquistas_usuario(self.usuario)
-                    tela_conclusao(tela, self.sistema_conquistas)
-                    return
-                else:
-                    self.salvar_progresso(tempo_total)
-                    self.sistema_conquistas.salvar_conquistas_usuario(self.usuario)
-                    proximo_nivel = self.nivel_atual + 1
-                    
-                    TransitionEffect.fade_out(tela, velocidade=10)
-
-                    continuar_jogando, repetir_nivel, pular_dialogo = tela_conclusao_nivel(tela, self.nivel_atual, tempo_total, self.sistema_conquistas)
-                    
-                    if not continuar_jogando:
+            # Inclui a elevação do efeito de hover
+            marcar(rect_voltar.inflate(resize(10), resize(12) * 2))
+        if clicou_voltar:
+            self.encerrar_tentativa(ESTADO_ENCERRADO)
+            from utils.audio_manager import audio_manager
+            audio_manager.stop_voiced_dialogue();
+            self.enviar_comandos("TERMINAR")
+            self.despachar_comandos()
+            print("Jogo encerrado pelo usuário.")
+            TransitionEffect.fade_out(tela, velocidade=8)
+            return
 
-                        self.jogo_ativo = False
-                        return
-                  
-                    self.nivel_atual = self.nivel_atual if repetir_nivel else proximo_nivel
-                    
-                    self.resetar_nivel() # Reseta corações
-                    
-                    return self.loop_principal(pular_dialogo=pular_dialogo)
+        if self.vidas <= 0:
+            self.encerrar_tentativa(ESTADO_NIVEL_FALHOU)
+            return
 
+        if self.verifica_conclusao_nivel():
+            self.encerrar_tentativa(ESTADO_NIVEL_CONCLUIDO)
+            return
 
+        with perfilador.fase("hud"):
             if self.esperando_inicio:
-                fonte_aviso = pygame.font.SysFont("Arial", resize(50, eh_X=True), bold=True)
-                desenhar_texto("Posicione o anel no início para começar!", fonte_aviso, 
+                fonte_aviso = asset_cache.carregar_sysfont("Arial", resize(50, eh_X=True), negrito=True)
+                marcar(desenhar_texto("Posicione o anel no início para começar!", fonte_aviso, 
                                      (255, 255, 100), self.tela, 
-                                     LARGURA_TELA//2, ALTURA_TELA//2 - resize(300), centralizado=True)
+                                     LARGURA_TELA//2, ALTURA_TELA//2 - resize(300), centralizado=True))
                 # Desenha a animação dos servos enquanto esperando início (nível > 1)
                 if self.nivel_atual > 1:
-                    self.animacao_servos.desenhar(self.tela)
+                    marcar(self.animacao_servos.desenhar(self.tela))
             else:
                 # O jogo está rolando, desenha a interface normal
-                desenhar_texto(f"Usuário: {self.usuario}", self.fonte, COR_TEXTO, self.tela, info_x, info_y)
-                desenhar_texto(f"Nível: {self.nivel_atual}", self.fonte, COR_TEXTO, self.tela, info_x, info_y + resize(60))
-                self.desenhar_coracoes()
+                marcar(desenhar_texto(f"Usuário: {self.usuario}", self.fonte, COR_TEXTO, self.tela, info_x, info_y))
+                marcar(desenhar_texto(f"Nível: {self.nivel_atual}", self.fonte, COR_TEXTO, self.tela, info_x, info_y + resize(60)))
+                marcar(self.desenhar_coracoes())
 
                 # O cronômetro só é desenhado se já tiver iniciado
                 if self.inicio_tempo > 0:
-                    tempo_atual = time.time() - self.inicio_tempo
-                    self.desenhar_timer_visual(tempo_atual)
+                    tempo_atual = self.relogio() - self.inicio_tempo
+                    marcar(self.desenhar_timer_visual(tempo_atual))
                 else:
-                    self.desenhar_timer_visual(0) # Mostra timer em 0
+                    marcar(self.desenhar_timer_visual(0)) # Mostra timer em 0
 
-            self.desenhar_qte()
-            self.desenhar_popup_powerup() # Desenha o popup de power-up
+            marcar(self.desenhar_qte())
+            marcar(self.desenhar_popup_powerup()) # Desenha o popup de power-up
 
-            self.desenhar_melhor_tempo()
-            
-            self.desenhar_indicadores_conquistas()
-            
-            self.desenhar_controle_audio()
-            
-            self.desenhar_efeito_colisao()
-            
-            self.sistema_conquistas.desenhar_notificacao(self.tela)
+            marcar(self.desenhar_melhor_tempo())
+        
+            marcar(self.desenhar_indicadores_conquistas())
+        
+            marcar(self.desenhar_controle_audio())
+        
+            marcar(self.desenhar_efeito_colisao())
+        
+        with perfilador.fase("notificacao"):
+            marcar(self.sistema_conquistas.desenhar_notificacao(self.tela))
             
-            import constants
-            if constants.ESCALA_CINZA:
-                aplicar_filtro_cinza_superficie(self.tela)
-                
-            pygame.display.update()
\ No newline at end of file
+        marcar(perfilador.desenhar(self.tela))
+        self.renderizador.apresentar()
+        # Uma única escrita serial por quadro, feita pela thread do escritor
+        with perfilador.fase("serial"):
+            self.despachar_comandos()
+        self.sessao.finalizar_quadro(self.estado_deterministico)
+
+    def finalizar_nivel_falhou(self, tela):
+        """Estado NIVEL_FALHOU: salva a tentativa e pergunta se o jogador quer tentar de novo."""
+        tempo_total = self.relogio() - self.inicio_tempo
+        self.salvar_progresso(tempo_total, falhou=True)
+        self.enviar_comandos("LEVEL_FAILED", "TERMINAR")
+        self.despachar_comandos()
+        TransitionEffect.fade_out(tela, velocidade=10)
+        continuar, pular_dialogo = tela_falhou(tela, self.sistema_conquistas)
+
+        if continuar:
+            self.resetar_nivel()
+            self.preparar_tentativa(tela, pular_dialogo)
+        else:
+            self.estado = ESTADO_ENCERRADO
+
+    def finalizar_nivel_concluido(self, tela):
+        """Estado NIVEL_CONCLUIDO: salva a tentativa e segue para o próximo nível, repete o nível ou encerra."""
+        tempo_total = self.calcular_tempo_nivel()
+        self.enviar_comandos("TERMINAR")
+        self.despachar_comandos()
+        if self.nivel_atual >= 8:
+            TransitionEffect.fade_out(tela, velocidade=10)
+            from utils.audio_manager import audio_manager
+            audio_manager.stop_voiced_dialogue()
+            self.gerenciador_dialogos.executar("vitoria")
+            self.salvar_progresso(tempo_total)
+            self.sistema_conquistas.salvar_conquistas_usuario(self.usuario)
+            tela_conclusao(tela, self.sistema_conquistas)
+            self.estado = ESTADO_ENCERRADO
+            return
+
+        self.salvar_progresso(tempo_total)
+        self.sistema_conquistas.salvar_conquistas_usuario(self.usuario)
+        proximo_nivel = self.nivel_atual + 1
+
+        TransitionEffect.fade_out(tela, velocidade=10)
+
+        continuar_jogando, repetir_nivel, pular_dialogo = tela_conclusao_nivel(tela, self.nivel_atual, tempo_total, self.sistema_conquistas)
+
+        if not continuar_jogando:
+            self.estado = ESTADO_ENCERRADO
+            return
+
+        self.nivel_atual = self.nivel_atual if repetir_nivel else proximo_nivel
+
+        self.resetar_nivel() # Reseta corações
+        self.preparar_tentativa(tela, pular_dialogo)
@@ -0,0 +1,74 @@
+"""
+Reproduz uma tentativa gravada com GRAVAR_SESSOES = True (arquivos .sessao.gz em data/sessoes).
+
+O jogo roda sem janela, com os mesmos instantes, sorteios, eventos do pygame e dados do Arduino da
+gravação, e a soma do estado é conferida quadro a quadro. Serve para reproduzir erros de lógica e
+problemas de desempenho relatados em campo (combine com PERFILADOR_ATIVO para medir cada quadro).
+
+Uso (a partir da raiz do repositório):
+    python Labirinto_game/reproduzir.py Labirinto_game/data/sessoes/sessao_....sessao.gz [--janela]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduz uma sessão gravada do jogo")
+    parser.add_argument("arquivo", help="Arquivo .sessao.gz")
+    parser.add_argument("--janela", action="store_true", help="Mostra a reprodução em uma janela")
+    args = parser.parse_args()
+    caminho = os.path.abspath(args.arquivo)
+
+    if not args.janela:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    # Os caminhos dos assets são relativos à raiz do repositório
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    import pygame
+    pygame.init()
+
+    import constants
+    from utils.sessao import ReproducaoSessao
+
+    reproducao = ReproducaoSessao(caminho)
+    cabecalho = reproducao.cabecalho
+
+    # Usuário temporário com as opções da gravação, para não mexer nos dados reais
+    pasta = tempfile.mkdtemp(prefix="reproducao_labirinto_")
+    constants.USUARIOS_JSON = os.path.join(pasta, "usuarios.json")
+    constants.USUARIOS_DB = os.path.join(pasta, "usuarios.db")
+    constants.GRAVAR_SESSOES = False
+    from utils import user_data
+    user_data.USUARIOS_JSON = constants.USUARIOS_JSON
+    user_data.USUARIOS_DB = constants.USUARIOS_DB
+    user_data.salvar_usuarios({
+        cabecalho["usuario"]: {"nivel": cabecalho["nivel"], "tentativas": [], "acessibilidade": cabecalho["opcoes"]}
+    })
+
+    from game.game import JogoLabirinto
+    from utils.simulador_serial import SimuladorSerial
+
+    tela = pygame.display.set_mode((constants.LARGURA_TELA, constants.ALTURA_TELA))
+    # Os dados do Arduino vêm da gravação; o simulador sem roteiro só recebe os comandos enviados
+    jogo = JogoLabirinto(tela, cabecalho["usuario"], nivel_inicial=cabecalho["nivel"],
+                         conexao_serial=SimuladorSerial(roteiro=[]), sessao=reproducao)
+    jogo.loop_principal(pular_dialogo=True)
+
+    quadros = len(reproducao.quadros)
+    reproduzidos = min(reproducao.indice + 1, quadros)
+    print(f"Quadros reproduzidos: {reproduzidos}/{quadros}")
+    if reproducao.divergencia is not None:
+        print(f"Estado divergiu da gravação a partir do quadro {reproducao.divergencia}")
+        sys.exit(1)
+    if reproduzidos < quadros:
+        print("A partida terminou antes do fim da gravação")
+        sys.exit(1)
+    print(f"Reprodução idêntica à gravação (estado final {reproducao.soma_final})")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 import pygame
 import sys
 import os
-from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img, ESCALA_CINZA
+from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia, ESCALA_CINZA
 from constants import FONTE_TITULO, FONTE_BOTAO, FONTE_TEXTO, COR_TITULO, COR_TEXTO
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
 from utils.achievements import SistemaConquistas
+from utils.asset_cache import asset_cache
+from utils.cenas import executar_cena
 
 def aplicar_borda_arredondada(imagem, raio=10):
     """Aplica uma máscara com cantos arredondados a uma imagem."""
@@ -24,11 +26,10 @@ def carregar_e_redimensionar_icone(caminho, tamanho=(resize(80, eh_X=True), resi
     """Carrega uma imagem de ícone, redimensiona e aplica cantos arredondados."""
     try:
         if os.path.exists(caminho):
-            icone = pygame.image.load(caminho).convert_alpha()
-            icone = pygame.transform.scale(icone, tamanho)
-
-            icone = aplicar_borda_arredondada(icone, raio=10)
-            return icone
+            return asset_cache.obter_superficie(
+                ("icone_arredondado", caminho, tamanho),
+                lambda: aplicar_borda_arredondada(asset_cache.carregar_imagem(caminho, tamanho), raio=10)
+            )
         else:
             print(f"Caminho do ícone não encontrado: {caminho}")
             return None
@@ -36,9 +37,14 @@ def carregar_e_redimensionar_icone(caminho, tamanho=(resize(80, eh_X=True), resi
         print(f"Erro ao carregar ícone {caminho}: {e}")
         return None
 
-def tela_conquistas(tela, usuario):
+def precarregar_conquistas():
+    """Prepara os ícones arredondados de todas as conquistas em segundo plano."""
+    for conquista in SistemaConquistas().conquistas.values():
+        if conquista.get('icone'):
+            carregar_e_redimensionar_icone(conquista['icone'])
+
+def cena_conquistas(tela, usuario):
     """Tela para visualizar conquistas desbloqueadas."""
-    clock = pygame.time.Clock()
     fonte_titulo = FONTE_TITULO
     fonte_texto = FONTE_TEXTO
     fonte_botao = FONTE_BOTAO
@@ -58,8 +64,7 @@ def tela_conquistas(tela, usuario):
     titulo_y = resize(50)
     
     while True:
-        events = pygame.event.get()
-        clock.tick(FPS)
+        events = yield
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -68,8 +73,9 @@ def tela_conquistas(tela, usuario):
                 if event.key == pygame.K_ESCAPE:
                     return
         
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
         
@@ -115,9 +121,9 @@ def tela_conquistas(tela, usuario):
             
             # Desenha informações da conquista
             desenhar_texto(conquista['nome'], fonte_texto, COR_TEXTO, tela, titulo_x + resize(100, eh_X=True), y_offset)
-            desenhar_texto(conquista['descricao'], pygame.font.SysFont("comicsansms", resize(30, eh_X=True)), 
+            desenhar_texto(conquista['descricao'], asset_cache.carregar_sysfont("comicsansms", resize(30, eh_X=True)), 
                           cor_com_escala_cinza(200, 200, 200), tela, titulo_x + resize(100, eh_X=True), y_offset + resize(40))
-            desenhar_texto(status, pygame.font.SysFont("comicsansms", resize(25, eh_X=True)), 
+            desenhar_texto(status, asset_cache.carregar_sysfont("comicsansms", resize(25, eh_X=True)), 
                           cor_status, tela, LARGURA_TELA - resize(300, eh_X=True), y_offset + resize(20))
             
             y_offset += espacamento
@@ -143,4 +149,8 @@ def tela_conquistas(tela, usuario):
         if constants.ESCALA_CINZA:
             aplicar_filtro_cinza_superficie(tela)
             
-        pygame.display.update()
\ No newline at end of file
+        pygame.display.update()
+
+def tela_conquistas(tela, usuario):
+    """Executa cena_conquistas até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_conquistas(tela, usuario), precarregar_conquistas)
@@ -2,10 +2,12 @@ import pygame
 import sys
 import json
 import os
-from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img
+from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia
 from constants import FONTE_TITULO, FONTE_BOTAO, FONTE_TEXTO, COR_TITULO, COR_TEXTO
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, TransitionEffect, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
+from utils.asset_cache import asset_cache
+from utils.cenas import executar_cena
 
 def carregar_dados_personagens():
     """Carrega as informações dos personagens do arquivo JSON."""
@@ -21,11 +23,11 @@ def carregar_imagem_personagem(nome_imagem):
     try:
         caminho = f"Labirinto_game/assets/images/characters/{nome_imagem}"
         if os.path.exists(caminho):
-            imagem = pygame.image.load(caminho).convert_alpha()
+            largura_original, altura_original = asset_cache.dimensoes_imagem(caminho)
             # Redimensionar para um tamanho adequado
             altura = resize(600)
-            largura = altura * imagem.get_width() / imagem.get_height()
-            return pygame.transform.scale(imagem, (int(largura), altura))
+            largura = altura * largura_original / altura_original
+            return asset_cache.carregar_imagem(caminho, (int(largura), altura))
         else:
             print(f"Imagem não encontrada: {caminho}")
             return None
@@ -33,6 +35,11 @@ def carregar_imagem_personagem(nome_imagem):
         print(f"Erro ao carregar imagem: {e}")
         return None
 
+def precarregar_personagens():
+    """Carrega as imagens dos personagens em segundo plano, antes de a tela ser mostrada."""
+    for personagem in carregar_dados_personagens().values():
+        carregar_imagem_personagem(personagem["imagem"])
+
 def quebrar_texto_em_linhas(texto, fonte, largura_max):
     """Quebra um texto em múltiplas linhas para caber em uma largura máxima."""
     palavras = texto.split(' ')
@@ -54,11 +61,10 @@ def quebrar_texto_em_linhas(texto, fonte, largura_max):
     
     return linhas
 
-def tela_personagens(tela):
+def cena_personagens(tela):
     """Tela que mostra informações sobre os personagens do jogo."""
-    clock = pygame.time.Clock()
     fonte_titulo = FONTE_TITULO
-    fonte_texto = pygame.font.Font("Labirinto_game/assets/fonts/Montserrat-Bold.ttf", resize(30))
+    fonte_texto = asset_cache.carregar_fonte("Labirinto_game/assets/fonts/Montserrat-Bold.ttf", resize(30))
     fonte_botao = FONTE_BOTAO
     
     # Carrega os dados dos personagens
@@ -76,8 +82,7 @@ def tela_personagens(tela):
 
     
     while True:
-        events = pygame.event.get()
-        clock.tick(FPS)
+        events = yield
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -86,8 +91,9 @@ def tela_personagens(tela):
                 if event.key == pygame.K_ESCAPE:
                     return
         
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
         
@@ -198,3 +204,7 @@ def tela_personagens(tela):
             aplicar_filtro_cinza_superficie(tela)
             
         pygame.display.update()
+
+def tela_personagens(tela):
+    """Executa cena_personagens até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_personagens(tela), precarregar_personagens)
@@ -1,6 +1,6 @@
 import pygame
 import sys
-from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img
+from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia
 from constants import FONTE_TITULO, FONTE_BOTAO, COR_TITULO
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, TransitionEffect, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
@@ -21,6 +21,7 @@ def tela_conclusao(tela, sistema_conquistas):
     while True:
         events = pygame.event.get()
         clock.tick(FPS)
+        audio_manager.atualizar()
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -29,8 +30,9 @@ def tela_conclusao(tela, sistema_conquistas):
                 if event.key == pygame.K_ESCAPE:
                     return
 
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
 
@@ -1,12 +1,13 @@
 import pygame
 import sys
-from constants import (BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img,
+from constants import (BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia,
                       FONTE_TITULO, FONTE_BOTAO, FONTE_TEXTO, COR_TITULO, COR_TEXTO)
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, TransitionEffect, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
 from utils.user_data import carregar_usuarios
+from utils.cenas import executar_cena
 
-def tela_inicio_jogo(tela):
+def cena_inicio_jogo(tela):
     """
     Exibe a tela inicial para escolher entre continuar jogo e novo jogo.
     
@@ -16,7 +17,6 @@ def tela_inicio_jogo(tela):
     Returns:
         str: 'CONTINUAR' ou 'NOVO'
     """
-    clock = pygame.time.Clock()
     fonte_titulo = FONTE_TITULO
     fonte_botao = FONTE_BOTAO
     
@@ -24,8 +24,7 @@ def tela_inicio_jogo(tela):
     tem_usuarios = len(usuarios) > 0
     
     while True:
-        events = pygame.event.get()
-        clock.tick(FPS)
+        events = yield
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -35,8 +34,9 @@ def tela_inicio_jogo(tela):
                     pygame.quit()
                     sys.exit()
 
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
             
@@ -114,3 +114,7 @@ def tela_inicio_jogo(tela):
             aplicar_filtro_cinza_superficie(tela)
             
         pygame.display.update()
+
+def tela_inicio_jogo(tela):
+    """Executa cena_inicio_jogo até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_inicio_jogo(tela))
@@ -2,6 +2,7 @@ import pygame
 import sys
 from pygame.locals import *
 from utils.drawing import resize, aplicar_filtro_cinza_superficie
+from utils.asset_cache import asset_cache
 from constants import LARGURA_TELA, ALTURA_TELA
 
 class TelaDialogoInicial:
@@ -11,11 +12,9 @@ class TelaDialogoInicial:
         self.largura_tela = tela.get_width()
         self.altura_tela = tela.get_height()
         
-        self.fundo = pygame.image.load("Labirinto_game/assets/images/backgrounds/fundo_dialogo.png").convert_alpha()
-        self.fundo = pygame.transform.scale(self.fundo, (LARGURA_TELA, ALTURA_TELA))
+        self.fundo = asset_cache.carregar_imagem("Labirinto_game/assets/images/backgrounds/fundo_dialogo.png", (LARGURA_TELA, ALTURA_TELA))
         
-        self.personagem = pygame.image.load("Labirinto_game/assets/images/characters/teseu.png").convert_alpha()
-        self.personagem = pygame.transform.scale(self.personagem, (resize(800, eh_X=True), resize(800)))
+        self.personagem = asset_cache.carregar_imagem("Labirinto_game/assets/images/characters/teseu.png", (resize(800, eh_X=True), resize(800)))
         
         # Posiciona personagem no meio da tela
         self.personagem_rect = self.personagem.get_rect(center=(LARGURA_TELA - resize(500, eh_X=True), ALTURA_TELA - resize(400)))
@@ -27,7 +26,7 @@ class TelaDialogoInicial:
             resize(self.altura_tela * 0.2)    # altura
         )
         
-        self.fonte = pygame.font.Font(None, resize(36))
+        self.fonte = asset_cache.carregar_fonte(None, resize(36))
         self.cor_texto = (255, 255, 255)
         self.linhas_dialogo = [
             "Oi! Que bom que você está aqui! Eu sou Teseu, um viajante que veio até Creta para explorar este labirinto enorme. Dizem que foi construído há muitos e muitos anos pelo inventor Dédalo, e que lá no fim vive um monstro assustador chamado Minotauro.",
@@ -46,7 +45,7 @@ class TelaDialogoInicial:
         self.velocidade_despertar = 2  # Velocidade da animação de despertar
         self.despertando = True
         
-        self.fonte_indicador = pygame.font.Font(None, resize(24))
+        self.fonte_indicador = asset_cache.carregar_fonte(None, resize(24))
         self.texto_indicador = "Pressione qualquer tecla para continuar..."
         
         # Espaçamento entre linhas de texto
@@ -56,7 +55,7 @@ class TelaDialogoInicial:
         self.mostrar_popup = False
         self.nome_usuario = ""
         self.ativo_input = False
-        self.fonte_popup = pygame.font.SysFont("comicsansms", resize(40, eh_X=True))
+        self.fonte_popup = asset_cache.carregar_sysfont("comicsansms", resize(40, eh_X=True))
         self.cor_popup_inativa = (150, 150, 150)
         self.cor_popup_ativa = (200, 200, 200)
         self.cor_botao_confirmar = (0, 150, 0)
@@ -276,6 +275,7 @@ class TelaDialogoInicial:
             aplicar_filtro_cinza_superficie(self.tela)
     
     def executar(self):
+        from utils.audio_manager import audio_manager
         relogio = pygame.time.Clock()
         concluido = False
         nome_usuario = None
@@ -287,5 +287,6 @@ class TelaDialogoInicial:
             
             pygame.display.flip()
             relogio.tick(60)
+            audio_manager.atualizar()
         
         return self.nome_escolhido 
\ No newline at end of file
@@ -1,19 +1,21 @@
 import pygame
 import sys
 import math
-from constants import LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img
+from constants import LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia
 from utils.drawing import resize, desenhar_texto_textura, centralizar_texto, aplicar_filtro_cinza_superficie
+from utils.asset_cache import asset_cache
+from utils.cenas import executar_cena, gerenciador_cenas
+from utils.precarregador import precarregador
 
-def tela_inicial(tela):
+def cena_inicial(tela):
     """Tela inicial do jogo com texto animado."""
-    clock = pygame.time.Clock()
     rodando = True
 
     # Texto e fonte
     mensagem = "A FÚRIA DO MINOTAURO"
     mensagem2 = "Aperte qualquer tecla para continuar"
-    fonte = pygame.font.Font("Labirinto_game/assets/fonts/Odyssey2.otf", resize(140, eh_X=True))
-    fonte2 = pygame.font.Font("Labirinto_game/assets/fonts/Odyssey.otf", resize(50, eh_X=True))
+    fonte = asset_cache.carregar_fonte("Labirinto_game/assets/fonts/Odyssey2.otf", resize(140, eh_X=True))
+    fonte2 = asset_cache.carregar_fonte("Labirinto_game/assets/fonts/Odyssey.otf", resize(50, eh_X=True))
 
     # Configuração de animação
     base_x = LARGURA_TELA // 2
@@ -22,13 +24,14 @@ def tela_inicial(tela):
     frequencia = 0.4
 
     tempo_acumulado = 0.0
-    texture_image = pygame.image.load("Labirinto_game/assets/images/marmore2.jpg").convert_alpha()
+    texture_image = asset_cache.carregar_imagem("Labirinto_game/assets/images/marmore2.jpg")
     
     while rodando:
-        dt = clock.tick(FPS)
+        events = yield
+        dt = gerenciador_cenas.relogio.get_time()
         tempo_acumulado += dt / 1000.0
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -41,8 +44,9 @@ def tela_inicial(tela):
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 rodando = False
 
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
 
@@ -60,8 +64,19 @@ def tela_inicial(tela):
         tela.blit(text_surface, text_rect)
         tela.blit(text_surface2, text_rect2)
 
+        # Barra discreta com o progresso do pré-carregamento das imagens do jogo
+        if not precarregador.concluido:
+            barra = pygame.Rect(LARGURA_TELA // 4, ALTURA_TELA - resize(40), LARGURA_TELA // 2, resize(6))
+            pygame.draw.rect(tela, (60, 50, 30), barra, border_radius=resize(3))
+            pygame.draw.rect(tela, (212, 175, 55), (barra.x, barra.y, int(barra.width * precarregador.progresso()), barra.height),
+                             border_radius=resize(3))
+
         import constants
         if constants.ESCALA_CINZA:
             aplicar_filtro_cinza_superficie(tela)
             
-        pygame.display.update()
\ No newline at end of file
+        pygame.display.update()
+
+def tela_inicial(tela):
+    """Executa cena_inicial até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_inicial(tela))
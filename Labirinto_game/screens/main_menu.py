@@ -1,14 +1,14 @@
 import pygame
 import sys
-from constants import (BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img,
+from constants import (BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia,
                      FONTE_TITULO, FONTE_BOTAO, COR_TITULO, FONTE_BOTAO_REDUZIDA)
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
 from utils.user_data import carregar_usuarios, salvar_usuarios
+from utils.cenas import executar_cena
 
-def tela_menu_principal(tela, usuario):
+def cena_menu_principal(tela, usuario):
     """Tela do menu principal do jogo."""
-    clock = pygame.time.Clock()
     fonte_titulo = FONTE_TITULO
     fonte_botao = FONTE_BOTAO
 
@@ -30,8 +30,7 @@ def tela_menu_principal(tela, usuario):
             volume_musica = 0.5
         audio_manager.set_bg_volume(volume_musica)
         
-        events = pygame.event.get()
-        clock.tick(FPS)
+        events = yield
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -40,8 +39,9 @@ def tela_menu_principal(tela, usuario):
                 if event.key == pygame.K_ESCAPE:
                     return "VOLTAR"
 
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
 
@@ -198,4 +198,8 @@ def tela_menu_principal(tela, usuario):
         if constants.ESCALA_CINZA:
             aplicar_filtro_cinza_superficie(tela)
 
-        pygame.display.update()
\ No newline at end of file
+        pygame.display.update()
+
+def tela_menu_principal(tela, usuario):
+    """Executa cena_menu_principal até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_menu_principal(tela, usuario))
@@ -3,10 +3,13 @@ import sys
 import math
 import os
 from constants import *
+from constants import BACKGROUND_PATH, imagem_tela_cheia
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, aplicar_filtro_cinza_superficie, TransitionEffect
 from utils.colors import cor_com_escala_cinza
 from utils.user_data import carregar_usuarios, set_acessibilidade, get_acessibilidade
 from utils.audio_manager import audio_manager
+from utils.asset_cache import asset_cache
+from utils.cenas import executar_cena
 
 class Slider:
     def __init__(self, x, y, largura, valor_inicial, min_valor, max_valor, cor, nome, fonte, step=0.01, sufixo=""):
@@ -246,12 +249,16 @@ def carregar_icone(nome, tamanho=32):
     caminho = f"Labirinto_game/assets/images/icons/{nome}.png"
     try:
         if os.path.exists(caminho):
-            imagem = pygame.image.load(caminho).convert_alpha()
-            return pygame.transform.scale(imagem, (resize(tamanho), resize(tamanho)))
+            return asset_cache.carregar_imagem(caminho, (resize(tamanho), resize(tamanho)))
     except Exception as e:
         print(f"Erro ao carregar ícone {caminho}: {e}")
     return None
 
+def precarregar_opcoes_acessibilidade():
+    """Carrega os ícones das categorias em segundo plano, antes de a tela ser mostrada."""
+    for nome in ("audio", "display", "joystick", "warning", "controller", "text"):
+        carregar_icone(nome, 32)
+
 def criar_botao_navegacao(tela, x, y, largura, altura, texto, icone, cor, selecionado, events):
     """Cria um botão de navegação para as abas de opções"""
     hover = False
@@ -279,7 +286,7 @@ def criar_botao_navegacao(tela, x, y, largura, altura, texto, icone, cor, seleci
     else:
         pos_texto_x = x + resize(10, eh_X=True)
     
-    fonte = pygame.font.Font("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(22))
+    fonte = asset_cache.carregar_fonte("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(22))
     desenhar_texto_sombra(texto, fonte, (255, 255, 255), tela, pos_texto_x, y + resize(8))
     
     clicado = False
@@ -292,11 +299,10 @@ def criar_botao_navegacao(tela, x, y, largura, altura, texto, icone, cor, seleci
     
     return clicado
 
-def tela_opcoes_acessibilidade(tela, usuario):
-    clock = pygame.time.Clock()
+def cena_opcoes_acessibilidade(tela, usuario):
     fonte_titulo = FONTE_TITULO
     fonte = FONTE_TEXTO
-    fonte_menor = pygame.font.Font("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(30))
+    fonte_menor = asset_cache.carregar_fonte("Labirinto_game/assets/fonts/greek-freak.regular.ttf", resize(30))
     
     # Variável para limitar a frequência dos testes de som
     ultimo_teste_audio = pygame.time.get_ticks()
@@ -472,7 +478,7 @@ def tela_opcoes_acessibilidade(tela, usuario):
     running = True
     while running:
         tempo = pygame.time.get_ticks()
-        events = pygame.event.get()
+        events = yield
         
         for event in events:
             if event.type == pygame.QUIT:
@@ -507,8 +513,9 @@ def tela_opcoes_acessibilidade(tela, usuario):
                 selector.handle_event(event)
         
         # Renderização do fundo
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
         
@@ -655,7 +662,7 @@ def tela_opcoes_acessibilidade(tela, usuario):
         
         if categoria_atual in descricoes:
             descricao = descricoes[categoria_atual]
-            fonte_descricao = pygame.font.Font(None, resize(24))
+            fonte_descricao = asset_cache.carregar_fonte(None, resize(24))
             # Cria um fundo semitransparente para a descrição
             surf_desc = fonte_descricao.render(descricao, True, (220, 220, 220))
             rect_desc = surf_desc.get_rect(center=(x_central, ALTURA_TELA - resize(250)))
@@ -747,6 +754,10 @@ def tela_opcoes_acessibilidade(tela, usuario):
     
     TransitionEffect.fade_out(tela, velocidade=10)
 
+def tela_opcoes_acessibilidade(tela, usuario):
+    """Executa cena_opcoes_acessibilidade até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_opcoes_acessibilidade(tela, usuario), precarregar_opcoes_acessibilidade)
+
 def desenhar_secao(tela, texto, icone, cor, x, y):
     """Desenha o cabeçalho de uma seção"""
     fonte_secao = FONTE_BOTAO_REDUZIDA
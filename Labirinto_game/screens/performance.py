@@ -1,15 +1,17 @@
 import pygame
 import sys
-from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img
+from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia
 from constants import FONTE_TITULO, FONTE_BOTAO, FONTE_TEXTO, COR_TITULO, COR_TEXTO
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
 from utils.user_data import carregar_usuarios
+from utils.estatisticas import obter_estatisticas
 from utils.graphics import GraficoLinha, GraficoBarras, VERMELHO_MINOTAURO, DOURADO_ANTIGO, TERRACOTA
+from utils.asset_cache import asset_cache
+from utils.cenas import executar_cena, gerenciador_cenas
 
-def tela_desempenho(tela, usuario):
+def cena_desempenho(tela, usuario):
     """Tela de desempenho do usuário com gráficos animados."""
-    clock = pygame.time.Clock()
     fonte_titulo = FONTE_TITULO
     fonte_texto = FONTE_TEXTO
     fonte_botao = FONTE_BOTAO
@@ -17,23 +19,23 @@ def tela_desempenho(tela, usuario):
     usuarios_data = carregar_usuarios()
     nivel = usuarios_data[usuario].get("nivel", 1)
     tentativas = usuarios_data[usuario].get("tentativas", [])
+    estatisticas = obter_estatisticas(usuario, tentativas)
 
-    niveis_jogados = sorted(set(t["nivel"] for t in tentativas))
+    niveis_jogados = sorted(estatisticas.tentativas_por_nivel)
     if not niveis_jogados:
         niveis_jogados = [1]
 
     indice_nivel_selecionado = 0
 
     def mostrar_tentativas_nivel(nivel_escolhido):
-        all_t = [t for t in tentativas if t["nivel"] == nivel_escolhido]
-        return all_t
+        return estatisticas.tentativas_nivel.get(nivel_escolhido, [])
 
     titulo_x = resize(100, eh_X=True)
     titulo_y = resize(50)
     
     # Inicialização dos gráficos animados
-    fonte_grafico = pygame.font.SysFont("arial", resize(24))
-    fonte_titulo_grafico = pygame.font.SysFont("arial", resize(30))
+    fonte_grafico = asset_cache.carregar_sysfont("arial", resize(24))
+    fonte_titulo_grafico = asset_cache.carregar_sysfont("arial", resize(30))
     
     # Definir dados iniciais para os gráficos
     dados_grafico_tentativas = []
@@ -59,10 +61,12 @@ def tela_desempenho(tela, usuario):
     # Sistema de paginação para estatísticas detalhadas
     pagina_atual = 0
     tentativas_por_pagina = 5  # Número de tentativas exibidas por página
+    # Listas já ordenadas para a tabela, por nível (None = todos), para não reordenar a cada quadro
+    tentativas_ordenadas = {}
 
     while True:
-        events = pygame.event.get()
-        dt = clock.tick(FPS) / 10  # Normaliza o tempo para animações
+        events = yield
+        dt = gerenciador_cenas.relogio.get_time() / 10  # Normaliza o tempo para animações
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -71,8 +75,9 @@ def tela_desempenho(tela, usuario):
                 if event.key == pygame.K_ESCAPE:
                     return
 
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
 
@@ -123,7 +128,7 @@ def tela_desempenho(tela, usuario):
                 altura=resize(80),
                 cor_normal=cor_com_escala_cinza(150,150,150),
                 cor_hover=cor_com_escala_cinza(200,200,200),
-                fonte=pygame.font.SysFont("arial", resize(50, eh_X=True)),
+                fonte=asset_cache.carregar_sysfont("arial", resize(50, eh_X=True)),
                 tela=tela,
                 events=events,
                 imagem_fundo=BUTTON_PATH,
@@ -144,7 +149,7 @@ def tela_desempenho(tela, usuario):
                 altura=resize(80),
                 cor_normal=cor_com_escala_cinza(150,150,150),
                 cor_hover=cor_com_escala_cinza(200,200,200),
-                fonte=pygame.font.SysFont("arial", resize(50, eh_X=True)),
+                fonte=asset_cache.carregar_sysfont("arial", resize(50, eh_X=True)),
                 tela=tela,
                 events=events,
                 imagem_fundo=BUTTON_PATH,
@@ -166,10 +171,9 @@ def tela_desempenho(tela, usuario):
                 # Tempo médio por fase - APENAS tentativas bem-sucedidas
                 dados_grafico_tempo_medio = []
                 for n in sorted(niveis_jogados):
-                    # Filtrar apenas tentativas bem-sucedidas (vidas > 0)
-                    tentativas_n = [t for t in tentativas if t["nivel"] == n and t["vidas"] > 0]
-                    if tentativas_n:
-                        tempo_medio = sum(t["tempo"] for t in tentativas_n) / len(tentativas_n)
+                    # Apenas tentativas bem-sucedidas (vidas > 0)
+                    tempo_medio = estatisticas.tempo_medio(n)
+                    if tempo_medio is not None:
                         dados_grafico_tempo_medio.append({
                             "nivel": n, 
                             "tempo": tempo_medio, 
@@ -195,7 +199,7 @@ def tela_desempenho(tela, usuario):
                 nivel_escolhido = niveis_jogados[indice_nivel_selecionado]
                 # Obtém apenas as tentativas bem-sucedidas deste nível em ordem cronológica
                 tentativas_nivel = sorted(
-                    [t for t in tentativas if t["nivel"] == nivel_escolhido and t["vidas"] > 0], 
+                    [t for t in mostrar_tentativas_nivel(nivel_escolhido) if t["vidas"] > 0], 
                     key=lambda x: x["timestamp"]
                 )
                 
@@ -230,11 +234,9 @@ def tela_desempenho(tela, usuario):
                 # Média de colisões por nível - INCLUINDO tentativas falhas
                 dados_grafico_colisoes = []
                 for n in sorted(niveis_jogados):
-                    # Pega TODAS as tentativas deste nível (incluindo falhas)
-                    tentativas_n = [t for t in tentativas if t["nivel"] == n]
-                    if tentativas_n:
-                        colisoes = [t.get("colisoes", 0) for t in tentativas_n]
-                        colisoes_media = sum(colisoes) / len(colisoes) if colisoes else 0
+                    # Considera TODAS as tentativas deste nível (incluindo falhas)
+                    if estatisticas.tentativas_por_nivel[n]:
+                        colisoes_media = estatisticas.media_colisoes(n)
                         dados_grafico_colisoes.append({
                             "nivel": n, 
                             "colisoes": colisoes_media, 
@@ -260,7 +262,7 @@ def tela_desempenho(tela, usuario):
 
                 # Incluir TODAS as tentativas neste nível (incluindo falhas)
                 tentativas_nivel = sorted(
-                    [t for t in tentativas if t["nivel"] == nivel_escolhido], 
+                    mostrar_tentativas_nivel(nivel_escolhido), 
                     key=lambda x: x["timestamp"]
                 )
                 
@@ -323,13 +325,15 @@ def tela_desempenho(tela, usuario):
         # Determinar tentativas a exibir com base na navegação - SEMPRE mostrar TODAS as tentativas
         if aba_selecionada == 0 or aba_selecionada == 2: 
             # Para gráfico de tempo médio, mostrar todas as tentativas
-            tentativas_exibir = tentativas
+            chave_tabela = None
         else:
             # Para outros gráficos, mostrar todas as tentativas do nível escolhido
-            nivel_escolhido = niveis_jogados[indice_nivel_selecionado]
-            tentativas_exibir = [t for t in tentativas if t["nivel"] == nivel_escolhido]
+            chave_tabela = niveis_jogados[indice_nivel_selecionado]
         
-        tentativas_exibir = sorted(tentativas_exibir, key=lambda t: t["timestamp"], reverse=True)
+        if chave_tabela not in tentativas_ordenadas:
+            lista = tentativas if chave_tabela is None else mostrar_tentativas_nivel(chave_tabela)
+            tentativas_ordenadas[chave_tabela] = sorted(lista, key=lambda t: t["timestamp"], reverse=True)
+        tentativas_exibir = tentativas_ordenadas[chave_tabela]
         
 
         total_paginas = max(1, (len(tentativas_exibir) + tentativas_por_pagina - 1) // tentativas_por_pagina)
@@ -347,7 +351,7 @@ def tela_desempenho(tela, usuario):
         for i, titulo_col in enumerate(cabecalho):
             desenhar_texto(
                 titulo_col, 
-                pygame.font.SysFont("arial", resize(26), bold=True), 
+                asset_cache.carregar_sysfont("arial", resize(26), negrito=True), 
                 DOURADO_ANTIGO,
                 tela, 
                 x_inicio + i * espacamento_x, 
@@ -384,7 +388,7 @@ def tela_desempenho(tela, usuario):
                 cor = cor_status if j == 2 else COR_TEXTO
                 desenhar_texto(
                     dado, 
-                    pygame.font.SysFont("arial", resize(24)), 
+                    asset_cache.carregar_sysfont("arial", resize(24)), 
                     cor,
                     tela, 
                     x_inicio + j * espacamento_x, 
@@ -404,7 +408,7 @@ def tela_desempenho(tela, usuario):
                 altura=resize(50),
                 cor_normal=cor_com_escala_cinza(150,150,150),
                 cor_hover=cor_com_escala_cinza(200,200,200),
-                fonte=pygame.font.SysFont("arial", resize(24, eh_X=True)),
+                fonte=asset_cache.carregar_sysfont("arial", resize(24, eh_X=True)),
                 tela=tela,
                 events=events,
                 imagem_fundo=None,
@@ -416,7 +420,7 @@ def tela_desempenho(tela, usuario):
 
             desenhar_texto(
                 f"Página {pagina_atual + 1}/{total_paginas}", 
-                pygame.font.SysFont("arial", resize(24)), 
+                asset_cache.carregar_sysfont("arial", resize(24)), 
                 COR_TEXTO,
                 tela, 
                 LARGURA_TELA // 2 - resize(70, eh_X=True),  # Posição X ajustada para centralizar
@@ -432,7 +436,7 @@ def tela_desempenho(tela, usuario):
                 altura=resize(50),
                 cor_normal=cor_com_escala_cinza(150,150,150),
                 cor_hover=cor_com_escala_cinza(200,200,200),
-                fonte=pygame.font.SysFont("arial", resize(24, eh_X=True)),
+                fonte=asset_cache.carregar_sysfont("arial", resize(24, eh_X=True)),
                 tela=tela,
                 events=events,
                 imagem_fundo=None,
@@ -469,4 +473,8 @@ def tela_desempenho(tela, usuario):
         if constants.ESCALA_CINZA:
             aplicar_filtro_cinza_superficie(tela)
             
-        pygame.display.update()
\ No newline at end of file
+        pygame.display.update()
+
+def tela_desempenho(tela, usuario):
+    """Executa cena_desempenho até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_desempenho(tela, usuario))
@@ -3,15 +3,19 @@ import sys
 import serial
 import serial.tools.list_ports
 import time
-from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img
+from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia
 from constants import FONTE_TITULO, FONTE_BOTAO, COR_TITULO, FONTE_TEXTO, COR_TEXTO
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
+from utils.protocolo_serial import (PROTOCOLO_TEXTO, PROTOCOLO_BINARIO, BAUD_TEXTO, BAUD_BINARIO,
+                                    montar_quadro, COMANDOS, DecodificadorBinario)
+from utils.serial_io import definir_protocolo
 
 def tela_selecao_porta(tela):
     """Tela para selecionar a porta do Arduino."""
     global PORTA_SELECIONADA
     clock = pygame.time.Clock()
+    from utils.audio_manager import audio_manager
     fonte_titulo = FONTE_TITULO
     fonte_botao = FONTE_BOTAO
     fonte_texto = FONTE_TEXTO
@@ -29,15 +33,24 @@ def tela_selecao_porta(tela):
     arduino_serial = None
     mensagem_status = None
     tempo_inicio_conexao = 0
+    # Etapa do handshake: "binario" (pedido do modo binário), "ping" (confirmação após trocar o baud)
+    # ou "texto" (handshake original, usado também com firmwares antigos)
+    etapa_conexao = None
+    tempo_inicio_etapa = 0
+    decodificador = None
     
     # Constantes de comunicação
     MENSAGEM_INICIO = b'INICIAR\n'    
     MENSAGEM_CONFIRMACAO = b'OK\n'   
+    MENSAGEM_INICIO_BINARIO = b'INICIAR:BIN\n'
+    MENSAGEM_CONFIRMACAO_BINARIO = b'OK:BIN\n'
     TIMEOUT_CONEXAO = 5              
+    TIMEOUT_ETAPA_BINARIA = 1.5  # Sem resposta: firmware antigo, cai para o protocolo de texto
 
     while True:
         events = pygame.event.get()
         clock.tick(FPS)
+        audio_manager.atualizar()
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -48,8 +61,9 @@ def tela_selecao_porta(tela):
                     globals()['PORTA_SELECIONADA'] = None
                     return None
 
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
 
@@ -67,11 +81,39 @@ def tela_selecao_porta(tela):
                     arduino_serial.close()
                     arduino_serial = None
             
+            # Firmware sem suporte ao modo binário não responde: repete o handshake de texto
+            elif etapa_conexao == "binario" and time.time() - tempo_inicio_etapa > TIMEOUT_ETAPA_BINARIA:
+                print("Firmware sem protocolo binário, usando protocolo de texto.")
+                arduino_serial.write(MENSAGEM_INICIO)
+                arduino_serial.flush()
+                etapa_conexao = "texto"
+                tempo_inicio_etapa = time.time()
+
+            # Após trocar o baud, espera o quadro OK em resposta ao PING
+            elif etapa_conexao == "ping" and arduino_serial.in_waiting > 0:
+                eventos = decodificador.alimentar(arduino_serial.read(arduino_serial.in_waiting))
+                if any(evento == "OK" for evento, _ in eventos):
+                    print(f"Protocolo binário ativo a {BAUD_BINARIO} baud.")
+                    definir_protocolo(arduino_serial, PROTOCOLO_BINARIO)
+                    from constants import PORTA_SELECIONADA
+                    globals()['PORTA_SELECIONADA'] = arduino_serial
+                    return arduino_serial
+
             # Tentar ler a confirmação do Arduino
-            elif arduino_serial and arduino_serial.in_waiting > 0:
+            elif etapa_conexao != "ping" and arduino_serial and arduino_serial.in_waiting > 0:
                 resposta = arduino_serial.readline()
                 print(f"Resposta do Arduino: {resposta}")
-                if resposta.strip() == MENSAGEM_CONFIRMACAO.strip():
+                if etapa_conexao == "binario" and resposta.strip() == MENSAGEM_CONFIRMACAO_BINARIO.strip():
+                    # O firmware já trocou de baud: troca também e confirma o link com um PING
+                    arduino_serial.baudrate = BAUD_BINARIO
+                    arduino_serial.reset_input_buffer()
+                    decodificador = DecodificadorBinario()
+                    arduino_serial.write(montar_quadro(COMANDOS["PING"]))
+                    arduino_serial.flush()
+                    etapa_conexao = "ping"
+                    tempo_inicio_etapa = time.time()
+                elif resposta.strip() == MENSAGEM_CONFIRMACAO.strip():
+                    definir_protocolo(arduino_serial, PROTOCOLO_TEXTO)
                     from constants import PORTA_SELECIONADA
                     globals()['PORTA_SELECIONADA'] = arduino_serial
                     return arduino_serial
@@ -153,12 +195,20 @@ def tela_selecao_porta(tela):
                 )
                 if clicou:
                     try:
-                        arduino_serial = serial.Serial(port, 9600, timeout=1)
+                        import constants
+                        arduino_serial = serial.Serial(port, BAUD_TEXTO, timeout=1)
                         time.sleep(2)  # Aguarda a inicialização da comunicação
-                        arduino_serial.write(MENSAGEM_INICIO)
+                        # Pede o protocolo binário; firmwares antigos ignoram o pedido
+                        if constants.PROTOCOLO_SERIAL == "texto":
+                            arduino_serial.write(MENSAGEM_INICIO)
+                            etapa_conexao = "texto"
+                        else:
+                            arduino_serial.write(MENSAGEM_INICIO_BINARIO)
+                            etapa_conexao = "binario"
                         arduino_serial.flush()
                         arduino_conectando = True
                         tempo_inicio_conexao = time.time()
+                        tempo_inicio_etapa = tempo_inicio_conexao
                         mensagem_status = None
                         print(f"Tentando conectar à porta {port}")
                     except Exception as e:
@@ -1,14 +1,14 @@
 import pygame
 import sys
-from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img
+from constants import BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia
 from constants import FONTE_TITULO, FONTE_BOTAO, COR_TITULO
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
 from utils.user_data import carregar_usuarios
+from utils.cenas import executar_cena
 
-def tela_rejogar(tela, usuario):
+def cena_rejogar(tela, usuario):
     """Tela para escolher qual nível rejogar."""
-    clock = pygame.time.Clock()
     fonte_titulo = FONTE_TITULO
     fonte_botao = FONTE_BOTAO
 
@@ -22,8 +22,7 @@ def tela_rejogar(tela, usuario):
     espacamento = resize(90)
 
     while True:
-        events = pygame.event.get()
-        clock.tick(FPS)
+        events = yield
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -32,8 +31,9 @@ def tela_rejogar(tela, usuario):
                 if event.key == pygame.K_ESCAPE:
                     return None
 
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
 
@@ -81,4 +81,8 @@ def tela_rejogar(tela, usuario):
         if constants.ESCALA_CINZA:
             aplicar_filtro_cinza_superficie(tela)
             
-        pygame.display.update()
\ No newline at end of file
+        pygame.display.update()
+
+def tela_rejogar(tela, usuario):
+    """Executa cena_rejogar até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_rejogar(tela, usuario))
@@ -1,14 +1,14 @@
 import pygame
 import sys
-from constants import (BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, background_img,
+from constants import (BUTTON_PATH, LARGURA_TELA, ALTURA_TELA, FPS, AZUL_CLARO, BACKGROUND_PATH, imagem_tela_cheia,
                      FONTE_TITULO, FONTE_BOTAO, FONTE_TEXTO, COR_TITULO, COR_TEXTO, PRETO)
 from utils.drawing import desenhar_texto, desenhar_botao, desenhar_texto_sombra, resize, aplicar_filtro_cinza_superficie
 from utils.colors import cor_com_escala_cinza
 from utils.user_data import carregar_usuarios, salvar_usuarios
+from utils.cenas import executar_cena
 
-def tela_escolha_usuario(tela):
+def cena_escolha_usuario(tela):
     """Tela para escolher ou criar um usuário."""
-    clock = pygame.time.Clock()
     fonte_titulo = FONTE_TITULO
     fonte_botao = FONTE_BOTAO
 
@@ -28,8 +28,7 @@ def tela_escolha_usuario(tela):
 
 
     while True:
-        events = pygame.event.get()
-        clock.tick(FPS)
+        events = yield
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -40,8 +39,9 @@ def tela_escolha_usuario(tela):
                     sys.exit()
                 
 
-        if background_img:
-            tela.blit(background_img, (0, 0))
+        fundo = imagem_tela_cheia(BACKGROUND_PATH)
+        if fundo:
+            tela.blit(fundo, (0, 0))
         else:
             tela.fill(AZUL_CLARO)
 
@@ -123,4 +123,8 @@ def tela_escolha_usuario(tela):
         if constants.ESCALA_CINZA:
             aplicar_filtro_cinza_superficie(tela)
 
-        pygame.display.update()
\ No newline at end of file
+        pygame.display.update()
+
+def tela_escolha_usuario(tela):
+    """Executa cena_escolha_usuario até o fim (para quem chama a tela como função)."""
+    return executar_cena(cena_escolha_usuario(tela))
@@ -3,10 +3,42 @@ import time
 import math
 import os
 from utils.user_data import carregar_usuarios, salvar_usuarios
+from utils.estatisticas import obter_estatisticas
 from utils.drawing import resize
+from utils.asset_cache import asset_cache
+
+# Métricas usadas pelas regras das conquistas: função(estatisticas, dados) -> valor.
+# `estatisticas` é o índice de utils.estatisticas e `dados` traz a partida que acabou de terminar
+# (nivel_atual, concluido, vidas_iniciais, vidas_restantes, qtes_acertados...). Métricas de uma partida
+# retornam None quando não há partida (por exemplo, ao montar o HUD no início do nível).
+METRICAS = {
+    'niveis_completados': lambda e, d: len(e.niveis_completados),
+    'total_jogos': lambda e, d: e.total_jogos,
+    'tentativas_nivel': lambda e, d: e.tentativas_por_nivel[d.get('nivel_atual', 1)],
+    'melhor_tempo': lambda e, d: e.melhor_tempo,
+    'conclusoes_com_2_vidas': lambda e, d: e.vidas_restantes[2],
+    'qtes_acertados': lambda e, d: d.get('qtes_acertados', 0),
+    'vidas_perdidas': lambda e, d: (d.get('vidas_iniciais', 3) - d.get('vidas_restantes', 0)
+                                    if d.get('concluido') else None),
+    'venceu_motores_aleatorios': lambda e, d: (bool(d.get('motores_aleatorios'))
+                                               if d.get('concluido') else None),
+}
+
+COMPARACOES = {
+    '>=': lambda valor, meta: valor >= meta,
+    '<': lambda valor, meta: valor < meta,
+    '==': lambda valor, meta: valor == meta,
+}
+
 
 class SistemaConquistas:
-    """Sistema de gerenciamento de conquistas do jogo"""
+    """
+    Sistema de gerenciamento de conquistas do jogo.
+    Cada conquista declara uma 'regra': a métrica de que depende (ver METRICAS), a comparação
+    (padrão '>=') e a meta. O bloco opcional 'proxima' define quando ela aparece no HUD de conquistas
+    próximas ('a_partir'), com progresso calculado pela própria regra ou fixo ('progresso'). Uma nova
+    conquista só precisa de uma entrada em self.conquistas (e, se for o caso, de uma nova métrica).
+    """
     
     def __init__(self):
         self.conquistas = {
@@ -14,60 +46,75 @@ class SistemaConquistas:
                 'nome': 'Fio de Ariadne', 
                 'descricao': 'Complete seu primeiro nível com sucesso',
                 'icone': 'Labirinto_game/assets/images/achievements/Fio_de_Ariadne.png',
+                'regra': {'metrica': 'niveis_completados', 'meta': 1},
                 'desbloqueada': False
             },
             'coragem_de_teseu': {
                 'nome': 'Coragem de Teseu', 
                 'descricao': 'Complete um nível sem perder nenhuma vida',
                 'icone': 'Labirinto_game/assets/images/achievements/Coragem_de_Teseu.png',
+                'regra': {'metrica': 'vidas_perdidas', 'comparacao': '==', 'meta': 0,
+                          'proxima': {'metrica': 'conclusoes_com_2_vidas', 'a_partir': 1,
+                                      'progresso': 0.7, 'meta': "3 vidas", 'atual': "2 vidas"}},
                 'desbloqueada': False
             },
             'despertar_da_furia': {
                 'nome': 'Despertar da Fúria', 
                 'descricao': 'Complete um nível após perder 2 vidas',
                 'icone': 'Labirinto_game/assets/images/achievements/Despertar_da_Furia.png',
+                'regra': {'metrica': 'vidas_perdidas', 'meta': 2,
+                          'proxima': {'metrica': 'conclusoes_com_2_vidas', 'a_partir': 1,
+                                      'progresso': 0.5, 'meta': "Perder 2 vidas", 'atual': "Perdeu 1 vida"}},
                 'desbloqueada': False
             },
             'domador_do_labirinto': {
                 'nome': 'Domador do Labirinto', 
                 'descricao': 'Complete 5 fases diferentes',
                 'icone': 'Labirinto_game/assets/images/achievements/Domador_do_Labirinto.png',
+                'regra': {'metrica': 'niveis_completados', 'meta': 5, 'proxima': {'a_partir': 3}},
                 'desbloqueada': False
             },
             'renascido': {
                 'nome': 'Renascido', 
                 'descricao': 'Tente a mesma fase 7 vezes consecutivas',
                 'icone': 'Labirinto_game/assets/images/achievements/Renascido.png',
+                'regra': {'metrica': 'tentativas_nivel', 'meta': 7, 'proxima': {'a_partir': 3}},
                 'desbloqueada': False
             },
             'heroi_de_atenas': {
                 'nome': 'Herói de Atenas', 
                 'descricao': 'Complete todas as fases do jogo',
                 'icone': 'Labirinto_game/assets/images/achievements/Heroi_de_Atenas.png',
+                'regra': {'metrica': 'niveis_completados', 'meta': 8, 'proxima': {'a_partir': 7}},
                 'desbloqueada': False
             },
             'velocista_olimpico': {
                 'nome': 'Velocista Olímpico', 
                 'descricao': 'Completar um nível em menos de 10 segundos',
                 'icone': 'Labirinto_game/assets/images/achievements/Velocista_Olimpico.png',  
+                'regra': {'metrica': 'melhor_tempo', 'comparacao': '<', 'meta': 10,
+                          'proxima': {'a_partir': 15, 'meta': "10s", 'formato': "{:.1f}s"}},
                 'desbloqueada': False
             },
             'mestre_dos_servos': {
                 'nome': 'Mestre dos Servos', 
                 'descricao': 'Vencer uma fase com movimentação aleatória dos motores ativada',
                 'icone': 'Labirinto_game/assets/images/achievements/Mestre_dos_Servos.png',
+                'regra': {'metrica': 'venceu_motores_aleatorios', 'comparacao': '==', 'meta': True},
                 'desbloqueada': False
             },
             'pegadas_de_bronze': {
                 'nome': 'Pegadas de Bronze', 
                 'descricao': 'Jogue o jogo 50 vezes',
                 'icone': 'Labirinto_game/assets/images/achievements/Pegadas_de_Bronze.png',
+                'regra': {'metrica': 'total_jogos', 'meta': 50, 'proxima': {'a_partir': 25}},
                 'desbloqueada': False
             },
             'mestre_dos_botoes': {
                 'nome': 'Mestre dos Botões', 
                 'descricao': 'Complete 10 QTEs sem erros',
                 'icone': 'Labirinto_game/assets/images/achievements/Mestre_dos_Botoes.png',
+                'regra': {'metrica': 'qtes_acertados', 'meta': 10, 'proxima': {'a_partir': 1}},
                 'desbloqueada': False
             }
         }
@@ -76,8 +123,15 @@ class SistemaConquistas:
         self.notificacao_texto = []
         self.notificacao_inicio = 0
         self.notificacao_duracao = 5
-        self.fonte_notificacao = pygame.font.SysFont("comicsansms", resize(30, eh_X=True))
+        self.fonte_notificacao = asset_cache.carregar_sysfont("comicsansms", resize(30, eh_X=True))
         self.conquistas_recentes = []
+        # Notificações pré-renderizadas (texto -> camadas) e sprites das partículas (raio -> superfície)
+        self._camadas_notificacao = {}
+        self._particulas = {}
+
+        # Avaliação incremental: cada regra só é recalculada quando o valor da sua métrica muda
+        self._usuario_avaliado = None
+        self._avaliacoes = {}  # chave -> (valores das métricas usadas, resultado)
     
     def carregar_conquistas_usuario(self, usuario):
         """Carrega as conquistas do usuário"""
@@ -104,80 +158,87 @@ class SistemaConquistas:
             
             salvar_usuarios(usuarios_data)
     
+    def _avaliar_regra(self, regra, valor, valor_proxima):
+        """Retorna (atingida, item para o HUD de conquistas próximas ou None)."""
+        comparacao = regra.get('comparacao', '>=')
+        atingida = valor is not None and COMPARACOES[comparacao](valor, regra['meta'])
+
+        proxima = regra.get('proxima')
+        if atingida or proxima is None or valor_proxima is None:
+            return atingida, None
+        comparacao_proxima = '<' if comparacao == '<' and 'metrica' not in proxima else '>='
+        if not COMPARACOES[comparacao_proxima](valor_proxima, proxima['a_partir']):
+            return atingida, None
+
+        if 'progresso' in proxima:
+            progresso = proxima['progresso']
+        elif comparacao_proxima == '<':
+            progresso = (proxima['a_partir'] - valor_proxima) / (proxima['a_partir'] - regra['meta'])
+        else:
+            progresso = min(1.0, valor_proxima / regra['meta'])
+        if 'atual' in proxima:
+            atual = proxima['atual']
+        elif 'formato' in proxima:
+            atual = proxima['formato'].format(valor_proxima)
+        else:
+            atual = valor_proxima
+        return atingida, {'progresso': progresso, 'meta': proxima.get('meta', regra['meta']), 'atual': atual}
+
+    def avaliar_regras(self, usuario, estatisticas, dados):
+        """
+        Avalia as regras das conquistas ainda bloqueadas e retorna {chave: (atingida, item_proxima)}.
+        Cada métrica é calculada uma única vez por avaliação, e a regra só é reavaliada se o valor
+        das métricas de que depende mudou desde a última vez.
+        """
+        if usuario != self._usuario_avaliado:
+            self._usuario_avaliado = usuario
+            self._avaliacoes = {}
+
+        valores = {}
+
+        def metrica(nome):
+            if nome not in valores:
+                valores[nome] = METRICAS[nome](estatisticas, dados)
+            return valores[nome]
+
+        resultados = {}
+        for chave, conquista in self.conquistas.items():
+            regra = conquista.get('regra')
+            if regra is None or conquista['desbloqueada']:
+                continue
+            proxima = regra.get('proxima') or {}
+            entrada = (metrica(regra['metrica']), metrica(proxima.get('metrica', regra['metrica'])))
+
+            anterior = self._avaliacoes.get(chave)
+            if anterior is not None and anterior[0] == entrada:
+                resultados[chave] = anterior[1]
+                continue
+            resultado = self._avaliar_regra(regra, *entrada)
+            self._avaliacoes[chave] = (entrada, resultado)
+            resultados[chave] = resultado
+        return resultados
+
+    def conquistas_proximas(self, usuario, estatisticas, dados, limite=3):
+        """Conquistas bloqueadas mais próximas de serem desbloqueadas, para o HUD do jogo."""
+        proximas = []
+        for chave, (_, item) in self.avaliar_regras(usuario, estatisticas, dados).items():
+            if item is not None:
+                proximas.append(dict(item, chave=chave, nome=self.conquistas[chave]['nome']))
+        # Maiores progressos primeiro
+        proximas.sort(key=lambda c: c['progresso'], reverse=True)
+        return proximas[:limite]
+
     def verificar_conquistas(self, usuario, dados_jogo):
         """Verifica se alguma conquista foi desbloqueada"""
         self.carregar_conquistas_usuario(usuario)
         conquistas_desbloqueadas = []
-        
-        # Fio de Ariadne - Complete seu primeiro nível com sucesso
-        niveis_completados = [t for t in dados_jogo.get('tentativas', []) if t.get('vidas', 0) > 0]
-        if not self.conquistas['fio_de_ariadne']['desbloqueada'] and len(niveis_completados) >= 1:
-            self.conquistas['fio_de_ariadne']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('fio_de_ariadne')
-            print("Conquista FIO DE ARIADNE desbloqueada!")
-        
-        # Coragem de Teseu - Complete um nível sem perder nenhuma vida
-        nivel_atual = dados_jogo.get('nivel_atual', 1)
-        vidas_atuais = dados_jogo.get('vidas_restantes', 0)
-        vidas_iniciais = dados_jogo.get('vidas_iniciais', 3)
-        if not self.conquistas['coragem_de_teseu']['desbloqueada'] and dados_jogo.get('concluido') and vidas_atuais == vidas_iniciais:
-            self.conquistas['coragem_de_teseu']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('coragem_de_teseu')
-            print("Conquista CORAGEM DE TESEU desbloqueada!")
-        
-        # Despertar da Fúria - Complete um nível após perder 2 vidas
-        if not self.conquistas['despertar_da_furia']['desbloqueada'] and dados_jogo.get('concluido') and vidas_iniciais - vidas_atuais >= 2:
-            self.conquistas['despertar_da_furia']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('despertar_da_furia')
-            print("Conquista DESPERTAR DA FÚRIA desbloqueada!")
-        
-        # Domador do Labirinto - Complete 5 fases diferentes
-        niveis_diferentes_completados = set(t.get('nivel') for t in dados_jogo.get('tentativas', []) if t.get('vidas', 0) > 0)
-        if not self.conquistas['domador_do_labirinto']['desbloqueada'] and len(niveis_diferentes_completados) >= 5:
-            self.conquistas['domador_do_labirinto']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('domador_do_labirinto')
-            print("Conquista DOMADOR DO LABIRINTO desbloqueada!")
-        
-        # Renascido - Tente a mesma fase 7 vezes consecutivas
-        nivel_atual = dados_jogo.get('nivel_atual', 1)
-        tentativas_nivel = [t for t in dados_jogo.get('tentativas', []) if t.get('nivel') == nivel_atual]
-        if not self.conquistas['renascido']['desbloqueada'] and len(tentativas_nivel) >= 7:
-            self.conquistas['renascido']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('renascido')
-            print("Conquista RENASCIDO desbloqueada!")
-        
-        # Herói de Atenas - Complete todas as fases do jogo
-        total_niveis = dados_jogo.get('total_niveis', 8)
-        if not self.conquistas['heroi_de_atenas']['desbloqueada'] and len(niveis_diferentes_completados) >= total_niveis:
-            self.conquistas['heroi_de_atenas']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('heroi_de_atenas')
-            print("Conquista HERÓI DE ATENAS desbloqueada!")
-        
-        # Velocista Olímpico - Completar um nível em menos de 10 segundos
-        if not self.conquistas['velocista_olimpico']['desbloqueada'] and dados_jogo.get('tempo_gasto', 999) < 10 and dados_jogo.get('concluido'):
-            self.conquistas['velocista_olimpico']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('velocista_olimpico')
-            print("Conquista VELOCISTA OLÍMPICO desbloqueada!")
-        
-        # Mestre dos Servos - Vencer uma fase com movimentação aleatória dos motores ativada
-        if not self.conquistas['mestre_dos_servos']['desbloqueada'] and dados_jogo.get('concluido') and dados_jogo.get('motores_aleatorios'):
-            self.conquistas['mestre_dos_servos']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('mestre_dos_servos')
-            print("Conquista MESTRE DOS SERVOS desbloqueada!")
-        
-        # Pegadas de Bronze - Jogue o jogo 50 vezes
-        total_jogos = len(dados_jogo.get('tentativas', []))
-        if not self.conquistas['pegadas_de_bronze']['desbloqueada'] and total_jogos >= 50:
-            self.conquistas['pegadas_de_bronze']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('pegadas_de_bronze')
-            print("Conquista PEGADAS DE BRONZE desbloqueada!")
-        
-        # Mestre dos Botões - Complete 10 QTEs sem erros
-        qtes_acertados = dados_jogo.get('qtes_acertados', 0)
-        if not self.conquistas['mestre_dos_botoes']['desbloqueada'] and qtes_acertados >= 10:
-            self.conquistas['mestre_dos_botoes']['desbloqueada'] = True
-            conquistas_desbloqueadas.append('mestre_dos_botoes')
-            print("Conquista MESTRE DOS BOTÕES desbloqueada!")
+        estatisticas = obter_estatisticas(usuario, dados_jogo.get('tentativas', []))
+
+        for chave, (atingida, _) in self.avaliar_regras(usuario, estatisticas, dados_jogo).items():
+            if atingida:
+                self.conquistas[chave]['desbloqueada'] = True
+                conquistas_desbloqueadas.append(chave)
+                print(f"Conquista {self.conquistas[chave]['nome'].upper()} desbloqueada!")
         
         self.salvar_conquistas_usuario(usuario)
         
@@ -195,15 +256,107 @@ class SistemaConquistas:
         self.notificacao_ativa = True
         self.notificacao_texto.append(texto)
         self.notificacao_inicio = time.time()
+        # Renderiza a notificação agora, fora do caminho de desenho dos quadros
+        self._obter_camadas_notificacao(texto)
         
         audio_manager.set_sound_volume("achievement", 0.4)
-        pygame.time.delay(100)
         audio_manager.play_sound("achievement")
 
+    def _obter_camadas_notificacao(self, texto):
+        """
+        Retorna as camadas pré-renderizadas da notificação: (fundo com ícone e textos, borda dourada).
+        São montadas uma única vez por texto; a cada quadro só mudam posição, transparência e partículas.
+        """
+        camadas = self._camadas_notificacao.get(texto)
+        if camadas is not None:
+            return camadas
+
+        largura_notificacao = resize(700, eh_X=True)
+        altura_notificacao = resize(100)
+
+        # Extrai a chave da conquista do texto
+        chave_conquista = None
+        for chave in self.conquistas:
+            if self.conquistas[chave]['nome'] in texto:
+                chave_conquista = chave
+                break
+
+        notificacao_surface = pygame.Surface((largura_notificacao, altura_notificacao), pygame.SRCALPHA)
+
+        # Fundo gradiente com cantos arredondados
+        gradiente_surface = pygame.Surface((largura_notificacao, altura_notificacao), pygame.SRCALPHA)
+        for i in range(altura_notificacao):
+            cor = (40, 40, 60, 200 * (i / altura_notificacao))
+            pygame.draw.line(gradiente_surface, cor, (0, i), (largura_notificacao, i))
+        
+        # Criar uma máscara com cantos arredondados
+        mascara = pygame.Surface((largura_notificacao, altura_notificacao), pygame.SRCALPHA)
+        pygame.draw.rect(mascara, (255, 255, 255, 255), 
+                        pygame.Rect(0, 0, largura_notificacao, altura_notificacao), 
+                        border_radius=resize(15))
+        mascara.blit(gradiente_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        notificacao_surface.blit(mascara, (0, 0))
+        
+        # Desenha fundo principal
+        pygame.draw.rect(notificacao_surface, (20, 20, 40, 230), 
+                         (resize(3, eh_X=True), resize(3), largura_notificacao-resize(6, eh_X=True), altura_notificacao-resize(6)), 
+                         border_radius=resize(13))
+
+        # A borda fica em uma camada própria, com o brilho pulsante aplicado por transparência
+        pygame.draw.rect(notificacao_surface, (0, 0, 0, 0), 
+                         (0, 0, largura_notificacao, altura_notificacao), 
+                         width=resize(3), border_radius=resize(15))
+        borda_surface = pygame.Surface((largura_notificacao, altura_notificacao), pygame.SRCALPHA)
+        pygame.draw.rect(borda_surface, (255, 215, 0, 255), 
+                         (0, 0, largura_notificacao, altura_notificacao), 
+                         width=resize(3), border_radius=resize(15))
+        
+        # Ícone da conquista
+        if chave_conquista and chave_conquista in self.conquistas:
+            icone_path = self.conquistas[chave_conquista].get('icone')
+            if icone_path and os.path.exists(icone_path):
+                try:
+                    icone = asset_cache.carregar_imagem(icone_path, (resize(80, eh_X=True), resize(80)))
+                    
+                    glow_surface = pygame.Surface((resize(96, eh_X=True), resize(96)), pygame.SRCALPHA)
+                    for raio in range(resize(8), 0, -resize(2)):
+                        pygame.draw.circle(glow_surface, (255, 215, 0, 15), (resize(48, eh_X=True), resize(48)), resize(40) + raio)
+                    notificacao_surface.blit(glow_surface, (resize(10, eh_X=True), altura_notificacao//2 - resize(48)))
+                    notificacao_surface.blit(icone, (resize(18, eh_X=True), altura_notificacao//2 - resize(40)))
+                except Exception as e:
+                    print(f"Erro ao carregar ícone: {e}")
+        
+        # Texto "CONQUISTA DESBLOQUEADA!"
+        fonte_titulo = asset_cache.carregar_sysfont("comicsansms", resize(22, eh_X=True), negrito=True)
+        texto_titulo = fonte_titulo.render("CONQUISTA DESBLOQUEADA!", True, (255, 215, 0))
+        notificacao_surface.blit(texto_titulo, (resize(120, eh_X=True), resize(15)))
+        
+        # Nome da conquista
+        nome_conquista = texto.replace("Conquista desbloqueada: ", "")
+        fonte_conquista = asset_cache.carregar_sysfont("comicsansms", resize(28, eh_X=True))
+        texto_conquista = fonte_conquista.render(nome_conquista, True, (255, 255, 255))
+        notificacao_surface.blit(texto_conquista, (resize(120, eh_X=True), resize(45)))
+
+        camadas = (notificacao_surface, borda_surface)
+        self._camadas_notificacao[texto] = camadas
+        return camadas
+
+    def _obter_particula(self, raio):
+        """Sprite de uma partícula de brilho com o raio informado (criado uma vez por raio)."""
+        particula = self._particulas.get(raio)
+        if particula is None:
+            particula = pygame.Surface((raio * 2 + 1, raio * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(particula, (255, 255, 200, 255), (raio, raio), raio)
+            self._particulas[raio] = particula
+        return particula
+
     def desenhar_notificacao(self, tela):
-        """Desenha a notificação de conquista na tela com efeitos visuais aprimorados"""
+        """
+        Desenha a notificação de conquista na tela com efeitos visuais aprimorados.
+        Retorna o retângulo da área desenhada, ou None se nada foi desenhado.
+        """
         if not self.notificacao_ativa or not self.notificacao_texto:
-            return
+            return None
 
         tempo_decorrido = time.time() - self.notificacao_inicio
         if tempo_decorrido > self.notificacao_duracao:
@@ -212,7 +365,7 @@ class SistemaConquistas:
             if self.notificacao_texto:  # Se ainda há notificações na fila
                 self.notificacao_inicio = time.time()
                 self.notificacao_ativa = True
-            return
+            return None
         
         largura_tela, altura_tela = tela.get_size()
         altura_notificacao = resize(100)
@@ -229,98 +382,46 @@ class SistemaConquistas:
         # Efeito de opacidade
         opacidade = int(255 * progresso * (1.0 - progresso_saida))
         
+        # Efeito pulsante
+        pulso = 0.5 + 0.5 * math.sin(time.time() * 5)
+        alpha_brilho = int(120 * pulso * (1.0 - progresso_saida) * opacidade / 255)
+        alpha_particulas = int(100 * pulso * opacidade / 255)
+        tempo_atual = pygame.time.get_ticks() / 1000.0
+        
         y_offset = 0
+        area_desenhada = None
         for index, texto in enumerate(self.notificacao_texto):
             if not texto:
                 continue
                 
-            # Extrai a chave da conquista do texto
-            chave_conquista = None
-            for chave in self.conquistas:
-                if self.conquistas[chave]['nome'] in texto:
-                    chave_conquista = chave
-                    break
+            fundo, borda = self._obter_camadas_notificacao(texto)
             
             # Posição base da notificação
             x = (largura_tela - largura_notificacao) // 2
             y = resize(80) + y_offset + deslocamento_y
             
-            notificacao_surface = pygame.Surface((largura_notificacao, altura_notificacao), pygame.SRCALPHA)
-            
-            # Fundo gradiente com cantos arredondados
-            gradiente_surface = pygame.Surface((largura_notificacao, altura_notificacao), pygame.SRCALPHA)
-            for i in range(altura_notificacao):
-                cor = (40, 40, 60, min(200, opacidade) * (i / altura_notificacao))
-                pygame.draw.line(gradiente_surface, cor, (0, i), (largura_notificacao, i))
-            
-            # Criar uma máscara com cantos arredondados
-            mascara = pygame.Surface((largura_notificacao, altura_notificacao), pygame.SRCALPHA)
-            pygame.draw.rect(mascara, (255, 255, 255, 255), 
-                            pygame.Rect(0, 0, largura_notificacao, altura_notificacao), 
-                            border_radius=resize(15))
-            
-            # Aplicar a máscara ao gradiente para criar o gradiente com cantos arredondados
-            gradiente_final = pygame.Surface((largura_notificacao, altura_notificacao), pygame.SRCALPHA)
-            gradiente_final.blit(mascara, (0, 0))
-            gradiente_final.blit(gradiente_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            
-            notificacao_surface.blit(gradiente_final, (0, 0))
-            
-            # Borda
-            pygame.draw.rect(notificacao_surface, (255, 215, 0, opacidade), 
-                             (0, 0, largura_notificacao, altura_notificacao), 
-                             width=resize(3), border_radius=resize(15))
-            
-            # Desenha fundo principal
-            pygame.draw.rect(notificacao_surface, (20, 20, 40, min(230, opacidade)), 
-                             (resize(3, eh_X=True), resize(3), largura_notificacao-resize(6, eh_X=True), altura_notificacao-resize(6)), 
-                             border_radius=resize(13))
-            
-            # Efeito pulsante
-            pulso = 0.5 + 0.5 * math.sin(time.time() * 5)
-            cor_brilho = (255, 215, 0, int(120 * pulso * (1.0 - progresso_saida)))
-            pygame.draw.rect(notificacao_surface, cor_brilho, 
-                             (0, 0, largura_notificacao, altura_notificacao), 
-                             width=resize(3), border_radius=resize(15))
-            
-            # Ícone da conquista
-            if chave_conquista and chave_conquista in self.conquistas:
-                icone_path = self.conquistas[chave_conquista].get('icone')
-                if icone_path and os.path.exists(icone_path):
-                    try:
-                        icone = pygame.image.load(icone_path).convert_alpha()
-                        icone = pygame.transform.scale(icone, (resize(80, eh_X=True), resize(80)))
-                        
-                        glow_surface = pygame.Surface((resize(96, eh_X=True), resize(96)), pygame.SRCALPHA)
-                        for raio in range(resize(8), 0, -resize(2)):
-                            pygame.draw.circle(glow_surface, (255, 215, 0, 15), (resize(48, eh_X=True), resize(48)), resize(40) + raio)
-                        notificacao_surface.blit(glow_surface, (resize(10, eh_X=True), altura_notificacao//2 - resize(48)))
-                        notificacao_surface.blit(icone, (resize(18, eh_X=True), altura_notificacao//2 - resize(40)))
-                    except Exception as e:
-                        print(f"Erro ao carregar ícone: {e}")
-            
-            # Texto "CONQUISTA DESBLOQUEADA!"
-            fonte_titulo = pygame.font.SysFont("comicsansms", resize(22, eh_X=True), bold=True)
-            texto_titulo = fonte_titulo.render("CONQUISTA DESBLOQUEADA!", True, (255, 215, 0))
-            notificacao_surface.blit(texto_titulo, (resize(120, eh_X=True), resize(15)))
-            
-            # Nome da conquista
-            nome_conquista = texto.replace("Conquista desbloqueada: ", "")
-            fonte_conquista = pygame.font.SysFont("comicsansms", resize(28, eh_X=True))
-            texto_conquista = fonte_conquista.render(nome_conquista, True, (255, 255, 255))
-            notificacao_surface.blit(texto_conquista, (resize(120, eh_X=True), resize(45)))
+            fundo.set_alpha(opacidade)
+            rect_notificacao = tela.blit(fundo, (x, y))
+            borda.set_alpha(alpha_brilho)
+            tela.blit(borda, (x, y))
             
             # Efeitos de partículas
-            tempo_atual = pygame.time.get_ticks() / 1000.0
             for i in range(10):
                 pos_x = resize(120, eh_X=True) + int(resize(300, eh_X=True) * math.sin(tempo_atual * 2 + i * 0.5))
                 pos_y = resize(45) + int(resize(10) * math.cos(tempo_atual * 3 + i * 0.7))
                 raio = resize(2) + int(resize(2) * math.sin(tempo_atual * 4 + i))
-                pygame.draw.circle(notificacao_surface, (255, 255, 200, int(100 * pulso)), 
-                                  (pos_x % largura_notificacao, pos_y), raio)
+                if raio <= 0:
+                    continue
+                # Mantém a partícula dentro da notificação (a área redesenhada é só o retângulo dela)
+                pos_x = min(max(pos_x % largura_notificacao, raio), largura_notificacao - raio - 1)
+                particula = self._obter_particula(raio)
+                particula.set_alpha(alpha_particulas)
+                tela.blit(particula, (x + pos_x - raio, y + pos_y - raio))
             
-            tela.blit(notificacao_surface, (x, y))
+            area_desenhada = rect_notificacao if area_desenhada is None else area_desenhada.union(rect_notificacao)
             y_offset += altura_notificacao + resize(10)
+
+        return area_desenhada
                 
     def limpar_notificacoes(self):
         """Limpa todas as notificações pendentes e desativa a notificação atual"""
@@ -0,0 +1,274 @@
+import hashlib
+import os
+import threading
+import pygame
+from collections import OrderedDict
+
+VERSAO_CACHE_DISCO = 1
+
+
+class FontePreguicosa:
+    """
+    Fonte de arquivo que só é carregada no primeiro uso (render, size, get_height...).
+    Permite declarar as fontes em constants.py sem abrir os arquivos na importação.
+    """
+
+    def __init__(self, cache, arquivo, tamanho, negrito=False):
+        self._cache = cache
+        self._argumentos = (arquivo, tamanho, negrito)
+        self._fonte = None
+
+    def __getattr__(self, nome):
+        if self._fonte is None:
+            self._fonte = self._cache.carregar_fonte(*self._argumentos)
+        return getattr(self._fonte, nome)
+
+
+class AssetCache:
+    """Cache global de imagens, superfícies redimensionadas e fontes, com descarte LRU e limite de memória."""
+
+    def __init__(self, limite_memoria_mb=192, limite_fontes=64):
+        self.limite_memoria = limite_memoria_mb * 1024 * 1024
+        self.limite_fontes = limite_fontes
+        self.memoria_usada = 0
+
+        # chave -> (superfície, bytes estimados); a ordem do dicionário é a ordem de uso (LRU)
+        self.superficies = OrderedDict()
+        self.fontes = OrderedDict()
+        # (nome, negrito, itálico) -> (arquivo, negrito sintético, itálico sintético) das fontes do sistema
+        self.caminhos_sysfont = {}
+        # Imagens são pré-carregadas em segundo plano (utils/cenas.py, utils/precarregador.py) enquanto o loop usa o cache
+        self._trava = threading.Lock()
+
+        # Cache em disco das imagens já redimensionadas (ver configurar_disco)
+        self.pasta_disco = None
+        self._hashes_fonte = {}  # caminho -> (mtime, tamanho do arquivo, hash do conteúdo)
+        self._dimensoes = {}  # caminho -> (largura, altura) do arquivo original
+        self._arquivos_disco_usados = set()  # Arquivos do cache em disco lidos ou gravados nesta execução
+
+    @staticmethod
+    def _tamanho_em_bytes(superficie):
+        """Estima a memória ocupada pelos pixels de uma superfície."""
+        return superficie.get_width() * superficie.get_height() * superficie.get_bytesize()
+
+    def _guardar(self, chave, superficie):
+        """Guarda uma superfície no cache e descarta as menos usadas se o limite for excedido."""
+        tamanho = self._tamanho_em_bytes(superficie)
+        if chave in self.superficies:
+            self.memoria_usada -= self.superficies.pop(chave)[1]
+        self.superficies[chave] = (superficie, tamanho)
+        self.memoria_usada += tamanho
+
+        # Nunca descarta a superfície recém-inserida, mesmo que ela sozinha passe do limite
+        while self.memoria_usada > self.limite_memoria and len(self.superficies) > 1:
+            _, (_, tamanho_antigo) = self.superficies.popitem(last=False)
+            self.memoria_usada -= tamanho_antigo
+
+    def obter_superficie(self, chave, construtor):
+        """
+        Retorna a superfície associada à chave, criando-a com construtor() se não estiver no cache.
+        As superfícies retornadas são compartilhadas e não devem ser modificadas por quem as recebe.
+        """
+        with self._trava:
+            item = self.superficies.get(chave)
+            if item is not None:
+                self.superficies.move_to_end(chave)
+                return item[0]
+        # Constrói fora da trava: o loop do jogo não espera uma imagem que outra thread está decodificando
+        superficie = construtor()
+        with self._trava:
+            item = self.superficies.get(chave)
+            if item is not None:
+                # Outra thread construiu a mesma superfície enquanto isso: mantém a primeira
+                return item[0]
+            self._guardar(chave, superficie)
+        return superficie
+
+    def configurar_disco(self, pasta):
+        """
+        Ativa o cache em disco das imagens redimensionadas: cada uma é gravada já no tamanho da tela, em pixels
+        brutos, com chave pelo hash do arquivo de origem e pelo tamanho. Nas próximas execuções (na mesma
+        resolução) ela é lida direto do disco, sem decodificar o PNG original nem redimensionar.
+        Ao gravar uma imagem, as versões antigas dela (outro hash ou tamanho, mesmo modo) são apagadas.
+        """
+        self.pasta_disco = pasta
+
+    def _hash_fonte(self, caminho):
+        """Hash do conteúdo do arquivo de origem (recalculado só se o arquivo mudar)."""
+        info = os.stat(caminho)
+        registro = self._hashes_fonte.get(caminho)
+        if registro is None or registro[:2] != (info.st_mtime_ns, info.st_size):
+            with open(caminho, "rb") as f:
+                resumo = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+            registro = (info.st_mtime_ns, info.st_size, resumo)
+            self._hashes_fonte[caminho] = registro
+        return registro[2]
+
+    def _arquivo_disco(self, caminho, tamanho, modo):
+        nome = os.path.splitext(os.path.basename(caminho))[0]
+        return os.path.join(self.pasta_disco,
+                            f"{nome}_{self._hash_fonte(caminho)}_{tamanho[0]}x{tamanho[1]}_{modo or 'original'}.px")
+
+    def _ler_disco(self, arquivo, tamanho, modo):
+        """Lê uma imagem gravada por _gravar_disco; retorna None se não existir ou estiver inválida."""
+        try:
+            with open(arquivo, "rb") as f:
+                versao, largura, altura, formato = f.readline().decode("ascii").split()
+                dados = f.read()
+            if int(versao) != VERSAO_CACHE_DISCO or (int(largura), int(altura)) != tamanho:
+                return None
+            imagem = pygame.image.frombytes(dados, tamanho, formato)
+        except (OSError, ValueError, pygame.error):
+            return None
+        if modo == "alpha":
+            return imagem.convert_alpha()
+        if modo == "opaco":
+            return imagem.convert()
+        return imagem
+
+    def _gravar_disco(self, arquivo, imagem):
+        formato = "RGBA" if imagem.get_flags() & pygame.SRCALPHA else "RGB"
+        temporario = f"{arquivo}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.pasta_disco, exist_ok=True)
+            with open(temporario, "wb") as f:
+                f.write(f"{VERSAO_CACHE_DISCO} {imagem.get_width()} {imagem.get_height()} {formato}\n".encode("ascii"))
+                f.write(pygame.image.tobytes(imagem, formato))
+            os.replace(temporario, arquivo)
+        except OSError as e:
+            print(f"Erro ao gravar imagem no cache em disco: {e}")
+            return
+        self._arquivos_disco_usados.add(arquivo)
+        self._podar_disco(arquivo)
+
+    def _podar_disco(self, arquivo):
+        """
+        Apaga as outras versões da imagem gravada em arquivo (mesmo nome e modo, outro hash ou tamanho),
+        exceto as usadas nesta execução, já que uma imagem pode ser desenhada em mais de um tamanho.
+        """
+        nome, _, _, sufixo = os.path.basename(arquivo).rsplit("_", 3)
+        try:
+            entradas = os.listdir(self.pasta_disco)
+        except OSError:
+            return
+        for entrada in entradas:
+            partes = entrada.rsplit("_", 3)
+            caminho = os.path.join(self.pasta_disco, entrada)
+            if len(partes) != 4 or partes[0] != nome or partes[3] != sufixo or caminho in self._arquivos_disco_usados:
+                continue
+            try:
+                os.remove(caminho)
+            except OSError as e:
+                print(f"Erro ao apagar imagem antiga do cache em disco: {e}")
+
+    @staticmethod
+    def _carregar_arquivo(caminho, modo):
+        imagem = pygame.image.load(caminho)
+        if modo == "alpha":
+            return imagem.convert_alpha()
+        if modo == "opaco":
+            return imagem.convert()
+        return imagem
+
+    def dimensoes_imagem(self, caminho):
+        """Tamanho original de uma imagem (para calcular proporções) sem manter os pixels no cache."""
+        dimensoes = self._dimensoes.get(caminho)
+        if dimensoes is None:
+            dimensoes = self._dimensoes[caminho] = pygame.image.load(caminho).get_size()
+        return dimensoes
+
+    def carregar_imagem(self, caminho, tamanho=None, modo="alpha"):
+        """
+        Carrega uma imagem do disco uma única vez por (caminho, tamanho, modo).
+        - tamanho: (largura, altura) para redimensionar, ou None para o tamanho original
+          (com o cache em disco ativo, a versão redimensionada vem pronta do disco)
+        - modo: "alpha" (convert_alpha), "opaco" (convert) ou None (sem conversão)
+        Erros de carregamento são propagados para o chamador, como no pygame.image.load.
+        """
+        if tamanho is not None:
+            tamanho = (int(tamanho[0]), int(tamanho[1]))
+
+        def construir():
+            if tamanho is None:
+                return self._carregar_arquivo(caminho, modo)
+            arquivo = self._arquivo_disco(caminho, tamanho, modo) if self.pasta_disco else None
+            if arquivo is not None:
+                imagem = self._ler_disco(arquivo, tamanho, modo)
+                if imagem is not None:
+                    self._arquivos_disco_usados.add(arquivo)
+                    return imagem
+
+            # A original só serve para gerar a redimensionada: não fica no cache (ninguém a desenha)
+            imagem = pygame.transform.scale(self._carregar_arquivo(caminho, modo), tamanho)
+            if arquivo is not None:
+                self._gravar_disco(arquivo, imagem)
+            return imagem
+
+        return self.obter_superficie(("imagem", caminho, tamanho, modo), construir)
+
+    def _obter_fonte(self, chave, construtor):
+        """Retorna a fonte associada à chave, criando-a se necessário (LRU por quantidade)."""
+        fonte = self.fontes.get(chave)
+        if fonte is not None:
+            self.fontes.move_to_end(chave)
+            return fonte
+        fonte = construtor()
+        self.fontes[chave] = fonte
+        while len(self.fontes) > self.limite_fontes:
+            self.fontes.popitem(last=False)
+        return fonte
+
+    def carregar_fonte(self, arquivo, tamanho, negrito=False):
+        """Carrega uma fonte de arquivo (ou a padrão do pygame, com arquivo=None) uma única vez."""
+        def construir():
+            fonte = pygame.font.Font(arquivo, tamanho)
+            if negrito:
+                fonte.set_bold(True)
+            return fonte
+
+        return self._obter_fonte(("arquivo", arquivo, tamanho, negrito), construir)
+
+    def fonte_preguicosa(self, arquivo, tamanho, negrito=False):
+        """Como carregar_fonte, mas adia o carregamento até a fonte ser usada pela primeira vez."""
+        return FontePreguicosa(self, arquivo, tamanho, negrito)
+
+    def _resolver_sysfont(self, nome, negrito, italico):
+        """
+        Procura o arquivo de uma fonte do sistema uma única vez por estilo (a busca do SysFont
+        percorre a lista de fontes instaladas). Sem um arquivo com o estilo pedido, o estilo é sintetizado.
+        """
+        chave = (nome.lower(), negrito, italico)
+        resolvida = self.caminhos_sysfont.get(chave)
+        if resolvida is None:
+            caminho = pygame.font.match_font(nome, bold=negrito, italic=italico)
+            simples = pygame.font.match_font(nome) if (negrito or italico) else caminho
+            if caminho is None:
+                resolvida = (None, negrito, italico)
+            else:
+                resolvida = (caminho, negrito and caminho == simples, italico and caminho == simples)
+            self.caminhos_sysfont[chave] = resolvida
+        return resolvida
+
+    def carregar_sysfont(self, nome, tamanho, negrito=False, italico=False):
+        """Carrega uma fonte do sistema uma única vez por (nome, tamanho, negrito, itálico)."""
+        chave = ("sistema", nome.lower(), tamanho, negrito, italico)
+
+        def construir():
+            caminho, negrito_sintetico, italico_sintetico = self._resolver_sysfont(nome, negrito, italico)
+            fonte = pygame.font.Font(caminho, tamanho)
+            fonte.set_bold(negrito_sintetico)
+            fonte.set_italic(italico_sintetico)
+            return fonte
+
+        return self._obter_fonte(chave, construir)
+
+    def limpar(self):
+        """Esvazia o cache (por exemplo, após trocar a resolução da tela)."""
+        with self._trava:
+            self.superficies.clear()
+            self.fontes.clear()
+            self.memoria_usada = 0
+
+
+# Instância global do cache
+asset_cache = AssetCache()
@@ -1,7 +1,101 @@
 import pygame
 import os
 import random
-from constants import SOUND_PATH, SOM_LIGADO
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from constants import SOUND_PATH, SOM_LIGADO, LIMITE_MEMORIA_VOZES_MB
+
+# Por categoria: prioridade (sem canal livre, um som só interrompe outro de prioridade igual ou menor),
+# polifonia (sons da categoria tocando ao mesmo tempo; o mais antigo dá lugar ao novo) e intervalo mínimo,
+# em segundos, entre dois disparos do mesmo som (os disparos dentro do intervalo são descartados)
+CATEGORIAS_AUDIO = {
+    "voz":       {"prioridade": 4, "polifonia": 1, "intervalo": 0.0},
+    "colisao":   {"prioridade": 3, "polifonia": 2, "intervalo": 0.05},
+    "qte":       {"prioridade": 2, "polifonia": 2, "intervalo": 0.0},
+    "evento":    {"prioridade": 2, "polifonia": 3, "intervalo": 0.0},
+    "interface": {"prioridade": 1, "polifonia": 2, "intervalo": 0.05},
+    "hover":     {"prioridade": 0, "polifonia": 1, "intervalo": 0.08},
+}
+CATEGORIA_SONS = {
+    "collision": "colisao", "earthquake": "colisao", "failure": "colisao",
+    "qte_start": "qte", "qte_hit": "qte", "qte_fail": "qte", "qte_success": "qte",
+    "click": "interface", "hover": "hover",
+}  # Os demais sons são da categoria "evento"
+
+FATOR_ABAFAMENTO_MUSICA = 0.35  # Volume relativo da música enquanto uma voz toca
+DURACAO_ABAFAMENTO = 0.25       # Segundos para a música descer ou voltar ao volume normal
+
+
+def _bytes_som(som):
+    """Memória ocupada pelo PCM de um pygame.mixer.Sound, no formato atual do mixer."""
+    frequencia, formato, canais = pygame.mixer.get_init()
+    return int(som.get_length() * frequencia) * canais * (abs(formato) // 8)
+
+
+class BancoVozes:
+    """
+    Falas dubladas decodificadas sob demanda, sempre em uma thread de trabalho (o pygame libera o GIL ao
+    decodificar). Um MP3 só vira pygame.mixer.Sound (PCM na memória, ~10 MB por minuto) quando é tocado ou
+    previsto; um LRU guarda as falas mais recentes até limite_bytes e descarta as mais antigas.
+    """
+
+    def __init__(self, limite_bytes):
+        self.limite_bytes = limite_bytes
+        self.bytes_em_uso = 0
+        self._sons = OrderedDict()  # caminho -> (Sound, bytes), da menos para a mais recente
+        self._decodificando = {}    # caminho -> Future
+        self._executor = None
+        self._trava = threading.Lock()
+
+    def obter(self, caminho):
+        """Som já decodificado (marcado como o mais recente) ou None, sem nunca decodificar."""
+        with self._trava:
+            item = self._sons.get(caminho)
+            if item is None:
+                return None
+            self._sons.move_to_end(caminho)
+            return item[0]
+
+    def decodificar(self, caminho, ao_concluir=None):
+        """Agenda a decodificação de caminho em segundo plano; ao_concluir(som) é chamado quando o som estiver pronto."""
+        with self._trava:
+            futuro = self._decodificando.get(caminho)
+            if futuro is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vozes")
+                futuro = self._executor.submit(self._carregar, caminho)
+                self._decodificando[caminho] = futuro
+        if ao_concluir is not None:
+            futuro.add_done_callback(lambda f: f.result() is not None and ao_concluir(f.result()))
+        return futuro
+
+    def _carregar(self, caminho):
+        with self._trava:
+            item = self._sons.get(caminho)
+        if item is not None:
+            som = item[0]
+        else:
+            try:
+                som = pygame.mixer.Sound(caminho)
+            except pygame.error as e:
+                print(f"Erro ao carregar áudio dublado {caminho}: {e}")
+                som = None
+
+        with self._trava:
+            self._decodificando.pop(caminho, None)
+            if som is not None and caminho not in self._sons:
+                tamanho = _bytes_som(som)
+                self._sons[caminho] = (som, tamanho)
+                self.bytes_em_uso += tamanho
+                # Descarta as menos recentes; a que acabou de chegar fica mesmo se sozinha passar do limite.
+                # Um canal tocando mantém sua própria referência ao som, então descartar não corta a fala.
+                while self.bytes_em_uso > self.limite_bytes and len(self._sons) > 1:
+                    _, (_, liberados) = self._sons.popitem(last=False)
+                    self.bytes_em_uso -= liberados
+        return som
+
 
 class AudioManager:
     """Gerenciador de áudio para o jogo com canais separados para música, SFX e vozes."""
@@ -14,6 +108,10 @@ class AudioManager:
         self.voice_volume = 0.8   # Volume das vozes
         self._som_ligado = SOM_LIGADO
         self.current_voiced_dialogue = None
+        self.aleatorio = random   # Sorteio das variações de voz (o jogo injeta um gerador semeado)
+        self.vozes = BancoVozes(LIMITE_MEMORIA_VOZES_MB * 1024 * 1024)
+        self._voz_pendente = None  # Variação sorteada que espera a decodificação para tocar
+        self._trava_voz = threading.Lock()
         
         if pygame.mixer.get_init() is None:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
@@ -27,7 +125,11 @@ class AudioManager:
         # Canais 9-15: Vozes (diálogos dublados)
         self.voice_channels = [pygame.mixer.Channel(i) for i in range(9, 16)]
         
-        self.current_voice_channel_index = 0
+        self._ocupacao = {}  # canal -> (categoria, instante em que começou a tocar)
+        self._ultimos_disparos = {}  # nome do som -> instante do último disparo
+        self._volume_musica = self.bg_volume
+        self._abafamento = 1.0  # 1.0 = música no volume normal; desce até FATOR_ABAFAMENTO_MUSICA com voz
+        self._ultima_atualizacao = time.monotonic()
     
     def load_sounds(self):
         """Carrega todos os sons usados no jogo."""
@@ -70,7 +172,7 @@ class AudioManager:
         self._update_all_volumes()
     
     def load_voiced_dialogues(self):
-        """Carrega os áudios dublados para eventos específicos."""
+        """Registra os áudios dublados de cada evento; os arquivos só são decodificados quando usados (ver BancoVozes)."""
         dialogos_path = os.path.join(SOUND_PATH, "dialogos")
         if not os.path.exists(dialogos_path):
             print(f"Pasta de diálogos dublados não encontrada: {dialogos_path}")
@@ -93,9 +195,8 @@ class AudioManager:
             for variacao in variacoes:
                 arquivo_path = os.path.join(dialogos_path, f"{variacao}.mp3")
                 if os.path.exists(arquivo_path):
-                    sound = pygame.mixer.Sound(arquivo_path)
                     self.sounds[evento].append({
-                        "sound": sound,
+                        "file": arquivo_path,
                         "volume": self.voice_volume,
                         "name": variacao,
                         "type": "voice"
@@ -106,7 +207,7 @@ class AudioManager:
     def _update_all_volumes(self):
         """Atualiza os volumes de todos os canais com base nas configurações atuais."""
         if pygame.mixer.music.get_busy() and self._som_ligado:
-            pygame.mixer.music.set_volume(self.bg_volume)
+            self._definir_volume_musica(self.bg_volume)
         else:
             pygame.mixer.music.set_volume(0)
             
@@ -115,6 +216,19 @@ class AudioManager:
             
         for channel in self.voice_channels:
             channel.set_volume(self.voice_volume if self._som_ligado else 0)
+        
+        self._aplicar_volume_sfx()
+    
+    def _aplicar_volume_sfx(self):
+        """Ajusta o volume de cada efeito sonoro só quando as configurações mudam, não a cada reprodução."""
+        for sound_info in self.sounds.values():
+            if isinstance(sound_info, dict) and "sound" in sound_info:
+                sound_info["sound"].set_volume(self.sfx_volume * sound_info.get("volume", 1.0))
+    
+    def _definir_volume_musica(self, volume):
+        """Define o volume da música, já considerando o abafamento enquanto uma voz toca."""
+        self._volume_musica = volume
+        pygame.mixer.music.set_volume(volume * self._abafamento)
     
     @property
     def som_ligado(self):
@@ -134,41 +248,84 @@ class AudioManager:
                     pygame.mixer.music.unpause()
                 self._update_all_volumes()
     
-    def _get_available_channel(self, channel_type="sfx"):
-        """Obtém um canal disponível para reprodução."""
-        channels = self.sfx_channels if channel_type == "sfx" else self.voice_channels
-        
-        for channel in channels:
-            if not channel.get_busy():
-                return channel
+    def _alocar_canal(self, channels, categoria, agora):
+        """
+        Escolhe o canal para um som da categoria: se a categoria já está no limite de polifonia, reaproveita
+        o canal do seu som mais antigo; senão, um canal livre; sem canal livre, interrompe o som de menor
+        prioridade (o mais antigo entre iguais). Retorna None se todos os sons tocando forem mais importantes.
+        """
+        config = CATEGORIAS_AUDIO[categoria]
+        tocando = [(channel, self._ocupacao.get(channel, (None, 0.0))) for channel in channels if channel.get_busy()]
         
-        if channel_type == "voice":
-            self.current_voice_channel_index = (self.current_voice_channel_index + 1) % len(self.voice_channels)
-            return self.voice_channels[self.current_voice_channel_index]
+        mesma_categoria = [item for item in tocando if item[1][0] == categoria]
+        if len(mesma_categoria) >= config["polifonia"]:
+            channel = min(mesma_categoria, key=lambda item: item[1][1])[0]
         else:
-            return channels[0]
+            livres = [channel for channel in channels if not channel.get_busy()]
+            if livres:
+                channel = livres[0]
+            else:
+                def prioridade(item):
+                    return CATEGORIAS_AUDIO[item[1][0]]["prioridade"] if item[1][0] else -1
+                
+                candidatos = [item for item in tocando if prioridade(item) <= config["prioridade"]]
+                if not candidatos:
+                    return None
+                channel = min(candidatos, key=lambda item: (prioridade(item), item[1][1]))[0]
+        
+        self._ocupacao[channel] = (categoria, agora)
+        return channel
     
     def play_sound(self, sound_name):
-        """Toca um efeito sonoro no canal de SFX."""
+        """
+        Toca um efeito sonoro em um canal de SFX escolhido por _alocar_canal. Disparos repetidos do mesmo som
+        dentro do intervalo da categoria (ex.: hover ao passar o mouse por vários botões) são descartados.
+        """
         if not self._som_ligado or sound_name not in self.sounds:
             return
         
         sound_info = self.sounds[sound_name]
-        if "sound" not in sound_info:
+        if not isinstance(sound_info, dict) or "sound" not in sound_info:
             return
         
-        channel_type = sound_info.get("type", "sfx")
-        if channel_type != "voice":
-            channel_type = "sfx"
-        
-        channel = self._get_available_channel(channel_type)
+        categoria = CATEGORIA_SONS.get(sound_name, "evento")
+        agora = time.monotonic()
+        ultimo = self._ultimos_disparos.get(sound_name)
+        if ultimo is not None and agora - ultimo < CATEGORIAS_AUDIO[categoria]["intervalo"]:
+            return
         
-        volume = self.voice_volume if channel_type == "voice" else self.sfx_volume
-        volume_adjusted = volume * sound_info.get("volume", 1.0)
+        channel = self._alocar_canal(self.sfx_channels, categoria, agora)
+        if channel is None:
+            return
         
-        sound_info["sound"].set_volume(volume_adjusted)
+        self._ultimos_disparos[sound_name] = agora
         channel.play(sound_info["sound"])
     
+    def atualizar(self):
+        """
+        Chamado uma vez por quadro pelos loops de tela: esquece os canais que terminaram e abaixa a música
+        gradualmente enquanto uma voz toca, voltando ao volume normal quando ela acaba.
+        """
+        agora = time.monotonic()
+        dt = min(agora - self._ultima_atualizacao, 0.1)
+        self._ultima_atualizacao = agora
+        
+        for channel in list(self._ocupacao):
+            if not channel.get_busy():
+                self._ocupacao.pop(channel, None)
+        
+        voz_tocando = any(channel.get_busy() for channel in self.voice_channels)
+        alvo = FATOR_ABAFAMENTO_MUSICA if voz_tocando else 1.0
+        if self._abafamento == alvo:
+            return
+        passo = (1.0 - FATOR_ABAFAMENTO_MUSICA) * dt / DURACAO_ABAFAMENTO
+        if self._abafamento > alvo:
+            self._abafamento = max(alvo, self._abafamento - passo)
+        else:
+            self._abafamento = min(alvo, self._abafamento + passo)
+        if self._som_ligado and pygame.mixer.music.get_busy():
+            pygame.mixer.music.set_volume(self._volume_musica * self._abafamento)
+    
     def play_background(self, sound_name="background"):
         """Inicia a reprodução da música de fundo."""
         if not self._som_ligado or sound_name not in self.sounds or "file" not in self.sounds[sound_name]:
@@ -179,7 +336,7 @@ class AudioManager:
         sound_info = self.sounds[sound_name]
         pygame.mixer.music.load(sound_info["file"])
         volume_adjusted = self.bg_volume * sound_info.get("volume", 1.0)
-        pygame.mixer.music.set_volume(volume_adjusted)
+        self._definir_volume_musica(volume_adjusted)
         pygame.mixer.music.play(-1)
         self.current_bg_music = sound_name
     
@@ -192,13 +349,13 @@ class AudioManager:
         """Ajusta o volume da música de fundo."""
         self.bg_volume = max(0.0, min(1.0, volume))
         if pygame.mixer.music.get_busy() and self._som_ligado:
-            pygame.mixer.music.set_volume(self.bg_volume)
+            self._definir_volume_musica(self.bg_volume)
     
     def set_music_volume(self, v):
         """Define o volume da música de fundo."""
         self.bg_volume = max(0.0, min(1.0, v))
         if pygame.mixer.music.get_busy() and self._som_ligado:
-            pygame.mixer.music.set_volume(self.bg_volume)
+            self._definir_volume_musica(self.bg_volume)
     
     def set_sfx_volume(self, v):
         """Define o volume dos efeitos sonoros."""
@@ -206,6 +363,7 @@ class AudioManager:
         for channel in self.sfx_channels:
             if self._som_ligado:
                 channel.set_volume(self.sfx_volume)
+        self._aplicar_volume_sfx()
     
     def set_voice_volume(self, v):
         """Define o volume das vozes."""
@@ -225,39 +383,83 @@ class AudioManager:
             for sound_info in self.sounds[sound_name]:
                 sound_info["volume"] = volume
                 if self.current_voiced_dialogue and self.current_voiced_dialogue.get("name") == sound_info.get("name"):
-                    sound_info["sound"].set_volume(volume * self.voice_volume if self._som_ligado else 0)
+                    sound = self.vozes.obter(sound_info["file"])
+                    if sound is not None:
+                        sound.set_volume(volume * self.voice_volume if self._som_ligado else 0)
         else:
             self.sounds[sound_name]["volume"] = volume
             
             if sound_name == self.current_bg_music and "file" in self.sounds[sound_name]:
-                pygame.mixer.music.set_volume(volume * self.bg_volume if self._som_ligado else 0)
+                if self._som_ligado:
+                    self._definir_volume_musica(volume * self.bg_volume)
+                else:
+                    pygame.mixer.music.set_volume(0)
+            elif "sound" in self.sounds[sound_name]:
+                self._aplicar_volume_sfx()
     
     def stop_voiced_dialogue(self):
         """Para a reprodução do diálogo atual se houver algum."""
-        for channel in self.voice_channels:
-            channel.stop()
-        self.current_voiced_dialogue = None
+        with self._trava_voz:
+            self._voz_pendente = None
+            for channel in self.voice_channels:
+                channel.stop()
+            self.current_voiced_dialogue = None
     
     def play_voiced_dialogue(self, evento):
-        """Reproduz aleatoriamente uma das variações de áudio dublado para um evento."""
+        """
+        Reproduz aleatoriamente uma das variações de áudio dublado para um evento.
+        Se a variação sorteada ainda não foi decodificada, ela toca assim que a thread de trabalho terminar
+        (a menos que outra fala ou stop_voiced_dialogue a substitua antes); o quadro atual não espera.
+        """
         if not self._som_ligado or evento not in self.sounds or not isinstance(self.sounds[evento], list) or not self.sounds[evento]:
             return False
         
         self.stop_voiced_dialogue()
         
-        variacao = random.choice(self.sounds[evento])
-        if "sound" not in variacao:
+        variacao = self.aleatorio.choice(self.sounds[evento])
+        if "file" not in variacao:
             return False
         
-        channel = self._get_available_channel("voice")
+        sound = self.vozes.obter(variacao["file"])
+        if sound is not None:
+            with self._trava_voz:
+                self._tocar_voz(variacao, sound)
+            return True
         
-        sound = variacao["sound"]
+        with self._trava_voz:
+            self._voz_pendente = variacao
+        self.vozes.decodificar(variacao["file"], lambda sound: self._tocar_pendente(variacao, sound))
+        return True
+    
+    def _tocar_pendente(self, variacao, sound):
+        """Chamado pela thread de trabalho quando a fala sorteada termina de decodificar."""
+        with self._trava_voz:
+            if self._voz_pendente is not variacao:
+                return
+            self._voz_pendente = None
+            if self._som_ligado:
+                self._tocar_voz(variacao, sound)
+    
+    def _tocar_voz(self, variacao, sound):
+        channel = self._alocar_canal(self.voice_channels, "voz", time.monotonic())
         volume_adjusted = self.voice_volume * variacao.get("volume", 1.0)
         sound.set_volume(volume_adjusted)
         channel.play(sound)
-        
         self.current_voiced_dialogue = variacao
-        return True
+    
+    def prever_voz(self, evento):
+        """
+        Decodifica em segundo plano a variação que play_voiced_dialogue(evento) sortearia agora. O gerador é
+        espiado e restaurado, então os sorteios seguintes (e a reprodução de sessões gravadas) não mudam.
+        """
+        variacoes = self.sounds.get(evento)
+        if not self._som_ligado or not isinstance(variacoes, list) or not variacoes:
+            return
+        estado = self.aleatorio.getstate()
+        variacao = self.aleatorio.choice(variacoes)
+        self.aleatorio.setstate(estado)
+        if "file" in variacao:
+            self.vozes.decodificar(variacao["file"])
 
 # Crie uma instância única do gerenciador de áudio
 audio_manager = AudioManager()
@@ -0,0 +1,112 @@
+import threading
+
+import pygame
+
+from constants import FPS
+
+
+class Cena:
+    """
+    Uma tela do jogo executada pelo GerenciadorCenas.
+    - rotina: gerador que desenha um quadro a cada `events = yield` (recebe os eventos do quadro seguinte)
+      e termina com `return resultado`. Para abrir outra tela por cima, `resultado = yield Cena(...)`:
+      a rotina fica parada na pilha e recebe o resultado da outra tela quando ela terminar.
+    - precarregar: função opcional que aquece os caches da tela (imagens, dados) em segundo plano;
+      a rotina só começa quando ela termina, então o primeiro quadro não espera disco.
+    """
+
+    def __init__(self, rotina, precarregar=None, nome=None):
+        self.rotina = rotina
+        self.precarregar = precarregar
+        self.nome = nome or getattr(rotina, "__name__", "cena")
+        self.iniciada = False
+
+    @classmethod
+    def bloqueante(cls, funcao, *args, **kwargs):
+        """Cena para telas que ainda têm o próprio loop (diálogos, seleção de porta, o jogo em si)."""
+        def rotina():
+            return funcao(*args, **kwargs)
+            yield  # Torna a função um gerador
+
+        return cls(rotina(), nome=getattr(funcao, "__name__", None))
+
+
+class GerenciadorCenas:
+    """
+    Pilha de cenas com um único loop: um relógio e uma leitura de eventos por quadro para a cena do topo.
+    Trocar de tela empilha ou desempilha um gerador, sem chamadas recursivas nem novos loops.
+    """
+
+    def __init__(self):
+        self.pilha = []
+        self.relogio = pygame.time.Clock()
+        self._carregamentos = {}  # função de pré-carregamento -> thread
+        self._trava = threading.Lock()
+
+    def precarregar(self, funcao):
+        """Inicia funcao() em segundo plano, uma única vez (ex.: o menu aquece as telas que pode abrir)."""
+        with self._trava:
+            if funcao in self._carregamentos:
+                return self._carregamentos[funcao]
+
+            def executar():
+                try:
+                    funcao()
+                except Exception as e:
+                    print(f"Erro ao pré-carregar {getattr(funcao, '__name__', funcao)}: {e}")
+
+            thread = threading.Thread(target=executar, daemon=True, name=f"precarregar-{getattr(funcao, '__name__', '')}")
+            self._carregamentos[funcao] = thread
+            thread.start()
+            return thread
+
+    def empilhar(self, cena):
+        self.pilha.append(cena)
+        if cena.precarregar is not None:
+            self.precarregar(cena.precarregar)
+
+    def executar(self, cena):
+        """Empilha a cena e roda o loop até ela terminar. Retorna o resultado da cena."""
+        from utils.audio_manager import audio_manager
+        base = len(self.pilha)
+        self.empilhar(cena)
+        valor = None  # Eventos do quadro ou resultado da cena que acabou de sair da pilha
+        resultado = None
+
+        while len(self.pilha) > base:
+            topo = self.pilha[-1]
+            if not topo.iniciada:
+                carregamento = self.precarregar(topo.precarregar) if topo.precarregar else None
+                if carregamento is not None and carregamento.is_alive():
+                    # Assets ainda carregando: mantém a janela respondendo com a última imagem na tela
+                    pygame.event.pump()
+                    carregamento.join(1 / FPS)
+                    continue
+                topo.iniciada = True
+                valor = None
+
+            try:
+                pedido = topo.rotina.send(valor)
+            except StopIteration as fim:
+                self.pilha.pop()
+                resultado = valor = fim.value
+                continue
+
+            if isinstance(pedido, Cena):
+                self.empilhar(pedido)
+                continue
+
+            # Quadro desenhado: lê os eventos do próximo, uma vez, para a cena do topo
+            valor = pygame.event.get()
+            self.relogio.tick(FPS)
+            audio_manager.atualizar()
+
+        return resultado
+
+
+gerenciador_cenas = GerenciadorCenas()
+
+
+def executar_cena(rotina, precarregar=None):
+    """Roda uma cena até o fim e retorna seu resultado (para chamar uma tela como função bloqueante)."""
+    return gerenciador_cenas.executar(Cena(rotina, precarregar=precarregar))
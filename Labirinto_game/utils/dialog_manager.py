@@ -4,8 +4,33 @@ import json
 import os
 from pygame.locals import *
 from utils.drawing import aplicar_filtro_cinza_superficie, resize
+from utils.asset_cache import asset_cache
 from constants import LARGURA_TELA, ALTURA_TELA
 
+FUNDO_GENERICO_PATH = "Labirinto_game/assets/images/backgrounds/fundo_dialogo_labirinto_dark.png"
+PERSONAGENS_PATH = "Labirinto_game/assets/images/characters"
+
+
+def tamanho_personagem():
+    """Tamanho em que a arte dos personagens é mostrada nos diálogos."""
+    return (resize(800, eh_X=True), resize(800))
+
+
+def precarregar_dialogos(precarregador, arquivo_json):
+    """Agenda o fundo genérico e a arte de todos os personagens do arquivo de diálogos no pré-carregador."""
+    precarregador.agendar_imagem(FUNDO_GENERICO_PATH, (LARGURA_TELA, ALTURA_TELA))
+    try:
+        with open(arquivo_json, 'r', encoding='utf-8') as f:
+            dados_dialogos = json.load(f)
+    except Exception as e:
+        print(f"Erro ao carregar arquivo de diálogos: {e}")
+        return
+    imagens = {dialogo.get('imagem', 'teseu.png') for cena in dados_dialogos.values() for dialogo in cena}
+    imagens.discard('')  # Falas sem personagem ("imagem": "")
+    for imagem_path in sorted(imagens):
+        precarregador.agendar_imagem(os.path.join(PERSONAGENS_PATH, imagem_path), tamanho_personagem())
+
+
 class GerenciadorDialogos:
     """Classe que gerencia a exibição de diálogos entre personagens."""
     
@@ -44,8 +69,8 @@ class GerenciadorDialogos:
         )
         
         # Configurações do texto
-        self.fonte_texto = pygame.font.Font(None, resize(36))
-        self.fonte_personagem = pygame.font.Font(None, resize(40))
+        self.fonte_texto = asset_cache.carregar_fonte(None, resize(36))
+        self.fonte_personagem = asset_cache.carregar_fonte(None, resize(40))
         self.cor_texto = (255, 255, 255)
         self.cor_nome_personagem = (255, 220, 100)  # Cor dourada para o nome do personagem
         
@@ -62,7 +87,7 @@ class GerenciadorDialogos:
         self.despertando = True
         
         # Indicador de "pressione tecla para continuar"
-        self.fonte_indicador = pygame.font.Font(None, resize(24))
+        self.fonte_indicador = asset_cache.carregar_fonte(None, resize(24))
         self.texto_indicador = "Pressione qualquer tecla para continuar..."
         
         # Espaçamento entre linhas de texto
@@ -85,9 +110,7 @@ class GerenciadorDialogos:
     def carregar_imagens_fundo(self):
         """Carrega imagem de fundo genérica como fallback."""
         try:
-            fundo_path = "Labirinto_game/assets/images/backgrounds/fundo_dialogo_labirinto_dark.png"
-            self.fundo_generico = pygame.image.load(fundo_path).convert_alpha()
-            self.fundo_generico = pygame.transform.scale(self.fundo_generico, (LARGURA_TELA, ALTURA_TELA))
+            self.fundo_generico = asset_cache.carregar_imagem(FUNDO_GENERICO_PATH, (LARGURA_TELA, ALTURA_TELA))
         except Exception as e:
             print(f"Erro ao carregar imagem de fundo genérica: {e}")
             self.fundo_generico = None
@@ -96,12 +119,8 @@ class GerenciadorDialogos:
         """Carrega a imagem de um personagem se ainda não foi carregada."""
         if nome not in self.personagens:
             try:
-                # Tenta carregar a imagem do personagem
-                imagem = pygame.image.load(os.path.join("Labirinto_game/assets/images/characters", imagem_path)).convert_alpha()
-                
-                # Define o tamanho padrão para personagens
-                tamanho = (resize(800, eh_X=True), resize(800))
-                imagem = pygame.transform.scale(imagem, tamanho)
+                # Tenta carregar a imagem do personagem (normalmente já pré-carregada em segundo plano)
+                imagem = asset_cache.carregar_imagem(os.path.join(PERSONAGENS_PATH, imagem_path), tamanho_personagem())
                 
                 # Define a posição do personagem (centralizado à direita da tela)
                 personagem_rect = imagem.get_rect(center=(LARGURA_TELA - resize(300, eh_X=True), ALTURA_TELA - resize(400)))
@@ -345,8 +364,8 @@ class GerenciadorDialogos:
             return True
         
         # Toca efeito sonoro se especificado
+        from utils.audio_manager import audio_manager
         if efeito_sonoro:
-            from utils.audio_manager import audio_manager
             audio_manager.play_sound(efeito_sonoro)
         
         # Loop principal da cena
@@ -360,5 +379,6 @@ class GerenciadorDialogos:
             
             pygame.display.flip()
             relogio.tick(60)
+            audio_manager.atualizar()
         # Retorna True para indicar que o diálogo foi concluído com sucesso
         return True
@@ -22,7 +22,7 @@ def centralizar_texto(fonte, texto, superficie, y, largura=None, x0=0):
     return x, y
 
 def desenhar_texto(texto, fonte, cor, superficie, x, y, centralizado=False, largura=None):
-    """Desenha texto na superfície especificada. Se centralizado=True, centraliza horizontalmente."""
+    """Desenha texto na superfície especificada e retorna o retângulo ocupado. Se centralizado=True, centraliza horizontalmente."""
     from utils.colors import cor_com_escala_cinza
     text_obj = fonte.render(texto, True, cor_com_escala_cinza(cor[0], cor[1], cor[2]))
     if centralizado:
@@ -32,6 +32,7 @@ def desenhar_texto(texto, fonte, cor, superficie, x, y, centralizado=False, larg
     text_rect = text_obj.get_rect()
     text_rect.topleft = (x, y)
     superficie.blit(text_obj, text_rect)
+    return text_rect
 
 def desenhar_texto_sombra(text, font, color, surf, x, y, shadow_color=(0,0,0), offset=2):
     # Renderiza o texto principal
@@ -73,76 +74,28 @@ def desenhar_texto_textura(text, font, texture):
 
     return final_surf
 
-def desenhar_botao(
-    texto,
-    x,
-    y,
-    largura,
-    altura,
-    cor_normal,
-    cor_hover,
-    fonte,
-    tela,
-    events=None,
-    imagem_fundo=None,
-    border_radius=0
-):
-    """Desenha um botão interativo e retorna se foi clicado."""
-    from utils.audio_manager import audio_manager
-    
-    if events is None:
-        events = []
-    
-    pos_mouse = pygame.mouse.get_pos()
-    botao_rect = pygame.Rect(x, y, largura, altura)
-    mouse_sobre = botao_rect.collidepoint(pos_mouse)
-    
-    # Verifica se o mouse acabou de entrar no botão para tocar o som de hover
-    mouse_estava_sobre = getattr(desenhar_botao, f'mouse_sobre_{x}_{y}', False)
-    if mouse_sobre and not mouse_estava_sobre:
-        audio_manager.play_sound("hover")
-    setattr(desenhar_botao, f'mouse_sobre_{x}_{y}', mouse_sobre)
+def _compor_botao(texto, largura, altura, fonte, img, border_radius, mouse_sobre):
+    """
+    Monta a superfície final de um botão (sombra + fundo + texto) em um dos estados (normal ou hover).
+    Quando não há imagem de fundo, a sombra é composta na mesma superfície, cuja origem fica em
+    (x - shadow_expand, y - hover_offset) em relação ao botão.
+    """
+    from constants import COR_BOTAO_TEXTO
 
-    # Efeito de elevação ao passar o mouse por cima
     hover_offset = resize(6) if mouse_sobre else 0
-    
+
     # Prepara superfícies para o botão e sua sombra
     botao_surf = pygame.Surface((largura, altura), pygame.SRCALPHA)
     botao_surf = botao_surf.convert_alpha()
-    
+
     # Dimensões da sombra (ligeiramente maior que o botão)
     shadow_expand = resize(5)  # Quanto a sombra se expande além do botão
     shadow_width = largura + shadow_expand * 2
     shadow_height = altura + shadow_expand  # Maior na parte inferior
-    
-    # Cria uma superfície para a sombra (maior que o botão)
-    shadow_surf = pygame.Surface((shadow_width, shadow_height), pygame.SRCALPHA)
-    
-    # Cor do botão (agora usamos uma cor ligeiramente diferente ao passar o mouse)
-    if mouse_sobre:
-        # Botão um pouco mais claro quando hover
-        cor_fundo = tuple(min(c + 30, 255) for c in cor_normal)
-    else:
-        cor_fundo = cor_normal
 
-    # Desenha o botão normalmente
-    if imagem_fundo and os.path.exists(imagem_fundo):
-        img = pygame.image.load(imagem_fundo).convert_alpha()
-        img = pygame.transform.scale(img, (largura, altura))
+    if img:
         botao_surf.blit(img, (0, 0))
-        
-        # Para imagens,um leve brilho ao passar o mouse
-    #     if mouse_sobre:
-    #         glow = pygame.Surface((largura, altura), pygame.SRCALPHA)
-    #         glow.fill((255, 255, 255, 30))  # Brilho sutil
-    #         botao_surf.blit(glow, (0, 0))
-    # else:
-    #     pygame.draw.rect(botao_surf, cor_fundo, (0, 0, largura, altura), border_radius=border_radius)
-    
-    # Adiciona o texto ao botão com estilo mitológico
-    from constants import COR_BOTAO_TEXTO
-    import math, time
-    
+
     # Função para renderizar texto com estilo inspirado em entalhes gregos antigos
     def renderizar_texto_mitologico(superficie, texto, fonte, posicao_central):
         # Cores para o efeito de entalhe em pedra antiga
@@ -173,63 +126,117 @@ def desenhar_botao(
         # Borda dourada (aspecto de entalhe em ouro)
         if mouse_sobre:
             # Contorno dourado completo quando hover
-            for offset in [(0,-1), (1,-1), (1,0), (1,1), (0,1), (-1,1), (-1,0), (-1,-1)]:
-                borda = fonte.render(texto, True, cor_borda)
-                rect = borda.get_rect(center=(cx + offset[0], cy + offset[1]))
-                superficie.blit(borda, rect)
+            offsets = [(0,-1), (1,-1), (1,0), (1,1), (0,1), (-1,1), (-1,0), (-1,-1)]
         else:
             # Contorno parcial quando não hover (só embaixo e à direita)
-            for offset in [(1,0), (1,1), (0,1)]:
-                borda = fonte.render(texto, True, cor_borda)
-                rect = borda.get_rect(center=(cx + offset[0], cy + offset[1]))
-                superficie.blit(borda, rect)
+            offsets = [(1,0), (1,1), (0,1)]
+        borda = fonte.render(texto, True, cor_borda)
+        for offset in offsets:
+            rect = borda.get_rect(center=(cx + offset[0], cy + offset[1]))
+            superficie.blit(borda, rect)
         
         # Texto principal com cor base
         texto_principal = fonte.render(texto, True, cor_texto)
         rect_principal = texto_principal.get_rect(center=(cx, cy))
         superficie.blit(texto_principal, rect_principal)
-        
-    
+
     # Renderiza o texto com o estilo personalizado
     renderizar_texto_mitologico(botao_surf, texto, fonte, (largura//2, altura//2+resize(5)))
-    
+
+    if img:
+        return botao_surf
+
     # Desenha uma sombra 
-    if not (imagem_fundo and os.path.exists(imagem_fundo)):
-        # Desenha sombra principal (um retângulo com cantos arredondados)
-        shadow_alpha = 60 if mouse_sobre else 40  # Sombra mais escura ao passar o mouse
-        shadow_color = (0, 0, 0, shadow_alpha)
+    shadow_surf = pygame.Surface((shadow_width, shadow_height), pygame.SRCALPHA)
+    shadow_alpha = 60 if mouse_sobre else 40  # Sombra mais escura ao passar o mouse
+    shadow_color = (0, 0, 0, shadow_alpha)
+    
+    # Desenha a forma principal da sombra com cantos arredondados
+    shadow_rect = pygame.Rect(
+        shadow_expand, 
+        shadow_expand, 
+        largura, 
+        altura
+    )
+    pygame.draw.rect(shadow_surf, shadow_color, shadow_rect, border_radius=border_radius)
+    
+    # Aplica um efeito de desfoque simples 
+    blur_iterations = 3
+    for i in range(blur_iterations):
+        # Cada iteração dilata ligeiramente a sombra e reduz a opacidade
+        blur_alpha = shadow_alpha * (blur_iterations - i) // (blur_iterations * 2)
+        blur_color = (0, 0, 0, blur_alpha)
         
-        # Desenha a forma principal da sombra com cantos arredondados
-        shadow_rect = pygame.Rect(
-            shadow_expand, 
-            shadow_expand, 
-            largura, 
-            altura
+        blur_rect = pygame.Rect(
+            shadow_expand - i, 
+            shadow_expand - i, 
+            largura + i * 2, 
+            altura + i * 2
         )
-        pygame.draw.rect(shadow_surf, shadow_color, shadow_rect, border_radius=border_radius)
-        
-        # Aplica um efeito de desfoque simples 
-        blur_iterations = 3
-        for i in range(blur_iterations):
-            # Cada iteração dilata ligeiramente a sombra e reduz a opacidade
-            blur_alpha = shadow_alpha * (blur_iterations - i) // (blur_iterations * 2)
-            blur_color = (0, 0, 0, blur_alpha)
-            
-            blur_rect = pygame.Rect(
-                shadow_expand - i, 
-                shadow_expand - i, 
-                largura + i * 2, 
-                altura + i * 2
-            )
-            pygame.draw.rect(shadow_surf, blur_color, blur_rect, border_radius=border_radius + i)
-        
-        # Aplica a sombra na posição ligeiramente deslocada
-        shadow_x = x - shadow_expand
-        shadow_y = y + hover_offset  # A sombra não se move para cima quando hover
-        tela.blit(shadow_surf, (shadow_x, shadow_y))
+        pygame.draw.rect(shadow_surf, blur_color, blur_rect, border_radius=border_radius + i)
+
+    # A sombra não se move para cima quando hover, o botão sim.
+    # A composição é feita com alfa pré-multiplicado para que um único blit equivalha aos dois originais.
+    composto = pygame.Surface((shadow_width, altura + shadow_expand + hover_offset * 2), pygame.SRCALPHA)
+    composto.blit(shadow_surf.premul_alpha(), (0, hover_offset * 2))
+    composto.blit(botao_surf.premul_alpha(), (shadow_expand, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+    return composto
+
+def desenhar_botao(
+    texto,
+    x,
+    y,
+    largura,
+    altura,
+    cor_normal,
+    cor_hover,
+    fonte,
+    tela,
+    events=None,
+    imagem_fundo=None,
+    border_radius=0
+):
+    """Desenha um botão interativo e retorna se foi clicado."""
+    from utils.audio_manager import audio_manager
+    from utils.asset_cache import asset_cache
+    
+    if events is None:
+        events = []
     
-    # Aplica o botão com o efeito de elevação
-    tela.blit(botao_surf, (x, y - hover_offset))
+    pos_mouse = pygame.mouse.get_pos()
+    botao_rect = pygame.Rect(x, y, largura, altura)
+    mouse_sobre = botao_rect.collidepoint(pos_mouse)
+    
+    # Verifica se o mouse acabou de entrar no botão para tocar o som de hover
+    mouse_estava_sobre = getattr(desenhar_botao, f'mouse_sobre_{x}_{y}', False)
+    if mouse_sobre and not mouse_estava_sobre:
+        audio_manager.play_sound("hover")
+    setattr(desenhar_botao, f'mouse_sobre_{x}_{y}', mouse_sobre)
+
+    # Efeito de elevação ao passar o mouse por cima
+    hover_offset = resize(6) if mouse_sobre else 0
+
+    # Imagem de fundo carregada e redimensionada uma única vez pelo cache
+    img = None
+    if imagem_fundo:
+        try:
+            img = asset_cache.carregar_imagem(imagem_fundo, (largura, altura))
+        except (pygame.error, FileNotFoundError):
+            img = None
+
+    # Os estados normal e hover são compostos uma única vez; nos quadros seguintes custam um blit.
+    # cor_normal e cor_hover ficam fora da chave: a composição não as usa (o fundo vem da imagem)
+    chave = ("botao", texto, largura, altura, fonte, imagem_fundo if img else None, border_radius, bool(mouse_sobre))
+    superficie = asset_cache.obter_superficie(
+        chave,
+        lambda: _compor_botao(texto, largura, altura, fonte, img, border_radius, mouse_sobre)
+    )
+
+    if img:
+        # Aplica o botão com o efeito de elevação
+        tela.blit(superficie, (x, y - hover_offset))
+    else:
+        tela.blit(superficie, (x - resize(5), y - hover_offset), special_flags=pygame.BLEND_PREMULTIPLIED)
 
     # A área de clique permanece na posição original
     clicou = False
@@ -431,36 +438,69 @@ def resize(valor, eh_X=False, largura_tela=None, altura_tela=None, ui_escala=Non
 
 
 
+# Buffers de trabalho do filtro de escala de cinza, reaproveitados entre quadros (crescem sob demanda)
+_buffers_cinza = {}
+
+
+def _buffer_cinza(nome, tamanho, tipo):
+    """Retorna um buffer NumPy de pelo menos `tamanho` elementos, sem alocar a cada quadro."""
+    buffer = _buffers_cinza.get(nome)
+    if buffer is None or buffer.size < tamanho:
+        import numpy as np
+        buffer = _buffers_cinza[nome] = np.empty(tamanho, dtype=tipo)
+    return buffer[:tamanho]
+
+
 def aplicar_filtro_cinza_superficie(surface, alpha=180):
     """
     Aplica um filtro de escala de cinza sobre a superfície fornecida.
     alpha: transparência do filtro (0-255). Use 255 para filtro total.
+    O filtro trabalha direto nos pixels da superfície (também em subsuperfícies), só com inteiros:
+    cinza = (77*R + 150*G + 29*B) >> 8 e canal = (canal*(256-alpha) + cinza*alpha) >> 8.
     """
-    # Cria uma superfície temporária do mesmo tamanho
-    gray_surface = pygame.Surface(surface.get_size())
-    
-    # Copia o conteúdo da superfície original
-    gray_surface.blit(surface, (0, 0))
-    
-    # Usa array3d para obter um array NumPy da superfície
-    arr = pygame.surfarray.array3d(gray_surface)
-    
-    # Calcula a média ponderada para escala de cinza
-    gray = 0.299 * arr[:,:,0] + 0.587 * arr[:,:,1] + 0.114 * arr[:,:,2]
-    
-    # Aplica o valor de cinza a todos os canais
-    arr[:,:,0] = gray
-    arr[:,:,1] = gray
-    arr[:,:,2] = gray
-    
-    # Atualiza a superfície com o array modificado
-    pygame.surfarray.blit_array(gray_surface, arr)
-    
-    # Define a transparência
-    gray_surface.set_alpha(alpha)
-    
-    # Aplica a superfície em escala de cinza sobre a original
-    surface.blit(gray_surface, (0, 0))
+    import numpy as np
+
+    largura, altura = surface.get_size()
+    bytes_por_pixel = surface.get_bytesize()
+    if largura == 0 or altura == 0:
+        return
+    if bytes_por_pixel < 3:
+        # Formatos de 8/16 bits não têm um byte por canal: usa o grayscale do pygame
+        cinza_surf = pygame.transform.grayscale(surface)
+        cinza_surf.set_alpha(alpha)
+        surface.blit(cinza_surf, (0, 0))
+        return
+
+    # Visão (altura, largura, bytes) dos pixels, respeitando o pitch da superfície
+    dados = np.frombuffer(surface.get_buffer(), dtype=np.uint8)
+    pixels = np.lib.stride_tricks.as_strided(
+        dados, shape=(altura, largura, bytes_por_pixel), strides=(surface.get_pitch(), bytes_por_pixel, 1))
+    canais = [pixels[..., deslocamento // 8] for deslocamento in surface.get_shifts()[:3]]
+
+    total = largura * altura
+    cinza = _buffer_cinza("cinza", total, np.uint16).reshape(altura, largura)
+    temp = _buffer_cinza("temp", total, np.uint16).reshape(altura, largura)
+
+    # Luminância (pesos 0.299, 0.587, 0.114 em ponto fixo de 8 bits)
+    np.multiply(canais[0], 77, out=cinza, dtype=np.uint16)
+    np.multiply(canais[1], 150, out=temp, dtype=np.uint16)
+    cinza += temp
+    np.multiply(canais[2], 29, out=temp, dtype=np.uint16)
+    cinza += temp
+    cinza >>= 8
+
+    if alpha >= 255:
+        for canal in canais:
+            canal[...] = cinza
+        return
+
+    # Mistura com a cor original; os valores cabem em 16 bits (no máximo 255 * 256)
+    cinza *= alpha
+    for canal in canais:
+        np.multiply(canal, 256 - alpha, out=temp, dtype=np.uint16)
+        temp += cinza
+        temp >>= 8
+        canal[...] = temp
 
 def desenhar_barra_qte(tela, x, y, largura=100, altura=8, porcentagem=1.0, cor=(255, 215, 0)):
     """Desenha uma barra de progresso para QTEs."""
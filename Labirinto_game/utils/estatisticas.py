@@ -0,0 +1,77 @@
+from collections import Counter, defaultdict
+
+
+class EstatisticasUsuario:
+    """
+    Agregados das tentativas de um usuário, atualizados em O(1) a cada nova tentativa.
+    Substituem as varreduras da lista completa de tentativas feitas a cada fim de nível e nas telas.
+    """
+
+    def __init__(self):
+        self.total_jogos = 0
+        self.tentativas_por_nivel = Counter()      # nível -> número de tentativas (inclui falhas)
+        self.sucessos_por_nivel = Counter()        # nível -> tentativas concluídas (vidas > 0)
+        self.melhor_tempo_nivel = {}               # nível -> melhor tempo entre as concluídas
+        self.melhor_tempo = None                   # melhor tempo em qualquer nível concluído
+        self.niveis_completados = set()
+        self.soma_tempo_sucesso = defaultdict(float)  # nível -> soma dos tempos das concluídas
+        self.soma_colisoes = Counter()             # nível -> soma das colisões (inclui falhas)
+        self.vidas_restantes = Counter()           # vidas ao fim da tentativa -> quantidade
+        self.tentativas_nivel = defaultdict(list)  # nível -> tentativas em ordem cronológica
+        self._ultima = None  # Última tentativa processada (para reconhecer a lista na próxima consulta)
+
+    def adicionar(self, tentativa):
+        """Incorpora uma nova tentativa aos agregados."""
+        nivel = tentativa.get("nivel")
+        vidas = tentativa.get("vidas", 0)
+
+        self.total_jogos += 1
+        self.tentativas_por_nivel[nivel] += 1
+        self.soma_colisoes[nivel] += tentativa.get("colisoes", 0)
+        self.vidas_restantes[vidas] += 1
+        self.tentativas_nivel[nivel].append(tentativa)
+
+        if vidas > 0:
+            tempo = tentativa.get("tempo", float('inf'))
+            self.sucessos_por_nivel[nivel] += 1
+            self.soma_tempo_sucesso[nivel] += tempo
+            self.niveis_completados.add(nivel)
+            if nivel not in self.melhor_tempo_nivel or tempo < self.melhor_tempo_nivel[nivel]:
+                self.melhor_tempo_nivel[nivel] = tempo
+            if self.melhor_tempo is None or tempo < self.melhor_tempo:
+                self.melhor_tempo = tempo
+
+        self._ultima = tentativa
+
+    def tempo_medio(self, nivel):
+        """Tempo médio das tentativas concluídas do nível (None se nenhuma foi concluída)."""
+        sucessos = self.sucessos_por_nivel[nivel]
+        return self.soma_tempo_sucesso[nivel] / sucessos if sucessos else None
+
+    def media_colisoes(self, nivel):
+        """Média de colisões por tentativa no nível, incluindo as falhas."""
+        tentativas = self.tentativas_por_nivel[nivel]
+        return self.soma_colisoes[nivel] / tentativas if tentativas else 0
+
+
+# Índice por usuário, reaproveitado enquanto a lista de tentativas só crescer
+_indices = {}
+
+
+def obter_estatisticas(usuario, tentativas):
+    """
+    Retorna as estatísticas do usuário em dia com a lista de tentativas.
+    As tentativas salvas nunca são alteradas e as listas retornadas por carregar_usuarios() compartilham
+    os mesmos registros, então basta conferir se a última tentativa processada continua na mesma posição
+    para incorporar só as novas. Se a lista não bate (outro usuário com o mesmo nome, histórico apagado),
+    o índice é reconstruído.
+    """
+    indice = _indices.get(usuario)
+    if (indice is None or len(tentativas) < indice.total_jogos or
+            (indice.total_jogos and tentativas[indice.total_jogos - 1] is not indice._ultima)):
+        indice = EstatisticasUsuario()
+        _indices[usuario] = indice
+
+    for tentativa in tentativas[indice.total_jogos:]:
+        indice.adicionar(tentativa)
+    return indice
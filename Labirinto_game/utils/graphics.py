@@ -1,6 +1,7 @@
 import pygame
 import math
 from typing import List, Dict, Tuple, Any, Optional
+from utils.asset_cache import asset_cache
 
 # Cores temáticas da mitologia grega
 VERMELHO_MINOTAURO = (180, 40, 40)
@@ -53,8 +54,8 @@ class GraficoBase:
         self.cor_fundo = cor_fundo
         self.cor_borda = cor_borda
         self.cor_texto = cor_texto
-        self.fonte_titulo = fonte_titulo or pygame.font.SysFont("arial", 20)
-        self.fonte_eixos = fonte_eixos or pygame.font.SysFont("arial", 16)
+        self.fonte_titulo = fonte_titulo or asset_cache.carregar_sysfont("arial", 20)
+        self.fonte_eixos = fonte_eixos or asset_cache.carregar_sysfont("arial", 16)
         self.superficie = pygame.Surface(tamanho, pygame.SRCALPHA)
         self.animacao_progresso = 0.0
         self.velocidade_animacao = 0.03
@@ -0,0 +1,214 @@
+import atexit
+import json
+import os
+import platform
+import time
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime
+
+import pygame
+
+from utils.asset_cache import asset_cache
+
+
+class _Fase:
+    """Cronometra um trecho do quadro e soma o tempo na fase correspondente."""
+
+    __slots__ = ("perfilador", "nome", "inicio")
+
+    def __init__(self, perfilador, nome):
+        self.perfilador = perfilador
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+
+    def __exit__(self, *exc):
+        tempos = self.perfilador.tempos_quadro
+        tempos[self.nome] = tempos.get(self.nome, 0.0) + time.perf_counter() - self.inicio
+        return False
+
+
+class PerfiladorQuadros:
+    """
+    Instrumentação opcional do loop do jogo.
+    - fase(nome) cronometra um trecho do quadro (leitura serial, QTE, fundo, HUD, filtro cinza...).
+    - novo_quadro() fecha o quadro anterior: o intervalo entre chamadas é o tempo total do quadro.
+    - desenhar(tela) mostra FPS, tempo de quadro e o custo médio de cada fase em um painel pequeno.
+    - Ao encerrar o jogo, um relatório JSON com histograma e percentis p50/p95/p99 é gravado em pasta_relatorios.
+    Desativado, fase() devolve um contexto vazio e o custo por quadro é desprezível.
+    """
+
+    LARGURA_BALDE_MS = 0.25      # Resolução do histograma
+    LIMITE_HISTOGRAMA_MS = 100   # Quadros mais longos vão para o último balde
+    JANELA_QUADROS = 120         # Quadros usados nas médias do painel
+    INTERVALO_PAINEL = 0.25      # Segundos entre atualizações do texto do painel
+
+    def __init__(self, pasta_relatorios="Labirinto_game/data/perfil"):
+        self.pasta_relatorios = pasta_relatorios
+        self.ativo = False
+        self.tempos_quadro = {}
+        self._nulo = nullcontext()
+        self._fases = {}
+        self._reiniciar_sessao()
+        self._registrou_saida = False
+
+    def _reiniciar_sessao(self):
+        self.inicio_sessao = None
+        self._ultimo_quadro = None
+        self.total_quadros = 0
+        self.histograma = [0] * (int(self.LIMITE_HISTOGRAMA_MS / self.LARGURA_BALDE_MS) + 1)
+        self.quadros_recentes = deque(maxlen=self.JANELA_QUADROS)
+        self.fases_recentes = {}
+        self.totais_fases = {}    # fase -> (soma em segundos, maior valor em segundos)
+        self.pior_quadro = 0.0
+        self._painel = None
+        self._painel_atualizado = 0.0
+
+    def alternar(self):
+        """Liga ou desliga a instrumentação (tecla F3 no jogo)."""
+        self.ativo = not self.ativo
+        self._ultimo_quadro = None
+        self.tempos_quadro = {}
+        if self.ativo and not self._registrou_saida:
+            atexit.register(self.salvar_relatorio)
+            self._registrou_saida = True
+        print(f"Perfilador {'ativado' if self.ativo else 'desativado'}")
+
+    def fase(self, nome):
+        """Contexto que cronometra um trecho do quadro atual."""
+        if not self.ativo:
+            return self._nulo
+        fase = self._fases.get(nome)
+        if fase is None:
+            fase = self._fases[nome] = _Fase(self, nome)
+        return fase
+
+    def novo_quadro(self):
+        """Fecha o quadro anterior, registrando o tempo total e o de cada fase, e inicia o próximo."""
+        if not self.ativo:
+            return
+        agora = time.perf_counter()
+        if self._ultimo_quadro is not None:
+            duracao = agora - self._ultimo_quadro
+            self._registrar_quadro(duracao)
+        elif self.inicio_sessao is None:
+            self.inicio_sessao = datetime.now()
+        self._ultimo_quadro = agora
+        self.tempos_quadro = {}
+
+    def _registrar_quadro(self, duracao):
+        self.total_quadros += 1
+        self.pior_quadro = max(self.pior_quadro, duracao)
+        self.quadros_recentes.append(duracao)
+        balde = min(int(duracao * 1000 / self.LARGURA_BALDE_MS), len(self.histograma) - 1)
+        self.histograma[balde] += 1
+
+        for nome, tempo in self.tempos_quadro.items():
+            recentes = self.fases_recentes.get(nome)
+            if recentes is None:
+                recentes = self.fases_recentes[nome] = deque(maxlen=self.JANELA_QUADROS)
+            recentes.append(tempo)
+            soma, maior = self.totais_fases.get(nome, (0.0, 0.0))
+            self.totais_fases[nome] = (soma + tempo, max(maior, tempo))
+
+    def percentil(self, p):
+        """Percentil (0-100) do tempo de quadro da sessão, em ms, estimado pelo histograma."""
+        if not self.total_quadros:
+            return None
+        alvo = self.total_quadros * p / 100
+        acumulado = 0
+        for balde, contagem in enumerate(self.histograma):
+            acumulado += contagem
+            if acumulado >= alvo:
+                return (balde + 0.5) * self.LARGURA_BALDE_MS
+        return self.LIMITE_HISTOGRAMA_MS
+
+    def _montar_painel(self):
+        fonte = asset_cache.carregar_sysfont("consolas", 16)
+        recentes = self.quadros_recentes
+        media = sum(recentes) / len(recentes) if recentes else 0
+        linhas = [
+            f"FPS {1 / media:5.1f}  quadro {media * 1000:5.2f} ms" if media else "FPS  --",
+            f"p95 {self.percentil(95) or 0:5.2f}  p99 {self.percentil(99) or 0:5.2f} ms",
+        ]
+        fases = sorted(self.fases_recentes.items(), key=lambda item: -sum(item[1]))
+        for nome, tempos in fases:
+            linhas.append(f"{nome:<13}{sum(tempos) / len(tempos) * 1000:6.2f} ms")
+
+        renderizadas = [fonte.render(linha, True, (230, 255, 230)) for linha in linhas]
+        largura = max(r.get_width() for r in renderizadas) + 16
+        altura = sum(r.get_height() for r in renderizadas) + 12
+        painel = pygame.Surface((largura, altura))
+        painel.fill((10, 20, 10))
+        painel.set_alpha(200)
+        y = 6
+        for renderizada in renderizadas:
+            painel.blit(renderizada, (8, y))
+            y += renderizada.get_height()
+        return painel
+
+    def desenhar(self, tela):
+        """Desenha o painel no canto superior direito e retorna sua área (ou None se desativado)."""
+        if not self.ativo:
+            return None
+        agora = time.perf_counter()
+        if self._painel is None or agora - self._painel_atualizado >= self.INTERVALO_PAINEL:
+            self._painel = self._montar_painel()
+            self._painel_atualizado = agora
+        x = tela.get_width() - self._painel.get_width() - 10
+        return tela.blit(self._painel, (x, 10))
+
+    def relatorio(self):
+        """Resumo da sessão em um dicionário serializável."""
+        quadros = self.total_quadros
+        fases = {
+            nome: {"media_ms": soma / quadros * 1000, "max_ms": maior * 1000}
+            for nome, (soma, maior) in self.totais_fases.items()
+        } if quadros else {}
+        superficie = pygame.display.get_surface() if pygame.display.get_init() else None
+        return {
+            "inicio": self.inicio_sessao.strftime("%d-%m-%Y %H:%M:%S") if self.inicio_sessao else None,
+            "quadros": quadros,
+            "maquina": {
+                "plataforma": platform.platform(),
+                "processador": platform.processor() or platform.machine(),
+                "resolucao": list(superficie.get_size()) if superficie else None,
+            },
+            "tempo_quadro_ms": {
+                "p50": self.percentil(50),
+                "p95": self.percentil(95),
+                "p99": self.percentil(99),
+                "max": self.pior_quadro * 1000,
+            },
+            "fases": fases,
+            "histograma": {
+                "largura_balde_ms": self.LARGURA_BALDE_MS,
+                # Só os baldes não vazios: {limite inferior em ms: quantidade de quadros}
+                "contagens": {
+                    f"{balde * self.LARGURA_BALDE_MS:.2f}": contagem
+                    for balde, contagem in enumerate(self.histograma) if contagem
+                },
+            },
+        }
+
+    def salvar_relatorio(self):
+        """Grava o relatório da sessão (se houver quadros medidos) e retorna o caminho do arquivo."""
+        if not self.total_quadros:
+            return None
+        try:
+            os.makedirs(self.pasta_relatorios, exist_ok=True)
+            nome = (self.inicio_sessao or datetime.now()).strftime("perfil_%Y%m%d_%H%M%S.json")
+            caminho = os.path.join(self.pasta_relatorios, nome)
+            with open(caminho, "w", encoding="utf-8") as f:
+                json.dump(self.relatorio(), f, indent=4, ensure_ascii=False)
+            print(f"Relatório de desempenho salvo em {caminho}")
+            return caminho
+        except Exception as e:
+            print(f"Erro ao salvar relatório de desempenho: {e}")
+            return None
+
+
+# Instância global
+perfilador = PerfiladorQuadros()
@@ -0,0 +1,65 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from utils.asset_cache import asset_cache
+
+
+class PrecarregadorAssets:
+    """
+    Decodifica e redimensiona imagens em threads de trabalho, direto no asset_cache, enquanto o jogador
+    está nas telas iniciais (o pygame libera o GIL ao ler e escalar imagens). Quem usa as imagens depois
+    continua chamando asset_cache.carregar_imagem normalmente: se o pré-carregamento já terminou, é só
+    uma consulta ao cache; se não, a imagem é carregada na hora, como antes.
+    Exige que a janela já exista (set_mode), por causa do convert/convert_alpha.
+    """
+
+    def __init__(self, trabalhadores=2):
+        self.trabalhadores = trabalhadores
+        self.total = 0
+        self.concluidas = 0
+        self._executor = None
+        self._tarefas = []
+        self._trava = threading.Lock()
+
+    def agendar(self, funcao, *args, **kwargs):
+        """Executa funcao(*args, **kwargs) em uma thread de trabalho. Erros são só registrados no console."""
+        def executar():
+            try:
+                funcao(*args, **kwargs)
+            except Exception as e:
+                print(f"Erro no pré-carregamento ({getattr(funcao, '__name__', funcao)}): {e}")
+            finally:
+                with self._trava:
+                    self.concluidas += 1
+
+        with self._trava:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.trabalhadores, thread_name_prefix="precarregador")
+            self.total += 1
+            self._tarefas.append(self._executor.submit(executar))
+
+    def agendar_imagem(self, caminho, tamanho=None, modo="alpha"):
+        """Agenda asset_cache.carregar_imagem(caminho, tamanho, modo); arquivos ausentes (ou pastas) são ignorados."""
+        if os.path.isfile(caminho):
+            self.agendar(asset_cache.carregar_imagem, caminho, tamanho, modo)
+
+    def progresso(self):
+        """Fração concluída (0.0 a 1.0), para uma barra de carregamento."""
+        with self._trava:
+            return self.concluidas / self.total if self.total else 1.0
+
+    @property
+    def concluido(self):
+        with self._trava:
+            return self.concluidas >= self.total
+
+    def aguardar(self, timeout=None):
+        """Bloqueia até as tarefas agendadas terminarem (ou até o timeout, em segundos)."""
+        with self._trava:
+            tarefas = list(self._tarefas)
+        wait(tarefas, timeout=timeout)
+
+
+# Instância global do pré-carregador
+precarregador = PrecarregadorAssets()
@@ -0,0 +1,205 @@
+import struct
+
+# Protocolos suportados pelo link com o Arduino
+PROTOCOLO_TEXTO = "texto"      # Linhas ASCII terminadas em \n (firmware antigo)
+PROTOCOLO_BINARIO = "binario"  # Quadros binários com CRC8
+
+BAUD_TEXTO = 9600
+BAUD_BINARIO = 115200
+
+# Formato do quadro: [SINCRONISMO][opcode][tamanho][payload...][crc8(opcode, tamanho, payload)]
+SINCRONISMO = 0xA5
+MAX_PAYLOAD = 8
+
+# Opcodes jogo -> Arduino (mesmos valores do firmware)
+COMANDOS = {
+    "PING": 0x01,
+    "NIVEL": 0x10,
+    "QTE_SHOW": 0x11,
+    "QTE_ACK": 0x12,
+    "QTE_END": 0x13,
+    "LEVEL_FAILED": 0x14,
+    "TERMINAR": 0x15,
+    "DEBOUNCE": 0x16,
+    "FEEDBACK": 0x17,
+    "FREEZE": 0x18,
+    "SERVO": 0x19,
+}
+
+# Opcodes Arduino -> jogo, traduzidos para os mesmos nomes do protocolo de texto.
+# Cada evento leva o millis() do Arduino no instante em que aconteceu: 4 bytes little-endian no
+# protocolo binário ou o sufixo "@<millis>" no protocolo de texto ("COLLISION@123456").
+EVENTOS = {
+    0x80: "OK",
+    0x81: "PLAYER_AT_START",
+    0x82: "COLLISION",
+    0x83: "LEVEL_COMPLETE",
+    0x84: "BTN_C",
+    0x85: "BTN_B",
+}
+
+# Valores enumerados enviados como índice de 1 byte
+VELOCIDADES_SERVO = ("lento", "normal", "rapido")
+CANAIS_FEEDBACK = ("som", "led", "multiplo", "cor")
+
+
+def _gerar_tabela_crc8(polinomio=0x07):
+    tabela = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ polinomio) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        tabela.append(crc)
+    return tabela
+
+
+_TABELA_CRC8 = _gerar_tabela_crc8()
+
+
+def crc8(dados, crc=0):
+    """CRC-8 (polinômio 0x07), o mesmo calculado pelo firmware."""
+    for byte in dados:
+        crc = _TABELA_CRC8[crc ^ byte]
+    return crc
+
+
+def montar_quadro(opcode, payload=b""):
+    """Monta um quadro binário completo para o opcode e payload informados."""
+    if len(payload) > MAX_PAYLOAD:
+        raise ValueError(f"Payload grande demais ({len(payload)} bytes)")
+    corpo = bytes((opcode, len(payload))) + bytes(payload)
+    return bytes((SINCRONISMO,)) + corpo + bytes((crc8(corpo),))
+
+
+class CodificadorTexto:
+    """Codifica comandos no protocolo de texto original ("NIVEL:3\\n")."""
+
+    def codificar(self, comando):
+        return f"{comando}\n".encode("utf-8")
+
+
+def separar_instante(linha):
+    """Separa "EVENTO@millis" em (evento, millis); linhas sem instante retornam (linha, None)."""
+    evento, separador, instante = linha.partition("@")
+    if separador and instante.isdigit():
+        return evento, int(instante)
+    return linha, None
+
+
+class DecodificadorTexto:
+    """Separa os bytes recebidos em linhas de texto."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def alimentar(self, dados):
+        """Recebe bytes da porta e retorna a lista de eventos como tuplas (evento, millis ou None)."""
+        self._buffer.extend(dados)
+        linhas = []
+        while True:
+            fim = self._buffer.find(b"\n")
+            if fim < 0:
+                return linhas
+            linha = self._buffer[:fim].decode("utf-8", errors="replace").strip()
+            del self._buffer[:fim + 1]
+            if linha:
+                linhas.append(separar_instante(linha))
+
+
+class CodificadorBinario:
+    """Converte os comandos de texto usados pelo jogo ("FREEZE:1") em quadros binários."""
+
+    def codificar(self, comando):
+        nome, _, valor = comando.partition(":")
+        opcode = COMANDOS.get(nome)
+        if opcode is None:
+            raise ValueError(f"Comando desconhecido: {comando}")
+
+        if nome == "NIVEL":
+            payload = bytes((int(valor),))
+        elif nome == "QTE_SHOW":
+            payload = valor[:1].encode("ascii")
+        elif nome == "DEBOUNCE":
+            payload = struct.pack("<H", max(0, min(int(valor), 0xFFFF)))
+        elif nome == "FREEZE":
+            payload = bytes((1 if int(valor) == 1 else 0,))
+        elif nome == "SERVO":
+            payload = bytes((VELOCIDADES_SERVO.index(valor),))
+        elif nome == "FEEDBACK":
+            payload = bytes((CANAIS_FEEDBACK.index(valor),))
+        else:
+            payload = b""
+        return montar_quadro(opcode, payload)
+
+
+class DecodificadorBinario:
+    """
+    Máquina de estados que recebe bytes e extrai quadros binários válidos.
+    Quadros com CRC inválido ou tamanho impossível são descartados e a leitura
+    volta a procurar o byte de sincronismo.
+    """
+
+    def __init__(self):
+        self.quadros_invalidos = 0
+        self._reiniciar()
+
+    def _reiniciar(self):
+        self._etapa = "sincronismo"
+        self._opcode = 0
+        self._tamanho = 0
+        self._payload = bytearray()
+
+    def quadros(self, dados):
+        """Recebe bytes e retorna os quadros válidos completos como tuplas (opcode, payload)."""
+        quadros = []
+        for byte in dados:
+            if self._etapa == "sincronismo":
+                if byte == SINCRONISMO:
+                    self._etapa = "opcode"
+            elif self._etapa == "opcode":
+                self._opcode = byte
+                self._etapa = "tamanho"
+            elif self._etapa == "tamanho":
+                if byte > MAX_PAYLOAD:
+                    self.quadros_invalidos += 1
+                    self._reiniciar()
+                    continue
+                self._tamanho = byte
+                self._etapa = "payload" if byte else "crc"
+            elif self._etapa == "payload":
+                self._payload.append(byte)
+                if len(self._payload) >= self._tamanho:
+                    self._etapa = "crc"
+            else:
+                corpo = bytes((self._opcode, self._tamanho)) + bytes(self._payload)
+                if byte == crc8(corpo):
+                    quadros.append((self._opcode, bytes(self._payload)))
+                else:
+                    self.quadros_invalidos += 1
+                self._reiniciar()
+        return quadros
+
+    def alimentar(self, dados):
+        """
+        Recebe bytes da porta e retorna a lista de eventos como tuplas (evento, millis ou None),
+        com os nomes do protocolo de texto.
+        """
+        eventos = []
+        for opcode, payload in self.quadros(dados):
+            evento = EVENTOS.get(opcode)
+            if evento is None:
+                print(f"Opcode desconhecido recebido do Arduino: 0x{opcode:02X}")
+                continue
+            instante = struct.unpack("<I", payload)[0] if len(payload) == 4 else None
+            eventos.append((evento, instante))
+        return eventos
+
+
+def criar_codificador(protocolo):
+    """Retorna o codificador de comandos do protocolo."""
+    return CodificadorBinario() if protocolo == PROTOCOLO_BINARIO else CodificadorTexto()
+
+
+def criar_decodificador(protocolo):
+    """Retorna o decodificador de eventos do protocolo."""
+    return DecodificadorBinario() if protocolo == PROTOCOLO_BINARIO else DecodificadorTexto()
@@ -5,11 +5,13 @@ from utils.audio_manager import audio_manager
 class QTEManager:
     """Gerenciador de Quick Time Events (QTEs) para o jogo."""
     
-    def __init__(self, timeout=6, seq_min=3, seq_max=5, conexao_serial=None):
+    def __init__(self, timeout=6, seq_min=3, seq_max=5, escritor_serial=None, relogio=time.time, aleatorio=random):
         self.timeout = timeout  # Tempo limite em segundos
         self.seq_min = seq_min  # Número mínimo de passos na sequência
         self.seq_max = seq_max  # Número máximo de passos na sequência
-        self.conexao_serial = conexao_serial  # Conexão serial para feedback externo, se necessário
+        self.escritor_serial = escritor_serial  # Escritor serial para feedback externo, se necessário
+        self.relogio = relogio  # Fonte de tempo (o jogo injeta o relógio da sessão)
+        self.aleatorio = aleatorio  # Gerador das sequências (o jogo injeta um gerador semeado)
         self.sequencia = []  # Sequência atual de QTE (L ou R)
         self.passo_atual = 0  # Posição atual na sequência
         self.tempo_inicio = 0  # Quando o QTE foi iniciado
@@ -21,7 +23,7 @@ class QTEManager:
     
     def iniciar(self, sequencia=None):
         """Inicia um novo QTE com uma sequência específica ou aleatória."""
-        self.tempo_inicio = time.time()
+        self.tempo_inicio = self.relogio()
         self.passo_atual = 0
         self.ativo = True
         self.sucesso = False
@@ -31,8 +33,8 @@ class QTEManager:
         
         if sequencia is None:
             # Gera uma sequência aleatória
-            tamanho = random.randint(self.seq_min, self.seq_max)
-            self.sequencia = [random.choice(["C", "B"]) for _ in range(tamanho)]
+            tamanho = self.aleatorio.randint(self.seq_min, self.seq_max)
+            self.sequencia = [self.aleatorio.choice(["C", "B"]) for _ in range(tamanho)]
         else:
             self.sequencia = sequencia
         
@@ -83,12 +85,13 @@ class QTEManager:
         if not self.ativo or self.concluido:
             return
             
-        tempo_atual = time.time()
+        tempo_atual = self.relogio()
         tempo_decorrido = tempo_atual - self.tempo_inicio
         
         if tempo_decorrido >= self.timeout:
             # Timeout
-            self.conexao_serial.write(b"FREEZE:0\n")
+            if self.escritor_serial:
+                self.escritor_serial.enviar("FREEZE:0")
             self.timeout_ocorrido = True
             self.concluido = True
             print("QTE falhou: tempo esgotado!")
@@ -99,7 +102,7 @@ class QTEManager:
         if not self.ativo:
             return 0
             
-        tempo_atual = time.time()
+        tempo_atual = self.relogio()
         tempo_decorrido = tempo_atual - self.tempo_inicio
         tempo_restante = max(0, self.timeout - tempo_decorrido)
         
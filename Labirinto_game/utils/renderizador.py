@@ -0,0 +1,111 @@
+import pygame
+
+from utils.perfilador import perfilador
+
+
+def unir_retangulos(rects):
+    """Junta retângulos que se sobrepõem, para que nenhuma área seja processada duas vezes no mesmo quadro."""
+    resultado = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        fundiu = True
+        while fundiu:
+            fundiu = False
+            for i, outro in enumerate(resultado):
+                if rect.colliderect(outro):
+                    rect = rect.union(resultado.pop(i))
+                    fundiu = True
+                    break
+        resultado.append(rect)
+    return resultado
+
+
+class RenderizadorCamadas:
+    """
+    Renderizador em camadas para o loop do jogo.
+    - Uma camada estática (fundo do nível e decorações) é montada uma única vez por chave.
+    - Os widgets do HUD informam os retângulos que desenharam (retângulos sujos); no quadro seguinte
+      apenas essas áreas são restauradas a partir da camada estática.
+    - A apresentação usa pygame.display.update(rects) em vez de atualizar a tela inteira.
+    Com um filtro de pós-processamento (escala de cinza), os widgets desenham em um buffer sem filtro
+    e o filtro é aplicado uma única vez, apenas nas áreas apresentadas.
+    """
+
+    def __init__(self, tela):
+        self.tela = tela
+        self.camada_fundo = None
+        self.chave_fundo = None
+        self.filtro = None
+        self.quadro = None
+        self.rects_anteriores = []
+        self.rects_atuais = []
+        self.redesenhar_tudo = True
+
+    @property
+    def superficie(self):
+        """Superfície em que os widgets devem desenhar."""
+        return self.quadro if self.quadro is not None else self.tela
+
+    def configurar(self, tela, filtro=None):
+        """Define a superfície de exibição e o filtro de pós-processamento (ou None)."""
+        self.tela = tela
+        self.filtro = filtro
+        if filtro is None:
+            self.quadro = None
+        elif self.quadro is None or self.quadro.get_size() != tela.get_size():
+            self.quadro = pygame.Surface(tela.get_size()).convert()
+        self.redesenhar_tudo = True
+
+    def definir_fundo(self, chave, construtor):
+        """Define a camada estática, reconstruindo-a com construtor() apenas quando a chave muda."""
+        if chave != self.chave_fundo or self.camada_fundo is None:
+            self.camada_fundo = construtor()
+            self.chave_fundo = chave
+            self.redesenhar_tudo = True
+
+    def invalidar(self):
+        """Força um redesenho completo no próximo quadro (após diálogos, transições ou outras telas)."""
+        self.redesenhar_tudo = True
+
+    def iniciar_quadro(self):
+        """Restaura a camada estática sob as áreas desenhadas no quadro anterior."""
+        superficie = self.superficie
+        if self.redesenhar_tudo:
+            superficie.blit(self.camada_fundo, (0, 0))
+        else:
+            for rect in self.rects_anteriores:
+                superficie.blit(self.camada_fundo, rect, rect)
+        self.rects_atuais = []
+
+    def marcar(self, *rects):
+        """Registra as áreas desenhadas neste quadro (valores None são ignorados)."""
+        for rect in rects:
+            if rect:
+                self.rects_atuais.append(pygame.Rect(rect))
+
+    def apresentar(self):
+        """Envia para a tela apenas as áreas que mudaram desde o último quadro."""
+        limites = self.tela.get_rect()
+        self.rects_atuais = [rect.clip(limites) for rect in self.rects_atuais]
+
+        if self.redesenhar_tudo:
+            areas = [limites]
+        else:
+            areas = unir_retangulos(self.rects_anteriores + self.rects_atuais)
+
+        if self.quadro is not None:
+            with perfilador.fase("cinza"):
+                for area in areas:
+                    self.tela.blit(self.quadro, area, area)
+                    self.filtro(self.tela.subsurface(area))
+
+        with perfilador.fase("apresentacao"):
+            if self.redesenhar_tudo:
+                pygame.display.update()
+            elif areas:
+                pygame.display.update(areas)
+
+        self.redesenhar_tudo = False
+        self.rects_anteriores = self.rects_atuais
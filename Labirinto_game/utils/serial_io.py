@@ -0,0 +1,273 @@
+import heapq
+import queue
+import threading
+import time
+from collections import deque
+
+from utils.protocolo_serial import PROTOCOLO_TEXTO, criar_codificador, criar_decodificador
+
+
+class EstimadorRelogio:
+    """
+    Converte instantes do millis() do Arduino para o relógio do computador.
+    Modelo: host = deslocamento + taxa * mcu. Como o atraso de transmissão é sempre positivo, o
+    deslocamento é o envelope inferior de (chegada - taxa * mcu) nas amostras recentes. A taxa corrige
+    a deriva do cristal do Arduino e é a inclinação entre os pontos de menor atraso das duas metades
+    da janela (mais robusta ao atraso, que só soma, do que uma regressão linear).
+    """
+
+    DERIVA_MAXIMA = 0.01      # Ressonadores cerâmicos erram menos de 1%
+    JANELA_MINIMA_DERIVA = 5  # Segundos de amostras antes de estimar a deriva
+    AMOSTRAS_MINIMAS_DERIVA = 8
+
+    def __init__(self, janela=120):
+        self._amostras = deque(maxlen=janela)  # (instante_mcu, chegada) em segundos
+        self._trava = threading.Lock()
+        self._ultimo_ms = None
+        self._voltas = 0
+        self.deslocamento = None
+        self.taxa = 1.0
+
+    def registrar(self, millis, chegada):
+        """
+        Registra um evento com o millis() do Arduino e o instante de chegada (time.monotonic()).
+        Retorna o instante do Arduino em segundos, já corrigido para o estouro do millis() (~49 dias).
+        """
+        with self._trava:
+            if self._ultimo_ms is not None and millis < self._ultimo_ms:
+                if self._ultimo_ms - millis > 2 ** 31:
+                    self._voltas += 1
+                else:
+                    # O Arduino reiniciou: as amostras antigas não valem mais
+                    self._amostras.clear()
+                    self._voltas = 0
+            self._ultimo_ms = millis
+            instante = (self._voltas * 2 ** 32 + millis) / 1000.0
+            self._amostras.append((instante, chegada))
+            self._recalcular()
+            return instante
+
+    def _recalcular(self):
+        amostras = self._amostras
+        taxa = self.taxa
+        if (len(amostras) >= self.AMOSTRAS_MINIMAS_DERIVA and
+                amostras[-1][0] - amostras[0][0] >= self.JANELA_MINIMA_DERIVA):
+            meio = (amostras[0][0] + amostras[-1][0]) / 2
+            primeira = [a for a in amostras if a[0] < meio]
+            segunda = [a for a in amostras if a[0] >= meio]
+            # O atraso de cada amostra depende da taxa; refina a escolha dos pontos com a estimativa anterior
+            for _ in range(2):
+                inicio = min(primeira, key=lambda a: a[1] - taxa * a[0])
+                fim = min(segunda, key=lambda a: a[1] - taxa * a[0])
+                taxa = (fim[1] - inicio[1]) / (fim[0] - inicio[0])
+                taxa = max(1 - self.DERIVA_MAXIMA, min(1 + self.DERIVA_MAXIMA, taxa))
+        else:
+            taxa = 1.0
+        self.taxa = taxa
+        self.deslocamento = min(chegada - taxa * instante for instante, chegada in amostras)
+
+    def para_monotonic(self, instante_mcu):
+        """Converte um instante do Arduino (segundos) para a escala de time.monotonic()."""
+        with self._trava:
+            return self.deslocamento + self.taxa * instante_mcu
+
+    def para_relogio(self, instante_mcu):
+        """Converte um instante do Arduino (segundos) para a escala de time.time() usada pelo jogo."""
+        return instante_para_relogio(self.para_monotonic(instante_mcu))
+
+    def duracao(self, inicio_mcu, fim_mcu):
+        """Intervalo entre dois instantes do Arduino, em segundos do computador (corrigido pela deriva)."""
+        with self._trava:
+            return (fim_mcu - inicio_mcu) * self.taxa
+
+
+class LeitorSerial(threading.Thread):
+    """
+    Thread dedicada à leitura da porta serial.
+    Drena tudo o que chega, decodifica os eventos (linhas de texto ou quadros binários, conforme o
+    protocolo negociado) e coloca cada um em uma fila junto com o instante de chegada (time.monotonic())
+    e o instante do Arduino em que o evento aconteceu (segundos do millis(), ou None se não informado). O loop do jogo esvazia a fila a cada quadro,
+    então a latência dos eventos do hardware não depende mais da taxa de quadros.
+    """
+
+    def __init__(self, conexao, protocolo=PROTOCOLO_TEXTO):
+        super().__init__(name="LeitorSerial", daemon=True)
+        self.conexao = conexao
+        self.fila = queue.SimpleQueue()
+        self._parar = threading.Event()
+        self.decodificador = criar_decodificador(protocolo)
+        self.relogio = EstimadorRelogio()
+
+    def run(self):
+        while not self._parar.is_set():
+            try:
+                # Bloqueia até chegar ao menos um byte (ou até o timeout da porta) e lê todo o resto pendente
+                dados = self.conexao.read(max(1, self.conexao.in_waiting))
+            except Exception as e:
+                if not self._parar.is_set():
+                    print(f"Erro na leitura serial: {e}")
+                break
+
+            if not dados:
+                continue
+
+            chegada = time.monotonic()
+            for evento, millis in self.decodificador.alimentar(dados):
+                instante_mcu = self.relogio.registrar(millis, chegada) if millis is not None else None
+                self.fila.put((chegada, evento, instante_mcu))
+
+    def obter_linhas(self):
+        """Retorna, sem bloquear, todos os eventos pendentes como tuplas (chegada, evento, instante_mcu)."""
+        linhas = []
+        while True:
+            try:
+                linhas.append(self.fila.get_nowait())
+            except queue.Empty:
+                return linhas
+
+    def parar(self):
+        """Pede para a thread encerrar (ela termina após o próximo timeout de leitura)."""
+        self._parar.set()
+
+
+class EscritorSerial(threading.Thread):
+    """
+    Thread dedicada ao envio de comandos para o Arduino.
+    O jogo apenas enfileira comandos; uma vez por quadro, despachar() junta tudo o que está pendente
+    (incluindo envios agendados que já venceram) em uma única escrita, feita fora da thread de
+    renderização. Assim o link de 9600 baud nunca bloqueia o desenho dos quadros.
+    Regras de fusão: comandos de estado (FREEZE, SERVO, DEBOUNCE, FEEDBACK) só mantêm a última
+    ocorrência do lote e são descartados se repetirem o último valor enviado.
+    """
+
+    COMANDOS_ESTADO = ("FREEZE:", "SERVO:", "DEBOUNCE:", "FEEDBACK:")
+
+    def __init__(self, conexao, protocolo=PROTOCOLO_TEXTO):
+        super().__init__(name="EscritorSerial", daemon=True)
+        self.conexao = conexao
+        self.codificador = criar_codificador(protocolo)
+        self.fila = queue.SimpleQueue()
+        self._pendentes = []
+        self._agendados = []  # heap de (instante, sequência, comando, grupo)
+        self._sequencia = 0
+        self._ultimo_estado = {}
+        self._falhou = threading.Event()
+
+    def run(self):
+        while True:
+            dados = self.fila.get()
+            if dados is None:
+                break
+            try:
+                self.conexao.write(dados)
+                self.conexao.flush()
+            except Exception as e:
+                print(f"Erro na escrita serial: {e}")
+                self._falhou.set()
+
+    @classmethod
+    def _prefixo_estado(cls, comando):
+        for prefixo in cls.COMANDOS_ESTADO:
+            if comando.startswith(prefixo):
+                return prefixo
+        return None
+
+    def enviar(self, comando):
+        """Enfileira um comando (sem o \\n final) para o próximo despacho."""
+        self._pendentes.append(comando)
+
+    def agendar(self, comando, atraso, grupo=None):
+        """Enfileira um comando para ser enviado depois de `atraso` segundos, sem bloquear o jogo."""
+        self._sequencia += 1
+        heapq.heappush(self._agendados, (time.monotonic() + atraso, self._sequencia, comando, grupo))
+
+    def cancelar(self, grupo):
+        """Descarta os envios agendados de um grupo que ainda não foram despachados."""
+        self._agendados = [item for item in self._agendados if item[3] != grupo]
+        heapq.heapify(self._agendados)
+
+    def despachar(self):
+        """Junta os comandos pendentes em uma única escrita e a entrega para a thread de envio."""
+        agora = time.monotonic()
+        while self._agendados and self._agendados[0][0] <= agora:
+            self._pendentes.append(heapq.heappop(self._agendados)[2])
+        if not self._pendentes:
+            return
+
+        # Após uma falha de escrita, não dá para confiar no estado que o Arduino recebeu
+        if self._falhou.is_set():
+            self._falhou.clear()
+            self._ultimo_estado.clear()
+
+        # Comandos de estado: vale só a última ocorrência de cada um dentro do lote
+        ultima_posicao = {}
+        for i, comando in enumerate(self._pendentes):
+            prefixo = self._prefixo_estado(comando)
+            if prefixo:
+                ultima_posicao[prefixo] = i
+
+        lote = []
+        for i, comando in enumerate(self._pendentes):
+            prefixo = self._prefixo_estado(comando)
+            if prefixo:
+                if ultima_posicao[prefixo] != i or self._ultimo_estado.get(prefixo) == comando:
+                    continue
+                self._ultimo_estado[prefixo] = comando
+            lote.append(comando)
+        self._pendentes = []
+
+        dados = bytearray()
+        for comando in lote:
+            try:
+                dados += self.codificador.codificar(comando)
+            except ValueError as e:
+                print(f"Erro ao codificar comando serial: {e}")
+        if dados:
+            self.fila.put(bytes(dados))
+
+    def parar(self):
+        """Descarta os agendamentos e encerra a thread depois de enviar o que já foi despachado."""
+        self._agendados = []
+        self.fila.put(None)
+
+
+# Um único leitor e um único escritor por conexão, reaproveitados entre partidas
+_leitores = {}
+_escritores = {}
+# Protocolo negociado no handshake de cada conexão (texto, se não informado)
+_protocolos = {}
+
+
+def definir_protocolo(conexao, protocolo):
+    """Registra o protocolo negociado para a conexão (chamado pela tela de seleção de porta)."""
+    _protocolos[conexao] = protocolo
+
+
+def obter_protocolo(conexao):
+    """Retorna o protocolo negociado para a conexão."""
+    return _protocolos.get(conexao, PROTOCOLO_TEXTO)
+
+
+def obter_leitor(conexao):
+    """Retorna o leitor associado à conexão, iniciando a thread na primeira chamada."""
+    leitor = _leitores.get(conexao)
+    if leitor is None or not leitor.is_alive():
+        leitor = LeitorSerial(conexao, obter_protocolo(conexao))
+        leitor.start()
+        _leitores[conexao] = leitor
+    return leitor
+
+
+def obter_escritor(conexao):
+    """Retorna o escritor associado à conexão, iniciando a thread na primeira chamada."""
+    escritor = _escritores.get(conexao)
+    if escritor is None or not escritor.is_alive():
+        escritor = EscritorSerial(conexao, obter_protocolo(conexao))
+        escritor.start()
+        _escritores[conexao] = escritor
+    return escritor
+
+
+def instante_para_relogio(instante_monotonic):
+    """Converte um instante de time.monotonic() para a escala de time.time() usada pelo jogo."""
+    return time.time() - (time.monotonic() - instante_monotonic)
@@ -3,21 +3,24 @@ import math
 import time
 from constants import padroes_servo
 from utils.drawing import resize
+from utils.asset_cache import asset_cache
 
 class AnimacaoServos:
     """Classe para renderizar e animar os servos motores com base nos padrões de cada nível."""
     
-    def __init__(self, nivel, servo_velocidade="normal"):
+    def __init__(self, nivel, servo_velocidade="normal", relogio=time.time):
         """
         Inicializa a animação dos servos.
         
         Args:
             nivel (int): O nível atual do jogo.
             servo_velocidade (str): "lento", "normal" ou "rapido"
+            relogio (callable): Fonte de tempo em segundos (o jogo injeta o relógio da sessão)
         """
         self.nivel = nivel
+        self.relogio = relogio
         self.padrao = padroes_servo.get(nivel, [])
-        self.tempo_inicio = time.time()
+        self.tempo_inicio = self.relogio()
         self.indice_atual = 0
         self.tempo_proximo_passo = 0
         self.duracao_total = sum(duracao for _, duracao in self.padrao) / 1000 if self.padrao else 0
@@ -62,7 +65,7 @@ class AnimacaoServos:
         if not self.padrao or self.nivel == 1:  # Não animar para o nível 1
             return
 
-        tempo_atual = time.time()
+        tempo_atual = self.relogio()
 
         # Lógica para garantir que o servo chegue ao alvo antes de iniciar o hold
         # 1. Só começa a contar o hold quando o ângulo atual está suficientemente próximo do alvo
@@ -116,9 +119,9 @@ class AnimacaoServos:
         return -(math.cos(math.pi * x) - 1) / 2
     
     def desenhar(self, tela):
-        """Desenha os servos na tela."""
+        """Desenha os servos na tela e retorna o retângulo da área ocupada."""
         if self.nivel == 1:  # Não mostrar para o nível 1
-            return
+            return None
             
         largura_tela = tela.get_width()
         altura_tela = tela.get_height()
@@ -139,7 +142,7 @@ class AnimacaoServos:
         self._desenhar_servo(tela, servo2_centro_x, servo_centro_y, self.angulo_servo2, False, invertido=True)
         
         # Texto explicativo (mais abaixo)
-        fonte = pygame.font.SysFont("Arial", resize(28, eh_X=True), bold=True)
+        fonte = asset_cache.carregar_sysfont("Arial", resize(28, eh_X=True), negrito=True)
         texto_linha1 = "Visualização dos Servos"
         texto_linha2 = f"Padrão Nível {self.nivel}"
         
@@ -150,6 +153,15 @@ class AnimacaoServos:
                                 base_y + self.tamanho_servo + resize(80)))
         tela.blit(surf_texto2, (largura_tela // 2 - surf_texto2.get_width() // 2, 
                                 base_y + self.tamanho_servo + resize(120)))
+
+        # Área que cobre os braços em qualquer ângulo, os rótulos e o texto explicativo
+        alcance = self.comprimento_braco + self.espessura_braco + resize(10)
+        esquerda = servo1_centro_x - alcance
+        topo = servo_centro_y - max(alcance, self.tamanho_servo)
+        largura = servo2_centro_x + alcance - esquerda
+        altura = base_y + self.tamanho_servo + resize(120) + surf_texto2.get_height() - topo
+        return pygame.Rect(esquerda, topo, largura, altura).union(
+            surf_texto1.get_rect(centerx=largura_tela // 2, top=base_y + self.tamanho_servo + resize(80)))
     
     def _desenhar_servo(self, tela, centro_x, centro_y, angulo, is_first, invertido=False):
         """Desenha um único servo motor com seu braço na posição angular especificada."""
@@ -195,7 +207,7 @@ class AnimacaoServos:
         pygame.draw.circle(tela, self.cor_detalhe, (marcador_x, marcador_y), resize(8))
         
         # Exibe o ângulo atual
-        fonte_angulo = pygame.font.SysFont("Arial", resize(18, eh_X=True), bold=True)
+        fonte_angulo = asset_cache.carregar_sysfont("Arial", resize(18, eh_X=True), negrito=True)
         texto_angulo = f"{int(angulo)}°"
         surf_angulo = fonte_angulo.render(texto_angulo, True, (255, 255, 255))
         posicao_texto = (centro_x - surf_angulo.get_width() // 2, 
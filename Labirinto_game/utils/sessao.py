@@ -0,0 +1,208 @@
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import random
+import time
+from datetime import datetime
+
+import pygame
+
+VERSAO_GRAVACAO = 2
+QUADROS_POR_DESCARGA = 60  # A gravação vai para o disco a cada ~1 s de jogo
+
+# Eventos do pygame que o loop do jogo consome (os demais não são gravados)
+TIPOS_EVENTOS_GRAVADOS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEMOTION,
+                          pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+def _serializar_evento(evento):
+    """Tipo e atributos simples do evento (tuplas viram listas no JSON)."""
+    atributos = {}
+    for chave, valor in evento.dict.items():
+        if isinstance(valor, (bool, int, float, str)):
+            atributos[chave] = valor
+        elif isinstance(valor, (tuple, list)) and all(isinstance(v, (int, float)) for v in valor):
+            atributos[chave] = list(valor)
+    return [evento.type, atributos]
+
+
+def _restaurar_evento(dados):
+    tipo, atributos = dados
+    return pygame.event.Event(tipo, {chave: tuple(valor) if isinstance(valor, list) else valor
+                                     for chave, valor in atributos.items()})
+
+
+def soma_estado(estado):
+    """Soma de verificação curta do estado determinístico do jogo (gravada a cada quadro)."""
+    texto = json.dumps(estado, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(texto.encode(), digest_size=4).hexdigest()
+
+
+class SessaoJogo:
+    """
+    Fontes de tempo, de aleatoriedade e de entrada de uma partida, injetadas no jogo e nos seus componentes.
+    - agora(): instante do quadro atual. Só avança em iniciar_quadro(), então toda a lógica de um quadro
+      vê o mesmo tempo e a reprodução pode devolver exatamente os instantes gravados.
+    - aleatorio / aleatorio_audio: geradores semeados no início de cada tentativa (QTE, power-ups e falas
+      usam fluxos separados, para que o áudio não desloque os sorteios do jogo).
+    - Com pasta_gravacao, cada tentativa de nível vira um arquivo .sessao.gz com o estado inicial, a semente
+      e, por quadro, o instante, os eventos do pygame, os dados da serial (já no relógio do jogo) e uma soma
+      do estado ao fim do quadro. O arquivo é escrito aos poucos, então sobrevive a um travamento.
+    """
+
+    reproduzindo = False
+
+    def __init__(self, pasta_gravacao=None):
+        self.pasta_gravacao = pasta_gravacao
+        self.instante = time.time()
+        self.semente = None
+        self.aleatorio = random.Random()
+        self.aleatorio_audio = random.Random()
+        self.caminho_gravacao = None
+        self._arquivo = None
+        self._quadro = None  # [instante, eventos, linhas serial] do quadro em andamento
+        self._quadros_gravados = 0
+        self._registrou_saida = False
+
+    def agora(self):
+        """Instante do quadro atual (segundos na escala de time.time())."""
+        return self.instante
+
+    def _semear(self, semente):
+        self.semente = semente
+        self.aleatorio.seed(semente)
+        self.aleatorio_audio.seed(semente + 1)
+
+    def iniciar(self, cabecalho, obter_estado):
+        """
+        Início de uma tentativa de nível: sorteia a semente e, se gravando, abre um novo arquivo.
+        obter_estado é chamado apenas quando o estado precisa ser gravado (o mesmo vale para os métodos abaixo).
+        """
+        self.fechar()
+        self.instante = time.time()
+        self._semear(random.SystemRandom().randrange(2 ** 32))
+        if not self.pasta_gravacao:
+            return
+        try:
+            os.makedirs(self.pasta_gravacao, exist_ok=True)
+            nome = datetime.now().strftime(f"sessao_%Y%m%d_%H%M%S_nivel{cabecalho.get('nivel', 0)}.sessao.gz")
+            self.caminho_gravacao = os.path.join(self.pasta_gravacao, nome)
+            self._arquivo = gzip.open(self.caminho_gravacao, "wt", encoding="utf-8")
+            self._escrever(dict(cabecalho, versao=VERSAO_GRAVACAO, semente=self.semente,
+                                instante=self.instante, estado_inicial=obter_estado()))
+        except OSError as e:
+            print(f"Erro ao iniciar gravação da sessão: {e}")
+            self._arquivo = None
+            return
+        if not self._registrou_saida:
+            atexit.register(self.fechar)
+            self._registrou_saida = True
+
+    def _escrever(self, registro):
+        try:
+            self._arquivo.write(json.dumps(registro, separators=(",", ":"), ensure_ascii=False) + "\n")
+        except (OSError, ValueError) as e:
+            print(f"Erro ao gravar sessão: {e}")
+            self._arquivo = None
+
+    def iniciar_quadro(self, eventos):
+        """Avança o relógio para o novo quadro e registra os eventos lidos do pygame."""
+        self.instante = time.time()
+        if self._arquivo is not None:
+            self._quadro = [self.instante, [_serializar_evento(e) for e in eventos
+                                            if e.type in TIPOS_EVENTOS_GRAVADOS], []]
+        return eventos
+
+    def registrar_serial(self, dados, tempo_evento, duracao_hardware):
+        """Registra um dado do Arduino já convertido para o relógio do jogo."""
+        if self._quadro is not None:
+            self._quadro[2].append([dados, tempo_evento, duracao_hardware])
+
+    def finalizar_quadro(self, obter_estado):
+        """Fecha o quadro com a soma do estado do jogo."""
+        if self._quadro is not None and self._arquivo is not None:
+            self._escrever(self._quadro + [soma_estado(obter_estado())])
+            self._quadros_gravados += 1
+            if self._arquivo is not None and self._quadros_gravados % QUADROS_POR_DESCARGA == 0:
+                self._arquivo.flush()
+        self._quadro = None
+
+    def encerrar(self, obter_estado):
+        """Fim da tentativa (saída, falha ou conclusão do nível): grava o último quadro e fecha o arquivo."""
+        self.finalizar_quadro(obter_estado)
+        self.fechar()
+
+    def fechar(self):
+        if self._arquivo is not None:
+            try:
+                self._arquivo.close()
+                print(f"Sessão gravada em {self.caminho_gravacao}")
+            except OSError as e:
+                print(f"Erro ao fechar gravação da sessão: {e}")
+        self._arquivo = None
+        self._quadro = None
+
+
+class ReproducaoSessao(SessaoJogo):
+    """
+    Reproduz uma tentativa gravada por SessaoJogo: devolve os instantes, eventos e dados da serial de cada
+    quadro e confere a soma do estado ao fim de cada um. divergencia guarda o primeiro quadro em que o
+    estado reproduzido diferiu do gravado (None se a reprodução foi idêntica).
+    """
+
+    reproduzindo = True
+
+    def __init__(self, caminho):
+        super().__init__()
+        self.caminho = caminho
+        self.quadros = []
+        with gzip.open(caminho, "rt", encoding="utf-8") as f:
+            self.cabecalho = json.loads(f.readline())
+            try:
+                for linha in f:
+                    self.quadros.append(json.loads(linha))
+            except (EOFError, ValueError):
+                # Gravação interrompida (jogo travou): reproduz até o último quadro completo
+                pass
+        if self.cabecalho.get("versao") != VERSAO_GRAVACAO:
+            raise ValueError(f"Versão de gravação não suportada: {self.cabecalho.get('versao')}")
+        self.estado_inicial = self.cabecalho["estado_inicial"]
+        self.indice = -1
+        self.divergencia = None
+        self.soma_final = None
+
+    def iniciar(self, cabecalho, obter_estado):
+        self.instante = self.cabecalho["instante"]
+        self._semear(self.cabecalho["semente"])
+
+    def iniciar_quadro(self, eventos):
+        """Substitui os eventos ao vivo pelos gravados; retorna None quando a gravação acaba."""
+        self.indice += 1
+        if self.indice >= len(self.quadros):
+            return None
+        quadro = self.quadros[self.indice]
+        self.instante = quadro[0]
+        return [_restaurar_evento(e) for e in quadro[1]]
+
+    def linhas_serial(self):
+        """Dados da serial do quadro atual: (dados, tempo_evento, duracao_hardware)."""
+        return [tuple(linha) for linha in self.quadros[self.indice][2]]
+
+    def registrar_serial(self, dados, tempo_evento, duracao_hardware):
+        pass
+
+    def finalizar_quadro(self, obter_estado):
+        if self.indice >= len(self.quadros):
+            return
+        self.soma_final = soma_estado(obter_estado())
+        if self.divergencia is None and self.soma_final != self.quadros[self.indice][3]:
+            self.divergencia = self.indice
+            print(f"Reprodução divergiu da gravação no quadro {self.indice}")
+
+    def encerrar(self, obter_estado):
+        self.finalizar_quadro(obter_estado)
+
+    def fechar(self):
+        pass
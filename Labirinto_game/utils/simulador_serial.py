@@ -0,0 +1,420 @@
+import random
+import struct
+import threading
+import time
+
+from constants import padroes_servo
+from utils.protocolo_serial import (COMANDOS, EVENTOS, VELOCIDADES_SERVO, CANAIS_FEEDBACK,
+                                    DecodificadorBinario, montar_quadro)
+
+# Nomes dos comandos e eventos binários a partir dos opcodes (e vice-versa)
+_NOMES_COMANDOS = {opcode: nome for nome, opcode in COMANDOS.items()}
+_OPCODES_EVENTOS = {nome: opcode for opcode, nome in EVENTOS.items()}
+
+# Tempos do firmware (ms)
+DEBOUNCE_HALL_MS = 20
+DEBOUNCE_BOTAO_MS = 50
+PASSO_SERVO_MS = {"lento": 30, "normal": 15, "rapido": 5}
+
+# Duração de cada acionamento dos sensores simulados (s)
+DURACAO_TOQUE_FIO = 0.05
+DURACAO_BOTAO = 0.08
+DURACAO_HALL = 1.0
+
+
+class SimuladorSerial:
+    """
+    Modelo em software do Arduino do labirinto, com a mesma interface de um serial.Serial.
+    Roda a mesma máquina de estados do firmware (padrões dos servos, debounce de colisão e dos
+    sensores Hall, LEDs do QTE, delays bloqueantes, protocolos de texto e binário), alimentada por
+    sensores virtuais:
+    - roteiro: lista de (segundos após o NIVEL, ação) com ação em "inicio", "colisao", "fim",
+      "botao_C" ou "botao_B", repetida a cada nível;
+    - sem roteiro, gera um nível aleatório: o jogador chega ao início após `atraso_inicio`,
+      encosta no fio `taxa_colisoes` vezes por segundo, termina após `duracao_nivel` segundos e
+      responde aos QTEs depois de `tempo_reacao`, acertando com probabilidade `taxa_acerto_qte`.
+    Serve para jogar sem placa e para testar e medir o loop do jogo em máquinas sem Arduino.
+    """
+
+    def __init__(self, roteiro=None, atraso_inicio=1.5, duracao_nivel=(10.0, 20.0), taxa_colisoes=0.06,
+                 tempo_reacao=0.35, taxa_acerto_qte=0.5, semente=None, timeout=1, passo=0.002):
+        self.port = "sim://"
+        self.baudrate = 9600
+        self.timeout = timeout
+        self.is_open = True
+
+        self.roteiro = roteiro
+        self.atraso_inicio = atraso_inicio
+        self.duracao_nivel = duracao_nivel
+        self.taxa_colisoes = taxa_colisoes
+        self.tempo_reacao = tempo_reacao
+        self.taxa_acerto_qte = taxa_acerto_qte
+        self.aleatorio = random.Random(semente)
+        self.passo = passo
+
+        # Buffers da "porta": o que o jogo escreveu (entrada do firmware) e o que o firmware enviou
+        self._entrada = bytearray()
+        self._saida = bytearray()
+        self._condicao = threading.Condition()
+        self._decodificador = DecodificadorBinario()
+        self._comandos_binarios = []
+
+        # Sensores virtuais: intervalos (início, fim) em segundos de time.monotonic() em que cada um está ativo
+        self._sensores = {"inicio": [], "fim": [], "fio": [], "C": [], "B": []}
+
+        # Estado do firmware (mesmos nomes das variáveis do .ino, em snake_case)
+        self.modo_binario = False
+        self.jogo_ativo = False
+        self.nivel_atual = 1
+        self.leds_ativados = True
+        self.qte_ativo = False
+        self.debounce_colisao_ms = 200
+        self.ultimo_tempo_colisao = 0
+        self.servos_congelados = False
+        self.passo_atual_servo = -1
+        self.proximo_movimento_servo = 0
+        self.segurando = True
+        self.angulo_servo1 = self.angulo_servo2 = 90
+        self.angulo_alvo1 = self.angulo_alvo2 = 90
+        self.ultimo_passo_servo = 0
+        self.velocidade_servo = PASSO_SERVO_MS["normal"]
+        self.tempo_primeira_leitura_fim = 0
+        self.fim_detectado = False
+        self.botoes_anteriores = {"C": False, "B": False}
+        self.ultimo_tempo_botao = {"C": 0, "B": 0}
+        self.aguardando_inicio = False
+        self.ocupado_ate = 0  # millis() até o fim de um delay() bloqueante
+
+        # LEDs para inspeção: cor da mesa (r, g, b) e LED aceso na manopla ("C", "B" ou None)
+        self.cor_mesa = (0, 0, 0)
+        self.led_manopla = None
+        self.eventos_enviados = 0
+
+        self._inicio = time.monotonic()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._executar, name="SimuladorSerial", daemon=True)
+        self._thread.start()
+
+    # --- Interface compatível com serial.Serial ---
+
+    @property
+    def in_waiting(self):
+        with self._condicao:
+            return len(self._saida)
+
+    def read(self, size=1):
+        """Lê até `size` bytes, esperando no máximo `timeout` segundos, como o pyserial."""
+        with self._condicao:
+            self._condicao.wait_for(lambda: len(self._saida) >= size or not self.is_open, self.timeout)
+            dados = bytes(self._saida[:size])
+            del self._saida[:size]
+            return dados
+
+    def readline(self):
+        with self._condicao:
+            self._condicao.wait_for(lambda: b"\n" in self._saida or not self.is_open, self.timeout)
+            fim = self._saida.find(b"\n")
+            fim = len(self._saida) if fim < 0 else fim + 1
+            dados = bytes(self._saida[:fim])
+            del self._saida[:fim]
+            return dados
+
+    def write(self, dados):
+        with self._condicao:
+            self._entrada.extend(dados)
+        return len(dados)
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        with self._condicao:
+            self._saida.clear()
+
+    def close(self):
+        self._parar.set()
+        with self._condicao:
+            self.is_open = False
+            self._condicao.notify_all()
+
+    # --- Sensores virtuais ---
+
+    def _agora(self):
+        return time.monotonic()
+
+    def acionar(self, sensor, duracao, atraso=0.0):
+        """Aciona um sensor virtual ("inicio", "fim", "fio", "C" ou "B") daqui a `atraso` segundos."""
+        inicio = self._agora() + atraso
+        with self._condicao:
+            self._sensores[sensor].append((inicio, inicio + duracao))
+
+    def _sensor_ativo(self, sensor, agora):
+        intervalos = self._sensores[sensor]
+        # Descarta acionamentos que já terminaram
+        while intervalos and intervalos[0][1] < agora:
+            intervalos.pop(0)
+        return any(inicio <= agora < fim for inicio, fim in intervalos)
+
+    def _preparar_nivel(self):
+        """Agenda os acionamentos dos sensores para o nível que acabou de começar."""
+        for intervalos in self._sensores.values():
+            intervalos.clear()
+
+        if self.roteiro is not None:
+            acoes = {"inicio": ("inicio", DURACAO_HALL), "fim": ("fim", DURACAO_HALL),
+                     "colisao": ("fio", DURACAO_TOQUE_FIO),
+                     "botao_C": ("C", DURACAO_BOTAO), "botao_B": ("B", DURACAO_BOTAO)}
+            for segundos, acao in self.roteiro:
+                sensor, duracao = acoes[acao]
+                self.acionar(sensor, duracao, segundos)
+        else:
+            self._gerar_nivel_aleatorio()
+        for intervalos in self._sensores.values():
+            intervalos.sort()
+
+    def _gerar_nivel_aleatorio(self):
+        """Sorteia os instantes de início, colisões e fim de um nível."""
+        inicio = self.atraso_inicio
+        fim = inicio + self.aleatorio.uniform(*self.duracao_nivel)
+        self.acionar("inicio", DURACAO_HALL, inicio)
+        self.acionar("fim", DURACAO_HALL, fim)
+        if self.taxa_colisoes > 0:
+            t = inicio + self.aleatorio.expovariate(self.taxa_colisoes)
+            while t < fim:
+                self.acionar("fio", DURACAO_TOQUE_FIO, t)
+                t += self.aleatorio.expovariate(self.taxa_colisoes)
+
+    def _responder_qte(self, cor):
+        """Sem roteiro, o jogador virtual aperta um botão depois do tempo de reação."""
+        if self.roteiro is not None:
+            return
+        if self.aleatorio.random() >= self.taxa_acerto_qte:
+            cor = "B" if cor == "C" else "C"
+        self.acionar(cor, DURACAO_BOTAO, self.tempo_reacao)
+
+    # --- Firmware ---
+
+    def _millis(self):
+        return int((self._agora() - self._inicio) * 1000) & 0xFFFFFFFF
+
+    def _executar(self):
+        while not self._parar.is_set():
+            try:
+                with self._condicao:
+                    self._loop()
+            except Exception as e:
+                print(f"Erro no simulador serial: {e}")
+            time.sleep(self.passo)
+
+    def _loop(self):
+        agora_ms = self._millis()
+        agora = self._agora()
+        if agora_ms < self.ocupado_ate:
+            return  # Dentro de um delay() do firmware
+
+        # iniciarNivel() fica preso até o anel chegar ao sensor de início
+        if self.aguardando_inicio:
+            if not self._sensor_ativo("inicio", agora):
+                return
+            self.aguardando_inicio = False
+            self._enviar_evento("PLAYER_AT_START", agora_ms)
+            self._apagar_leds_manopla()
+            return
+
+        self._processar_entrada()
+        if self.jogo_ativo and agora_ms >= self.ocupado_ate and not self.aguardando_inicio:
+            self._monitorar_sensores(agora, agora_ms)
+            self._atualizar_servos(agora_ms)
+
+    def _processar_entrada(self):
+        if self.modo_binario:
+            self._comandos_binarios.extend(self._decodificador.quadros(self._entrada))
+            self._entrada.clear()
+            # Como no firmware, um comando bloqueante (NIVEL, piscadas) segura os seguintes
+            while self._comandos_binarios and not self._bloqueado():
+                opcode, payload = self._comandos_binarios.pop(0)
+                self._executar_comando_binario(opcode, payload)
+        else:
+            fim = self._entrada.find(b"\n")
+            if fim >= 0:
+                comando = self._entrada[:fim].decode("utf-8", errors="replace").strip()
+                del self._entrada[:fim + 1]
+                self._processar_comando_texto(comando)
+
+    def _bloqueado(self):
+        return self.aguardando_inicio or self._millis() < self.ocupado_ate
+
+    def _processar_comando_texto(self, comando):
+        if comando == "INICIAR":
+            self._enviar_linha("OK")
+        elif comando == "INICIAR:BIN":
+            self._enviar_linha("OK:BIN")
+            self.modo_binario = True
+        elif comando == "PING":
+            self._enviar_evento("OK", self._millis())
+        elif comando.startswith("NIVEL:"):
+            self._iniciar_nivel(int(comando[6:] or 0))
+        elif comando.startswith("QTE_SHOW:"):
+            self._mostrar_qte(comando[9:10])
+        elif comando == "QTE_ACK":
+            if self.leds_ativados:
+                self._apagar_leds_manopla()
+                self._delay(50)
+        elif comando == "QTE_END":
+            self.qte_ativo = False
+            self._apagar_leds_manopla()
+        elif comando == "LEVEL_FAILED":
+            self._piscar_led((255, 0, 0), 3, 200)
+        elif comando == "TERMINAR":
+            self._terminar_nivel()
+        elif comando.startswith("DEBOUNCE:"):
+            self.debounce_colisao_ms = int(comando[9:] or 0)
+        elif comando.startswith("FEEDBACK:"):
+            self.leds_ativados = comando[9:] != "som"
+        elif comando.startswith("FREEZE:"):
+            self.servos_congelados = comando[7:] == "1"
+        elif comando.startswith("SERVO:"):
+            self.velocidade_servo = PASSO_SERVO_MS.get(comando[6:], self.velocidade_servo)
+
+    def _executar_comando_binario(self, opcode, payload):
+        nome = _NOMES_COMANDOS.get(opcode)
+        if nome is None:
+            return
+        if nome == "PING":
+            self._enviar_evento("OK", self._millis())
+        elif nome == "NIVEL" and payload:
+            self._iniciar_nivel(payload[0])
+        elif nome == "QTE_SHOW" and payload:
+            self._mostrar_qte(chr(payload[0]))
+        elif nome == "DEBOUNCE" and len(payload) >= 2:
+            self.debounce_colisao_ms = struct.unpack("<H", payload[:2])[0]
+        elif nome == "FEEDBACK" and payload:
+            self.leds_ativados = payload[0] != CANAIS_FEEDBACK.index("som")
+        elif nome == "FREEZE" and payload:
+            self.servos_congelados = payload[0] == 1
+        elif nome == "SERVO" and payload and payload[0] < len(VELOCIDADES_SERVO):
+            self.velocidade_servo = PASSO_SERVO_MS[VELOCIDADES_SERVO[payload[0]]]
+        elif nome in ("QTE_ACK", "QTE_END", "LEVEL_FAILED", "TERMINAR"):
+            self._processar_comando_texto(nome)
+
+    def _enviar_linha(self, texto):
+        self._saida.extend(f"{texto}\r\n".encode("utf-8"))
+        self._condicao.notify_all()
+
+    def _enviar_evento(self, nome, instante_ms):
+        if self.modo_binario:
+            self._saida.extend(montar_quadro(_OPCODES_EVENTOS[nome], struct.pack("<I", instante_ms)))
+            self._condicao.notify_all()
+        else:
+            self._enviar_linha(f"{nome}@{instante_ms}")
+        self.eventos_enviados += 1
+
+    def _delay(self, ms):
+        self.ocupado_ate = self._millis() + ms
+
+    def _piscar_led(self, cor, vezes, duracao):
+        if not self.leds_ativados:
+            return
+        self.cor_mesa = cor
+        self._delay(vezes * 2 * duracao)
+
+    def _apagar_leds_manopla(self):
+        if self.leds_ativados:
+            self.led_manopla = None
+
+    def _mostrar_qte(self, cor):
+        self.qte_ativo = True
+        if self.leds_ativados:
+            self.led_manopla = cor
+        self._responder_qte(cor)
+
+    def _reset_servos(self):
+        self.angulo_servo1 = self.angulo_servo2 = 90
+
+    def _reset_maquina_servos(self):
+        self.passo_atual_servo = -1
+        self.proximo_movimento_servo = self._millis()
+        self.angulo_alvo1 = self.angulo_alvo2 = 90
+        self.segurando = True
+
+    def _iniciar_nivel(self, nivel):
+        self.nivel_atual = nivel
+        self.jogo_ativo = True
+        self.cor_mesa = (0, 0, 0)
+        self._reset_servos()
+        self._reset_maquina_servos()
+        self.fim_detectado = False
+        self.qte_ativo = False
+        if self.leds_ativados:
+            self.led_manopla = "B"  # LED vermelho aceso enquanto espera o jogador
+        self._preparar_nivel()
+        self.aguardando_inicio = True
+
+    def _terminar_nivel(self):
+        self.jogo_ativo = False
+        self._reset_servos()
+        self.cor_mesa = (0, 0, 0)
+        self._apagar_leds_manopla()
+        self._reset_maquina_servos()
+
+    def _monitorar_sensores(self, agora, agora_ms):
+        if self._sensor_ativo("fio", agora):
+            if agora_ms - self.ultimo_tempo_colisao > self.debounce_colisao_ms:
+                self.ultimo_tempo_colisao = agora_ms
+                self._enviar_evento("COLLISION", agora_ms)
+                self._piscar_led((255, 255, 0), 1, 150)
+
+        if self._sensor_ativo("fim", agora):
+            if not self.fim_detectado:
+                self.fim_detectado = True
+                self.tempo_primeira_leitura_fim = agora_ms
+            elif agora_ms - self.tempo_primeira_leitura_fim > DEBOUNCE_HALL_MS:
+                self._enviar_evento("LEVEL_COMPLETE", self.tempo_primeira_leitura_fim)
+                self._piscar_led((0, 255, 0), 3, 200)
+                self._terminar_nivel()
+        else:
+            self.fim_detectado = False
+
+        if self.qte_ativo:
+            for cor in ("B", "C"):
+                pressionado = self._sensor_ativo(cor, agora)
+                if (pressionado and not self.botoes_anteriores[cor] and
+                        agora_ms - self.ultimo_tempo_botao[cor] > DEBOUNCE_BOTAO_MS):
+                    self.ultimo_tempo_botao[cor] = agora_ms
+                    self._enviar_evento(f"BTN_{cor}", agora_ms)
+                self.botoes_anteriores[cor] = pressionado
+
+    def _atualizar_servos(self, agora_ms):
+        padrao = padroes_servo.get(self.nivel_atual)
+        if self.servos_congelados or not self.jogo_ativo or not padrao:
+            return
+
+        if self.segurando:
+            if agora_ms >= self.proximo_movimento_servo:
+                self.passo_atual_servo = (self.passo_atual_servo + 1) % len(padrao)
+                angulo, _ = padrao[self.passo_atual_servo]
+                self.angulo_alvo1 = angulo
+                self.angulo_alvo2 = 180 - angulo
+                self.segurando = False
+        elif agora_ms >= self.ultimo_passo_servo + self.velocidade_servo:
+            self.ultimo_passo_servo = agora_ms
+            if self.angulo_servo1 == self.angulo_alvo1 and self.angulo_servo2 == self.angulo_alvo2:
+                self.proximo_movimento_servo = agora_ms + padrao[self.passo_atual_servo][1]
+                self.segurando = True
+                return
+            if self.angulo_servo1 != self.angulo_alvo1:
+                self.angulo_servo1 += 1 if self.angulo_servo1 < self.angulo_alvo1 else -1
+            if self.angulo_servo2 != self.angulo_alvo2:
+                self.angulo_servo2 += 1 if self.angulo_servo2 < self.angulo_alvo2 else -1
+
+
+# Simulador compartilhado usado quando o jogo roda sem Arduino
+_simulador = None
+
+
+def obter_simulador():
+    """Retorna o simulador compartilhado, criando-o na primeira chamada."""
+    global _simulador
+    if _simulador is None or not _simulador.is_open:
+        _simulador = SimuladorSerial()
+    return _simulador
@@ -1,20 +1,224 @@
+import atexit
 import json
 import os
-from constants import USUARIOS_JSON
+import sqlite3
+import threading
+import time
+from constants import USUARIOS_JSON, USUARIOS_DB
 
-def carregar_usuarios():
+# Armazenamento dos usuários em SQLite (biblioteca padrão):
+#  - usuarios: uma linha por usuário com o perfil em JSON (tudo menos as tentativas)
+#  - tentativas: uma linha por tentativa, só acrescentada ao final da partida
+# Cada gravação escreve apenas o que mudou desde a última, dentro de uma transação (atômico: um
+# travamento no meio não deixa o arquivo pela metade). Os dados lidos ficam em cache na memória,
+# então carregar_usuarios() não volta ao disco.
+#
+# A gravação é feita em segundo plano: salvar_usuarios() só guarda um instantâneo dos dados e
+# devolve o controle ao jogo. A thread GravadorUsuarios junta os salvamentos feitos em sequência
+# (vale o último) e grava depois de ATRASO_GRAVACAO segundos; descarregar_usuarios() força a gravação
+# e é chamada automaticamente ao sair. Enquanto não são gravadas, as alterações pendentes já aparecem
+# em carregar_usuarios(), então as telas sempre veem o que acabaram de salvar.
+
+ATRASO_GRAVACAO = 1.0
+
+_trava = threading.Lock()         # Protege o cache e o instantâneo pendente
+_trava_banco = threading.Lock()   # Uma gravação por vez no banco
+_conexao = None
+_caminho_conexao = None
+# Estado gravado no banco: usuario -> (perfil serializado, lista de tentativas)
+_cache = None
+# Último instantâneo salvo que ainda não foi gravado (mesmo formato do cache)
+_pendente = None
+_gravador = None
+
+
+def _serializar(dados):
+    return json.dumps(dados, ensure_ascii=False, sort_keys=True)
+
+
+def _instantaneo(data):
+    """Converte os dados dos usuários para o formato do cache, sem depender dos objetos do chamador."""
+    instantaneo = {}
+    for nome, dados in data.items():
+        perfil = _serializar({chave: valor for chave, valor in dados.items() if chave != "tentativas"})
+        instantaneo[nome] = (perfil, list(dados.get("tentativas", [])))
+    return instantaneo
+
+
+def _abrir_banco():
+    """Abre (ou reabre, se o caminho mudou) o banco, criando as tabelas e migrando o usuarios.json antigo."""
+    global _conexao, _caminho_conexao, _cache
+    if _conexao is not None and _caminho_conexao == USUARIOS_DB:
+        return _conexao
+    if _conexao is not None:
+        _conexao.close()
+
+    pasta = os.path.dirname(USUARIOS_DB)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    novo_banco = not os.path.exists(USUARIOS_DB)
+
+    conexao = sqlite3.connect(USUARIOS_DB, check_same_thread=False)
+    conexao.execute("PRAGMA journal_mode=WAL")
+    conexao.execute("PRAGMA synchronous=NORMAL")
+    with conexao:
+        conexao.execute("CREATE TABLE IF NOT EXISTS usuarios (nome TEXT PRIMARY KEY, perfil TEXT NOT NULL)")
+        conexao.execute(
+            "CREATE TABLE IF NOT EXISTS tentativas ("
+            "usuario TEXT NOT NULL, ordem INTEGER NOT NULL, dados TEXT NOT NULL, "
+            "PRIMARY KEY (usuario, ordem))"
+        )
+    _conexao = conexao
+    _caminho_conexao = USUARIOS_DB
+    _cache = None
+
+    if novo_banco:
+        _migrar_json()
+    return conexao
+
+
+def _migrar_json():
+    """Importa o usuarios.json da versão anterior na primeira execução (o arquivo é mantido como backup)."""
     if not os.path.exists(USUARIOS_JSON):
-        return {}
-    with open(USUARIOS_JSON, "r", encoding="utf-8") as f:
-        try:
+        return
+    try:
+        with open(USUARIOS_JSON, "r", encoding="utf-8") as f:
             data = json.load(f)
-        except:
-            data = {}
+    except Exception as e:
+        print(f"Erro ao migrar {USUARIOS_JSON}: {e}")
+        return
+    if isinstance(data, dict):
+        _gravar(_instantaneo(data))
+        print(f"{len(data)} usuário(s) migrado(s) de {USUARIOS_JSON} para {USUARIOS_DB}")
+
+
+def _carregar_cache():
+    global _cache
+    conexao = _abrir_banco()
+    if _cache is not None:
+        return _cache
+    cache = {}
+    for nome, perfil in conexao.execute("SELECT nome, perfil FROM usuarios"):
+        cache[nome] = (perfil, [])
+    for usuario, dados in conexao.execute("SELECT usuario, dados FROM tentativas ORDER BY usuario, ordem"):
+        if usuario in cache:
+            cache[usuario][1].append(json.loads(dados))
+    _cache = cache
+    return cache
+
+
+def _gravar(instantaneo):
+    """Grava as diferenças entre o instantâneo e o cache em uma única transação e atualiza o cache."""
+    global _cache
+    cache = _carregar_cache()
+    conexao = _abrir_banco()
+    with conexao:
+        for nome, (perfil, tentativas) in instantaneo.items():
+            anterior = cache.get(nome)
+
+            if anterior is None or anterior[0] != perfil:
+                conexao.execute("INSERT OR REPLACE INTO usuarios (nome, perfil) VALUES (?, ?)", (nome, perfil))
+
+            # Tentativas só crescem: no caso comum basta inserir as novas do final da lista
+            antigas = anterior[1] if anterior is not None else []
+            if len(tentativas) >= len(antigas) and tentativas[:len(antigas)] == antigas:
+                inicio = len(antigas)
+            else:
+                conexao.execute("DELETE FROM tentativas WHERE usuario = ?", (nome,))
+                inicio = 0
+            if inicio < len(tentativas):
+                conexao.executemany(
+                    "INSERT INTO tentativas (usuario, ordem, dados) VALUES (?, ?, ?)",
+                    ((nome, ordem, _serializar(t)) for ordem, t in enumerate(tentativas[inicio:], inicio))
+                )
+
+        for nome in cache.keys() - instantaneo.keys():
+            conexao.execute("DELETE FROM usuarios WHERE nome = ?", (nome,))
+            conexao.execute("DELETE FROM tentativas WHERE usuario = ?", (nome,))
+
+    _cache = instantaneo
+
+
+class GravadorUsuarios(threading.Thread):
+    """Thread que grava no banco os dados salvos pelo jogo, sem bloquear o loop de renderização."""
+
+    def __init__(self):
+        super().__init__(name="GravadorUsuarios", daemon=True)
+        self._acordar = threading.Event()
+
+    def avisar(self):
+        """Avisa que há um novo instantâneo pendente."""
+        self._acordar.set()
+
+    def run(self):
+        while True:
+            self._acordar.wait()
+            # Espera um pouco para juntar os salvamentos seguidos do fim de nível em uma gravação
+            time.sleep(ATRASO_GRAVACAO)
+            self._acordar.clear()
+            descarregar_usuarios()
+
+
+def descarregar_usuarios():
+    """Grava imediatamente o instantâneo pendente (bloqueia até terminar). Retorna True se não restou nada pendente."""
+    global _pendente
+    with _trava_banco:
+        with _trava:
+            instantaneo = _pendente
+        if instantaneo is None:
+            return True
+        try:
+            _gravar(instantaneo)
+        except sqlite3.Error as e:
+            # Mantém pendente para tentar de novo na próxima gravação
+            print(f"Erro ao salvar usuários: {e}")
+            return False
+        with _trava:
+            if _pendente is instantaneo:
+                _pendente = None
+            return _pendente is None
+
+
+def ha_alteracoes_pendentes():
+    """Indica se há dados salvos que ainda não foram gravados no banco."""
+    with _trava:
+        return _pendente is not None
+
+
+def carregar_usuarios():
+    """Retorna uma cópia dos dados de todos os usuários, incluindo os salvamentos ainda não gravados."""
+    with _trava:
+        estado = _pendente
+    if estado is None:
+        try:
+            with _trava_banco:
+                estado = _carregar_cache()
+        except sqlite3.Error as e:
+            print(f"Erro ao carregar usuários: {e}")
+            return {}
+    data = {}
+    for nome, (perfil, tentativas) in estado.items():
+        dados = json.loads(perfil)
+        # As tentativas já salvas nunca são alteradas, então os registros podem ser compartilhados
+        dados["tentativas"] = list(tentativas)
+        data[nome] = dados
     return data
 
+
 def salvar_usuarios(data):
-    with open(USUARIOS_JSON, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    """Salva os dados dos usuários. A gravação no banco acontece em segundo plano (ver GravadorUsuarios)."""
+    global _pendente, _gravador
+    instantaneo = _instantaneo(data)
+    with _trava:
+        _pendente = instantaneo
+        if _gravador is None or not _gravador.is_alive():
+            _gravador = GravadorUsuarios()
+            _gravador.start()
+        _gravador.avisar()
+
+
+# Ao encerrar o jogo (inclusive via sys.exit), grava o que ainda estiver pendente
+atexit.register(descarregar_usuarios)
 
 def verificar_dialogo_visto(usuario, nome_cena):
     usuarios_data = carregar_usuarios()
@@ -0,0 +1,213 @@
+"""
+Cenários do benchmark: cada um executa uma tela real do jogo com uma fonte de eventos roteirizada.
+Este módulo é importado pelo processo filho de executar.py, depois que o pygame e as constantes
+já foram inicializados na resolução do teste.
+"""
+import random
+import time
+import tracemalloc
+
+import pygame
+
+from utils.sessao import SessaoJogo
+
+
+class FonteEventosRoteirizada:
+    """
+    Substitui pygame.event.get: cada chamada sem argumentos conta como um quadro da tela, devolve os
+    eventos roteirizados para aquele quadro e, no último, um ESC para a tela retornar.
+    Também registra o instante de cada quadro (e, se pedido, a memória alocada via tracemalloc).
+    """
+
+    def __init__(self, quadros, roteiro=None, medir_memoria=False):
+        self.quadros = quadros
+        self.roteiro = roteiro or {}
+        self.medir_memoria = medir_memoria
+        self.quadro = 0
+        self.instantes = []
+        self.alocacoes = []  # bytes alocados (pico transitório) em cada quadro
+        self._memoria_inicio_quadro = 0
+        self._get_original = pygame.event.get
+
+    def __call__(self, *args, **kwargs):
+        if args or kwargs:
+            # Consultas filtradas (por tipo) não contam como quadro
+            return []
+        self._get_original()  # Mantém a fila do SDL vazia
+        self.instantes.append(time.perf_counter())
+        if self.medir_memoria:
+            atual, pico = tracemalloc.get_traced_memory()
+            if self.quadro:
+                self.alocacoes.append(pico - self._memoria_inicio_quadro)
+            tracemalloc.reset_peak()
+            self._memoria_inicio_quadro = atual
+
+        self.quadro += 1
+        if self.quadro >= self.quadros:
+            # Evita que o restante da tela (transições de saída) entre na medição
+            self.medir_memoria = False
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, unicode="", mod=0, scancode=0)]
+        return list(self.roteiro.get(self.quadro, ()))
+
+
+class RelogioSemEspera:
+    """Substitui pygame.time.Clock sem limitar a taxa de quadros, para medir o custo real de cada quadro."""
+
+    def __init__(self):
+        self._ultimo = time.perf_counter()
+        self._intervalo = 0.0
+
+    def tick(self, framerate=0):
+        agora = time.perf_counter()
+        self._intervalo = agora - self._ultimo
+        self._ultimo = agora
+        return int(self._intervalo * 1000)
+
+    def get_time(self):
+        return int(self._intervalo * 1000)
+
+    def get_fps(self):
+        return 1 / self._intervalo if self._intervalo else 0.0
+
+
+class SessaoRoteirizada(SessaoJogo):
+    """
+    Sessão do jogo para o benchmark, com relógio virtual: cada quadro avança exatamente 1/FPS, sem depender
+    de quanto o quadro demorou. Os dados do Arduino vêm de um roteiro por número de quadro (como numa
+    reprodução), então toda execução joga os mesmos quadros nos mesmos estados.
+    """
+
+    reproduzindo = True  # O jogo lê a serial de linhas_serial() e termina ao fim da tentativa
+
+    def __init__(self, roteiro, fps, semente=0):
+        super().__init__()
+        self.roteiro = roteiro  # {quadro: [dados, ...]}
+        self.fps = fps
+        self.semente_fixa = semente
+        self.instante = 0.0
+        self.quadro = -1
+        self.estado_inicial = None
+
+    def iniciar(self, cabecalho, obter_estado):
+        self._semear(self.semente_fixa)
+        self.estado_inicial = obter_estado()  # O jogo "restaura" o próprio estado, o que não muda nada
+
+    def iniciar_quadro(self, eventos):
+        self.quadro += 1
+        self.instante = self.quadro / self.fps
+        return eventos
+
+    def linhas_serial(self):
+        return [(dados, self.instante, None) for dados in self.roteiro.get(self.quadro, ())]
+
+    def finalizar_quadro(self, obter_estado):
+        pass
+
+    def encerrar(self, obter_estado):
+        pass
+
+
+def movimentos_mouse(quadros, pontos):
+    """Roteiro que passa o mouse por uma lista de pontos (para exercitar os efeitos de hover)."""
+    roteiro = {}
+    for quadro in range(1, quadros):
+        x, y = pontos[quadro % len(pontos)]
+        roteiro[quadro] = [pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))]
+    return roteiro
+
+
+def _pontos_menu():
+    from constants import LARGURA_TELA, ALTURA_TELA
+    return [(LARGURA_TELA // 2, int(ALTURA_TELA * f)) for f in (0.3, 0.4, 0.5, 0.6, 0.7, 0.8)] + [(10, 10)]
+
+
+def cenario_menu(tela, usuario):
+    from screens.main_menu import tela_menu_principal
+    return lambda: tela_menu_principal(tela, usuario), _pontos_menu()
+
+
+def cenario_desempenho(tela, usuario):
+    from screens.performance import tela_desempenho
+    return lambda: tela_desempenho(tela, usuario), _pontos_menu()
+
+
+def cenario_conquistas(tela, usuario):
+    from screens.achievements_screen import tela_conquistas
+    return lambda: tela_conquistas(tela, usuario), _pontos_menu()
+
+
+def cenario_acessibilidade(tela, usuario):
+    from screens.options_accessibility import tela_opcoes_acessibilidade
+    return lambda: tela_opcoes_acessibilidade(tela, usuario), _pontos_menu()
+
+
+def cenario_jogo(tela, usuario):
+    from game.game import JogoLabirinto
+    from utils.achievements import SistemaConquistas
+    from utils.simulador_serial import SimuladorSerial
+
+    from constants import FPS
+
+    # Jogador chega ao início logo e encosta no fio duas vezes; o nível não termina durante a medição.
+    # O roteiro é por quadro (0,2 s, 1,0 s e 2,5 s a 60 FPS), não por tempo real: sem o limite de quadros
+    # do benchmark, um roteiro em segundos cairia em quadros diferentes a cada execução
+    roteiro = {int(0.2 * FPS): ["PLAYER_AT_START"], int(1.0 * FPS): ["COLLISION"], int(2.5 * FPS): ["COLLISION"]}
+    sessao = SessaoRoteirizada(roteiro, FPS)
+    # O simulador sem roteiro só recebe os comandos que o jogo envia
+    jogo = JogoLabirinto(tela, usuario, sistema_conquistas=SistemaConquistas(), conexao_serial=SimuladorSerial(roteiro=[]),
+                         sessao=sessao)
+    return lambda: jogo.loop_principal(pular_dialogo=True), None
+
+
+CENARIOS = {
+    "menu": cenario_menu,
+    "desempenho": cenario_desempenho,
+    "conquistas": cenario_conquistas,
+    "acessibilidade": cenario_acessibilidade,
+    "jogo": cenario_jogo,
+}
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    if not ordenados:
+        return None
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+
+def executar_cenario(nome, tela, usuario, quadros, aquecimento):
+    """Executa o cenário duas vezes (tempo e memória) e retorna as métricas em um dicionário."""
+    resultado = {}
+    for medir_memoria in (False, True):
+        random.seed(0)
+        inicio = time.perf_counter()
+        funcao, pontos = CENARIOS[nome](tela, usuario)
+        roteiro = movimentos_mouse(quadros, pontos) if pontos else None
+        fonte = FonteEventosRoteirizada(quadros, roteiro, medir_memoria=medir_memoria)
+        pygame.event.get = fonte
+        if medir_memoria:
+            tracemalloc.start()
+        try:
+            funcao()
+        except SystemExit:
+            pass
+        finally:
+            pygame.event.get = fonte._get_original
+            if medir_memoria:
+                tracemalloc.stop()
+
+        if medir_memoria:
+            alocacoes = fonte.alocacoes[aquecimento:]
+            resultado["alocacao_kb_por_quadro"] = sum(alocacoes) / len(alocacoes) / 1024 if alocacoes else None
+            resultado["alocacao_kb_p95"] = (_percentil(alocacoes, 95) or 0) / 1024
+        else:
+            instantes = fonte.instantes
+            duracoes = [(b - a) * 1000 for a, b in zip(instantes, instantes[1:])][aquecimento:]
+            resultado["quadros_medidos"] = len(duracoes)
+            resultado["primeiro_quadro_ms"] = (instantes[0] - inicio) * 1000 if instantes else None
+            resultado["ms_por_quadro"] = sum(duracoes) / len(duracoes) if duracoes else None
+            resultado["p50_ms"] = _percentil(duracoes, 50)
+            resultado["p95_ms"] = _percentil(duracoes, 95)
+            resultado["max_ms"] = max(duracoes) if duracoes else None
+    return resultado
@@ -0,0 +1,230 @@
+"""
+Benchmark sem interface das telas e do loop do jogo.
+
+Cada resolução roda em um processo separado (as constantes leem o tamanho do monitor ao serem
+importadas) com os drivers de vídeo e áudio "dummy" do SDL, uma fonte de eventos roteirizada e o
+simulador da porta serial. Para cada cenário são medidos ms/quadro (média, p50, p95, máximo),
+alocações por quadro (tracemalloc) e o tempo até o primeiro quadro; o tempo de importação dos
+módulos do jogo é medido uma vez por resolução. O resultado sai em JSON e pode ser comparado com
+um baseline salvo.
+
+Uso (a partir da raiz do repositório):
+    python benchmarks/executar.py --quadros 300 --resolucoes 1280x720,1920x1080 --saida resultado.json
+    python benchmarks/executar.py --gravar-baseline benchmarks/baseline.json
+    python benchmarks/executar.py --baseline benchmarks/baseline.json --tolerancia 10
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_JOGO = os.path.join(RAIZ, "Labirinto_game")
+
+# Métricas comparadas com o baseline (todas: quanto menor, melhor)
+METRICAS_COMPARADAS = ("ms_por_quadro", "p95_ms", "alocacao_kb_por_quadro", "primeiro_quadro_ms")
+
+
+def _preparar_usuario(usuarios_db, tentativas):
+    """Cria um usuário de teste com histórico, para as telas de desempenho e conquistas terem o que mostrar."""
+    import random
+    from utils import user_data
+
+    user_data.USUARIOS_DB = usuarios_db
+    user_data.USUARIOS_JSON = os.path.join(os.path.dirname(usuarios_db), "usuarios.json")
+    gerador = random.Random(0)
+    historico = []
+    for i in range(tentativas):
+        nivel = gerador.randint(1, 8)
+        vidas = gerador.choice((0, 1, 2, 3))
+        historico.append({
+            "nivel": nivel,
+            "tempo": round(gerador.uniform(8, 90), 2),
+            "vidas": vidas,
+            "colisoes": 3 - vidas,
+            "timestamp": f"01-01-2025 00:{i // 60 % 60:02d}:{i % 60:02d}",
+        })
+    user_data.salvar_usuarios({
+        "benchmark": {
+            "nivel": 8,
+            "tentativas": historico,
+            "conquistas": {"fio_de_ariadne": True, "coragem_de_teseu": True},
+            "acessibilidade": {},
+        }
+    })
+    user_data.descarregar_usuarios()
+    return "benchmark"
+
+
+def executar_resolucao(largura, altura, cenarios, quadros, aquecimento, tentativas):
+    """Processo filho: mede todos os cenários em uma resolução e retorna o resultado."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.chdir(RAIZ)
+    sys.path.insert(0, PASTA_JOGO)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    inicio = time.perf_counter()
+    import pygame
+    pygame.init()
+
+    # constants.py calcula o tamanho da janela a partir do monitor: simula um monitor do tamanho pedido
+    info_original = pygame.display.Info
+
+    class _InfoMonitor:
+        current_w = largura
+        current_h = altura
+
+    pygame.display.Info = lambda: _InfoMonitor
+    try:
+        import constants
+    finally:
+        pygame.display.Info = info_original
+
+    pasta_temporaria = tempfile.mkdtemp(prefix="benchmark_labirinto_")
+    constants.USUARIOS_JSON = os.path.join(pasta_temporaria, "usuarios.json")
+    constants.USUARIOS_DB = os.path.join(pasta_temporaria, "usuarios.db")
+    constants.PERFILADOR_ATIVO = False
+    # Cache de imagens redimensionadas vazio a cada execução: mede a partida a frio, sem mexer na pasta do jogo
+    from utils.asset_cache import asset_cache
+    asset_cache.configurar_disco(os.path.join(pasta_temporaria, "cache_imagens"))
+    tela = pygame.display.set_mode((constants.LARGURA_TELA, constants.ALTURA_TELA))
+
+    import game.game  # noqa: F401  (importa o jogo e, com ele, os utilitários e assets carregados na importação)
+    import screens.main_menu  # noqa: F401
+    import screens.performance  # noqa: F401
+    import screens.achievements_screen  # noqa: F401
+    import screens.options_accessibility  # noqa: F401
+    importacao_ms = (time.perf_counter() - inicio) * 1000
+
+    import cenarios as modulo_cenarios
+
+    # Sem limite de FPS: o benchmark mede o custo do quadro, não a espera do clock
+    pygame.time.Clock = modulo_cenarios.RelogioSemEspera
+    from utils.cenas import gerenciador_cenas
+    gerenciador_cenas.relogio = modulo_cenarios.RelogioSemEspera()
+    usuario = _preparar_usuario(constants.USUARIOS_DB, tentativas)
+
+    resultado = {
+        "resolucao": f"{largura}x{altura}",
+        "tela": [constants.LARGURA_TELA, constants.ALTURA_TELA],
+        "importacao_ms": importacao_ms,
+        "cenarios": {},
+    }
+    for nome in cenarios:
+        try:
+            resultado["cenarios"][nome] = modulo_cenarios.executar_cenario(nome, tela, usuario, quadros, aquecimento)
+        except Exception as e:
+            resultado["cenarios"][nome] = {"erro": f"{type(e).__name__}: {e}"}
+        print(f"  {resultado['resolucao']} {nome}: concluído", file=sys.stderr)
+    return resultado
+
+
+def comparar(atual, baseline, tolerancia):
+    """Compara o resultado com o baseline. Retorna as linhas do relatório e se houve regressão acima da tolerância."""
+    linhas = []
+    regressao = False
+    for resolucao, dados in atual["resolucoes"].items():
+        base_resolucao = baseline.get("resolucoes", {}).get(resolucao)
+        if base_resolucao is None:
+            linhas.append(f"{resolucao}: sem baseline")
+            continue
+        referencia = base_resolucao.get("importacao_ms")
+        if referencia and dados.get("importacao_ms") is not None:
+            variacao = (dados["importacao_ms"] - referencia) / referencia * 100
+            linhas.append(f"{resolucao} importação: {referencia:.1f} -> {dados['importacao_ms']:.1f} ms ({variacao:+.1f}%)")
+        for nome, metricas in dados["cenarios"].items():
+            base = base_resolucao["cenarios"].get(nome)
+            if not base or "erro" in metricas or "erro" in base:
+                linhas.append(f"{resolucao} {nome}: sem comparação")
+                continue
+            partes = []
+            for metrica in METRICAS_COMPARADAS:
+                valor, referencia = metricas.get(metrica), base.get(metrica)
+                if valor is None or not referencia:
+                    continue
+                variacao = (valor - referencia) / referencia * 100
+                marcador = ""
+                if variacao > tolerancia:
+                    marcador = " !"
+                    regressao = True
+                partes.append(f"{metrica} {referencia:.2f} -> {valor:.2f} ({variacao:+.1f}%){marcador}")
+            linhas.append(f"{resolucao} {nome}: " + "; ".join(partes))
+    return linhas, regressao
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sem interface das telas e do loop do jogo")
+    parser.add_argument("--quadros", type=int, default=300, help="Quadros medidos por cenário")
+    parser.add_argument("--aquecimento", type=int, default=10, help="Quadros iniciais descartados")
+    parser.add_argument("--resolucoes", default="1280x720,1920x1080", help="Lista separada por vírgulas (LxA)")
+    parser.add_argument("--cenarios", default="menu,desempenho,conquistas,acessibilidade,jogo")
+    parser.add_argument("--tentativas", type=int, default=500, help="Tentativas no histórico do usuário de teste")
+    parser.add_argument("--saida", help="Arquivo JSON para o resultado (padrão: saída padrão)")
+    parser.add_argument("--baseline", help="Baseline JSON para comparação")
+    parser.add_argument("--tolerancia", type=float, default=10.0, help="Piora máxima aceita em %% (com --baseline)")
+    parser.add_argument("--gravar-baseline", help="Grava o resultado como baseline neste arquivo")
+    parser.add_argument("--filho", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    cenarios = [nome.strip() for nome in args.cenarios.split(",") if nome.strip()]
+
+    if args.filho:
+        largura, altura = (int(v) for v in args.filho.split("x"))
+        resultado = executar_resolucao(largura, altura, cenarios, args.quadros, args.aquecimento, args.tentativas)
+        print(json.dumps(resultado))
+        sys.stdout.flush()
+        # Encerra sem passar pelo atexit do jogo (gravação de usuários e relatórios em pastas temporárias)
+        os._exit(0)
+
+    resultado = {
+        "data": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+        "maquina": {
+            "plataforma": platform.platform(),
+            "processador": platform.processor() or platform.machine(),
+            "python": platform.python_version(),
+        },
+        "parametros": {"quadros": args.quadros, "aquecimento": args.aquecimento, "tentativas": args.tentativas},
+        "resolucoes": {},
+    }
+    for resolucao in args.resolucoes.split(","):
+        resolucao = resolucao.strip()
+        comando = [sys.executable, os.path.abspath(__file__), "--filho", resolucao,
+                   "--quadros", str(args.quadros), "--aquecimento", str(args.aquecimento),
+                   "--cenarios", ",".join(cenarios), "--tentativas", str(args.tentativas)]
+        processo = subprocess.run(comando, cwd=RAIZ, stdout=subprocess.PIPE, text=True)
+        linhas = processo.stdout.strip().splitlines()
+        try:
+            resultado["resolucoes"][resolucao] = json.loads(linhas[-1])
+        except (IndexError, ValueError):
+            print(f"Erro ao executar o benchmark em {resolucao} (código {processo.returncode})", file=sys.stderr)
+            resultado["resolucoes"][resolucao] = {"erro": processo.returncode, "cenarios": {}}
+
+    texto = json.dumps(resultado, indent=4, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    else:
+        print(texto)
+    if args.gravar_baseline:
+        with open(args.gravar_baseline, "w", encoding="utf-8") as f:
+            f.write(texto)
+        print(f"Baseline gravado em {args.gravar_baseline}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        linhas, regressao = comparar(resultado, baseline, args.tolerancia)
+        for linha in linhas:
+            print(linha, file=sys.stderr)
+        if regressao:
+            print(f"Regressão acima de {args.tolerancia:.0f}% em relação ao baseline", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -41,6 +41,117 @@ const uint8_t numStepsPerLevel[] PROGMEM = {
     sizeof(level7_pattern) / sizeof(ServoStep), sizeof(level8_pattern) / sizeof(ServoStep)
 };
 
+// --- PROTOCOLO SERIAL ---
+// Modo texto (original): linhas ASCII a 9600 baud.
+// Modo binário (negociado com "INICIAR:BIN"): quadros [SINCRONISMO][opcode][tamanho][payload][crc8] a 115200 baud.
+const long BAUD_TEXTO = 9600;
+const long BAUD_BINARIO = 115200;
+const uint8_t SINCRONISMO = 0xA5;
+const uint8_t MAX_PAYLOAD = 8;
+
+// Opcodes jogo -> Arduino
+const uint8_t OP_PING = 0x01;
+const uint8_t OP_NIVEL = 0x10;
+const uint8_t OP_QTE_SHOW = 0x11;
+const uint8_t OP_QTE_ACK = 0x12;
+const uint8_t OP_QTE_END = 0x13;
+const uint8_t OP_LEVEL_FAILED = 0x14;
+const uint8_t OP_TERMINAR = 0x15;
+const uint8_t OP_DEBOUNCE = 0x16;
+const uint8_t OP_FEEDBACK = 0x17;
+const uint8_t OP_FREEZE = 0x18;
+const uint8_t OP_SERVO = 0x19;
+
+// Opcodes Arduino -> jogo
+const uint8_t EVT_OK = 0x80;
+const uint8_t EVT_PLAYER_AT_START = 0x81;
+const uint8_t EVT_COLLISION = 0x82;
+const uint8_t EVT_LEVEL_COMPLETE = 0x83;
+const uint8_t EVT_BTN_C = 0x84;
+const uint8_t EVT_BTN_B = 0x85;
+
+// Índices enviados nos payloads de SERVO e FEEDBACK
+const uint8_t SERVO_LENTO = 0, SERVO_NORMAL = 1, SERVO_RAPIDO = 2;
+const uint8_t FEEDBACK_SOM = 0;
+
+bool modoBinario = false;
+
+// CRC-8 (polinômio 0x07), o mesmo calculado pelo jogo
+uint8_t crc8(uint8_t crc, uint8_t dado) {
+    crc ^= dado;
+    for (uint8_t i = 0; i < 8; i++) {
+        crc = (crc & 0x80) ? (uint8_t)((crc << 1) ^ 0x07) : (uint8_t)(crc << 1);
+    }
+    return crc;
+}
+
+// Máquina de estados que monta os quadros byte a byte, sem alocar memória
+class DecodificadorBinario {
+public:
+    uint8_t opcode = 0;
+    uint8_t tamanho = 0;
+    uint8_t payload[MAX_PAYLOAD];
+
+    // Retorna true quando um quadro completo e com CRC válido foi recebido
+    bool alimentar(uint8_t byte) {
+        switch (etapa) {
+            case SINC:
+                if (byte == SINCRONISMO) etapa = OPCODE;
+                return false;
+            case OPCODE:
+                opcode = byte;
+                crc = crc8(0, byte);
+                etapa = TAMANHO;
+                return false;
+            case TAMANHO:
+                if (byte > MAX_PAYLOAD) {
+                    etapa = SINC;
+                    return false;
+                }
+                tamanho = byte;
+                lidos = 0;
+                crc = crc8(crc, byte);
+                etapa = (tamanho > 0) ? PAYLOAD : CRC;
+                return false;
+            case PAYLOAD:
+                payload[lidos++] = byte;
+                crc = crc8(crc, byte);
+                if (lidos >= tamanho) etapa = CRC;
+                return false;
+            case CRC:
+            default:
+                etapa = SINC;
+                return byte == crc;
+        }
+    }
+
+private:
+    enum Etapa { SINC, OPCODE, TAMANHO, PAYLOAD, CRC };
+    Etapa etapa = SINC;
+    uint8_t lidos = 0;
+    uint8_t crc = 0;
+};
+
+DecodificadorBinario decodificador;
+
+// Envia um evento para o jogo no protocolo ativo (o texto fica na Flash), com o millis() do
+// instante em que ele aconteceu: 4 bytes little-endian no modo binário, "EVENTO@millis" no modo texto
+void enviarEvento(uint8_t opcode, const __FlashStringHelper* texto, unsigned long instante) {
+    if (modoBinario) {
+        uint8_t quadro[8] = { SINCRONISMO, opcode, 4,
+                              (uint8_t)instante, (uint8_t)(instante >> 8),
+                              (uint8_t)(instante >> 16), (uint8_t)(instante >> 24), 0 };
+        uint8_t crc = 0;
+        for (uint8_t i = 1; i < 7; i++) crc = crc8(crc, quadro[i]);
+        quadro[7] = crc;
+        Serial.write(quadro, sizeof(quadro));
+    } else {
+        Serial.print(texto);
+        Serial.print('@');
+        Serial.println(instante);
+    }
+}
+
 // --- MÁQUINA DE ESTADOS PARA OS SERVOS ---
 enum ServoState { MOVING, HOLDING };
 ServoState estadoAtualServo = HOLDING;
@@ -69,7 +180,7 @@ unsigned long ultimoTempoBtnL = 0, ultimoTempoBtnR = 0;
 
 // --- SETUP ---
 void setup() {
-    Serial.begin(9600);
+    Serial.begin(BAUD_TEXTO);
     pinMode(fioLabirinto, INPUT_PULLUP);
     pinMode(pinoHallInicio, INPUT_PULLUP);
     pinMode(pinoHallFim, INPUT_PULLUP);
@@ -89,7 +200,13 @@ void setup() {
 
 // --- LOOP ---
 void loop() {
-    if (Serial.available() > 0) {
+    if (modoBinario) {
+        while (Serial.available() > 0) {
+            if (decodificador.alimentar(Serial.read())) {
+                executarComandoBinario(decodificador.opcode, decodificador.payload, decodificador.tamanho);
+            }
+        }
+    } else if (Serial.available() > 0) {
         processarComandoSerial();
     }
     if (jogoAtivo) {
@@ -118,13 +235,78 @@ void piscarAckQte() {
     //apagarLedsManopla();
 }
 
+void definirVelocidadeServo(uint8_t indice) {
+    if (indice == SERVO_LENTO) velocidadeServo = 30;
+    else if (indice == SERVO_NORMAL) velocidadeServo = 15;
+    else if (indice == SERVO_RAPIDO) velocidadeServo = 5;
+}
+
 // --- PROCESSAMENTO DE COMANDOS ---
+void ativarModoBinario() {
+    Serial.println("OK:BIN");
+    Serial.flush(); // Garante que a resposta saiu no baud antigo
+    Serial.end();
+    Serial.begin(BAUD_BINARIO);
+    modoBinario = true;
+}
+
+void executarComandoBinario(uint8_t opcode, const uint8_t* payload, uint8_t tamanho) {
+    switch (opcode) {
+        case OP_PING:
+            enviarEvento(EVT_OK, F("OK"), millis());
+            break;
+        case OP_NIVEL:
+            if (tamanho < 1) return;
+            nivelAtual = payload[0];
+            iniciarNivel(nivelAtual);
+            break;
+        case OP_QTE_SHOW:
+            if (tamanho < 1) return;
+            qteAtivo = true; // Ativa a escuta dos botões
+            setQteLed((char)payload[0]);
+            break;
+        case OP_QTE_ACK:
+            piscarAckQte();
+            break;
+        case OP_QTE_END:
+            qteAtivo = false; // Desativa a escuta dos botões
+            apagarLedsManopla();
+            break;
+        case OP_LEVEL_FAILED:
+            piscarLed(255, 0, 0, 3, 200);
+            break;
+        case OP_TERMINAR:
+            terminarNivel();
+            break;
+        case OP_DEBOUNCE:
+            if (tamanho < 2) return;
+            debounceColisaoMs = payload[0] | ((unsigned int)payload[1] << 8);
+            break;
+        case OP_FEEDBACK:
+            if (tamanho < 1) return;
+            ledsAtivados = (payload[0] != FEEDBACK_SOM);
+            break;
+        case OP_FREEZE:
+            if (tamanho < 1) return;
+            servosCongelados = (payload[0] == 1);
+            break;
+        case OP_SERVO:
+            if (tamanho < 1) return;
+            definirVelocidadeServo(payload[0]);
+            break;
+    }
+}
+
 void processarComandoSerial() {
     String comando = Serial.readStringUntil('\n');
     comando.trim();
 
     if (comando == "INICIAR") {
         Serial.println("OK");
+    } else if (comando == "INICIAR:BIN") {
+        ativarModoBinario();
+    } else if (comando == "PING") {
+        enviarEvento(EVT_OK, F("OK"), millis()); // Amostra de relógio para o jogo
     } else if (comando.startsWith("NIVEL:")) {
         nivelAtual = comando.substring(6).toInt();
         iniciarNivel(nivelAtual);
@@ -148,9 +330,9 @@ void processarComandoSerial() {
         servosCongelados = (comando.substring(7).toInt() == 1);
     } else if (comando.startsWith("SERVO:")) {
         String velocidade = comando.substring(6);
-        if (velocidade == "lento") velocidadeServo = 30;
-        else if (velocidade == "normal") velocidadeServo = 15;
-        else if (velocidade == "rapido") velocidadeServo = 5;
+        if (velocidade == "lento") definirVelocidadeServo(SERVO_LENTO);
+        else if (velocidade == "normal") definirVelocidadeServo(SERVO_NORMAL);
+        else if (velocidade == "rapido") definirVelocidadeServo(SERVO_RAPIDO);
     }
 }
 
@@ -180,7 +362,7 @@ void iniciarNivel(int nivel) {
         delay(10); // Aguarda o jogador posicionar o anel
     }
     
-    Serial.println("PLAYER_AT_START");
+    enviarEvento(EVT_PLAYER_AT_START, F("PLAYER_AT_START"), millis());
     apagarLedsManopla(); // Apaga o LED vermelho
 }
 
@@ -246,7 +428,7 @@ void monitorarSensoresJogo() {
     if (digitalRead(fioLabirinto) == LOW) {
         if (millis() - ultimoTempoColisao > debounceColisaoMs) {
             ultimoTempoColisao = millis();
-            Serial.println("COLLISION");
+            enviarEvento(EVT_COLLISION, F("COLLISION"), ultimoTempoColisao);
             piscarLed(255, 255, 0, 1, 150);
         }
     }
@@ -256,7 +438,8 @@ void monitorarSensoresJogo() {
             tempoPrimeiraLeituraFim = millis();
         } else {
             if (millis() - tempoPrimeiraLeituraFim > debounceHallMs) {
-                Serial.println("LEVEL_COMPLETE");
+                // O fim conta a partir da primeira leitura do sensor, não do fim do debounce
+                enviarEvento(EVT_LEVEL_COMPLETE, F("LEVEL_COMPLETE"), tempoPrimeiraLeituraFim);
                 piscarLed(0, 255, 0, 3, 200);
                 terminarNivel();
             }
@@ -268,14 +451,14 @@ void monitorarSensoresJogo() {
     if (qteAtivo) {
         bool estadoBtnL = digitalRead(BTN_L);
         if (estadoBtnL == LOW && estadoBtnL_anterior == HIGH && millis() - ultimoTempoBtnL > debounceBotaoMs) {
-            Serial.println("BTN_B");
             ultimoTempoBtnL = millis();
+            enviarEvento(EVT_BTN_B, F("BTN_B"), ultimoTempoBtnL);
         }
         estadoBtnL_anterior = estadoBtnL;
         bool estadoBtnR = digitalRead(BTN_R);
         if (estadoBtnR == LOW && estadoBtnR_anterior == HIGH && millis() - ultimoTempoBtnR > debounceBotaoMs) {
-            Serial.println("BTN_C");
             ultimoTempoBtnR = millis();
+            enviarEvento(EVT_BTN_C, F("BTN_C"), ultimoTempoBtnR);
         }
         estadoBtnR_anterior = estadoBtnR;
     }